@@ -0,0 +1,271 @@
+"""
+bench_list_view.py
+18 October 2026 01:42:15
+
+Benchmarks for list_view.py.
+
+Compares the native in-place ListView algorithms (sort, reverse,
+rotate) against the equivalent ListView.apply calls, reporting the
+wall time and the peak memory allocated during each operation.
+
+With --suite, instead times indexing, slicing, iteration, apply,
+map/filter and deepcopy through a ListView against the same operation
+on a plain list slice, for sizes from 10 up to --max-size and steps of
++-1, +-2 and +-7. Results can be saved as a JSON baseline; later runs
+against the baseline exit with status 1 if any operation regressed.
+Regressions are judged on the ListView/list time ratio, which is far
+more stable across machines and runs than raw times.
+
+Usage:
+    python bench_list_view.py [--size N] [--step S] [--rotate K]
+    python bench_list_view.py --suite [--max-size N] [--baseline FILE [--update]] [--tolerance T]
+"""
+
+import argparse
+import collections
+import copy
+import json
+import os
+import random
+import sys
+import time
+import timeit
+import tracemalloc
+from typing import Callable
+
+from list_view import ListView
+
+SUITE_STEPS = (1, -1, 2, -2, 7, -7)
+INDEX_SAMPLES = 1000  # view indices read by the "index" case
+MIN_RUN_TIME = 0.02  # seconds each timing run of a suite case lasts at least
+
+
+def _rotate_list(items: list, k: int) -> None:
+    """Rotate a list k steps to the right through slicing."""
+    if items:
+        k %= len(items)
+        items[:] = items[-k:] + items[:-k]
+
+
+def measure(setup: Callable[[], ListView], operation: Callable[[ListView], None]) -> tuple[float, int]:
+    """Time an operation on a fresh view and measure its peak allocation.
+
+    The operation is run twice on separate fresh views, once timed and
+    once traced, so tracing overhead does not distort the timing.
+
+    Args:
+        setup (Callable[[], ListView]): Function returning a fresh view to operate on.
+        operation (Callable[[ListView], None]): The operation to measure.
+
+    Returns:
+        tuple[float, int]: Elapsed seconds and peak bytes allocated.
+    """
+    view = setup()
+    t0 = time.perf_counter()
+    operation(view)
+    elapsed = time.perf_counter() - t0
+    del view
+
+    view = setup()
+    tracemalloc.start()
+    operation(view)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def _calibrate(timer: timeit.Timer) -> int:
+    """Return how many loops of a timer take at least MIN_RUN_TIME seconds."""
+    number = 1
+    while timer.timeit(number) < MIN_RUN_TIME:
+        number *= 10
+    return number
+
+
+def best_times(via_view: Callable[[], object], via_list: Callable[[], object], repeat: int) -> tuple[float, float]:
+    """Return the best per-call times of a view operation and its list equivalent.
+
+    Each timing run loops an operation enough times to take at least
+    MIN_RUN_TIME seconds, so tiny operations on small views are still
+    measurable. The runs of both operations alternate, so a burst of
+    machine load affects both sides of the ratio alike.
+
+    Args:
+        via_view (Callable[[], object]): The operation through a ListView.
+        via_list (Callable[[], object]): The same operation on a plain list.
+        repeat (int): Number of timing runs of each operation.
+
+    Returns:
+        tuple[float, float]: Seconds per call in the fastest run of each operation.
+    """
+    timers = (timeit.Timer(via_view), timeit.Timer(via_list))
+    numbers = tuple(map(_calibrate, timers))
+    best = [float("inf"), float("inf")]
+    for _ in range(repeat):
+        for i, (timer, number) in enumerate(zip(timers, numbers)):
+            best[i] = min(best[i], timer.timeit(number) / number)
+    return best[0], best[1]
+
+
+def suite_cases(src: list, step: int) -> list[tuple[str, Callable, Callable]]:
+    """Return (name, view operation, list operation) triples for one source and step.
+
+    The list operation does the same work on the plain list slice that
+    the view describes, including taking that slice.
+
+    Args:
+        src (list): The source list.
+        step (int): Stride of the benchmarked view.
+
+    Returns:
+        list[tuple[str, Callable, Callable]]: The benchmark cases.
+    """
+    view = ListView(src).subview(slice(None, None, step))
+    s = view.slice
+    n = len(view)
+    rng = random.Random(0)
+    indices = [rng.randrange(n) for _ in range(INDEX_SAMPLES)]
+    half = slice(n // 4, 3 * n // 4)
+
+    def index_view() -> list:
+        return list(map(view.__getitem__, indices))
+
+    def index_list() -> list:
+        return list(map(src[s].__getitem__, indices))
+
+    def apply_list() -> None:
+        items = src[s]
+        items.reverse()
+        src[s] = items
+
+    return [
+        ("index", index_view, index_list),
+        ("slice", lambda: view[half], lambda: src[s][half]),
+        ("iterate", lambda: collections.deque(view, maxlen=0),
+         lambda: collections.deque(src[s], maxlen=0)),
+        ("apply", lambda: view.apply(list.reverse), apply_list),
+        ("map", lambda: view.map(abs).to_list(), lambda: list(map(abs, src[s]))),
+        ("filter", lambda: view.filter(bool).to_list(), lambda: list(filter(bool, src[s]))),
+        ("deepcopy", view.deepcopy, lambda: copy.deepcopy(src[s])),
+    ]
+
+
+def run_suite(max_size: int, repeat: int) -> dict:
+    """Time every suite case for sizes 10, 100, ... up to max_size.
+
+    Returns:
+        dict: Maps "case/size/step" to {"view": seconds, "list": seconds, "ratio": view/list}.
+    """
+    results = {}
+    size = 10
+    while size <= max_size:
+        src = list(range(size))
+        for step in SUITE_STEPS:
+            for name, via_view, via_list in suite_cases(src, step):
+                view_time, list_time = best_times(via_view, via_list, repeat)
+                key = f"{name}/{size}/{step}"
+                results[key] = {"view": view_time, "list": list_time,
+                                "ratio": view_time / list_time}
+                print(f"{key:<24}{view_time:>14.3e}{list_time:>14.3e}{view_time / list_time:>9.2f}",
+                      flush=True)
+        size *= 10
+    return results
+
+
+def find_regressions(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Compare suite results with a baseline.
+
+    Args:
+        results (dict): Output of `run_suite`.
+        baseline (dict): Earlier output of `run_suite`.
+        tolerance (float): Allowed factor by which a ListView/list ratio may grow.
+
+    Returns:
+        list[str]: Description of every case whose ratio grew by more than `tolerance`.
+    """
+    regressions = []
+    for key, result in results.items():
+        before = baseline.get(key)
+        if before is not None and result["ratio"] > before["ratio"] * tolerance:
+            regressions.append(
+                f"{key}: ratio {before['ratio']:.2f} -> {result['ratio']:.2f}")
+    return regressions
+
+
+def suite(args: argparse.Namespace) -> int:
+    """Run the benchmark suite and check or update the baseline.
+
+    Returns:
+        int: Exit status, 1 if any case regressed against the baseline.
+    """
+    print(f"{'case/size/step':<24}{'view (s)':>14}{'list (s)':>14}{'ratio':>9}")
+    results = run_suite(args.max_size, args.repeat)
+    if args.baseline is None:
+        return 0
+    if args.update or not os.path.exists(args.baseline):
+        with open(args.baseline, "w") as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+        print(f"baseline written to {args.baseline}")
+        return 0
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    regressions = find_regressions(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    if regressions:
+        return 1
+    print(f"no regressions against {args.baseline}")
+    return 0
+
+
+def main() -> None:
+    """Main driver function."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--size", type=int, default=10_000_000,
+                        help="number of elements in the source list (default: %(default)s)")
+    parser.add_argument("--step", type=int, default=1,
+                        help="stride of the benchmarked view (default: %(default)s)")
+    parser.add_argument("--rotate", type=int, default=12345,
+                        help="number of steps to rotate by (default: %(default)s)")
+    parser.add_argument("--suite", action="store_true",
+                        help="run the ListView vs list benchmark suite instead")
+    parser.add_argument("--max-size", type=int, default=10_000_000,
+                        help="largest source size of the suite (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="timing runs per suite case, the best is kept (default: %(default)s)")
+    parser.add_argument("--baseline", metavar="FILE",
+                        help="JSON baseline to compare the suite against, written if missing")
+    parser.add_argument("--update", action="store_true",
+                        help="overwrite the baseline with the new results")
+    parser.add_argument("--tolerance", type=float, default=2.0,
+                        help="allowed growth factor of a ListView/list time ratio (default: %(default)s)")
+    args = parser.parse_args()
+
+    if args.suite:
+        sys.exit(suite(args))
+
+    shuffled = list(range(args.size))
+    random.seed(0)
+    random.shuffle(shuffled)
+
+    def setup() -> ListView:
+        return ListView(list(shuffled), step=args.step) if args.step > 0 \
+            else ListView(list(shuffled), args.size - 1, -1, args.step)
+
+    cases = (
+        ("sort", lambda v: v.apply(list.sort), lambda v: v.sort()),
+        ("reverse", lambda v: v.apply(list.reverse), lambda v: v.reverse()),
+        ("rotate", lambda v: v.apply(_rotate_list, args.rotate),
+         lambda v: v.rotate(args.rotate)),
+    )
+
+    print(f"size={args.size:,} step={args.step}")
+    print(f"{'operation':<10}{'path':<8}{'time (s)':>12}{'peak (MiB)':>14}")
+    for name, via_apply, native in cases:
+        for path, operation in (("apply", via_apply), ("native", native)):
+            elapsed, peak = measure(setup, operation)
+            print(f"{name:<10}{path:<8}{elapsed:>12.3f}{peak / 2**20:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
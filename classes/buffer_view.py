@@ -0,0 +1,238 @@
+"""
+buffer_view.py
+18 October 2026 01:43:25
+
+Implements the BufferView class, a ListView over any object supporting
+the buffer protocol (array.array, bytearray, memoryview, NumPy arrays,
+mmap, ...).
+
+Elements are accessed through a strided memoryview of the source, so
+slicing, iteration and slice assignment never copy element by element:
+slices are zero-copy memoryviews and bulk assignments are memcpy-speed.
+
+The bulk arithmetic operations (+=, -=, *=, /=, fill, clip, where) run
+as NumPy ufuncs on a zero-copy array of the view when NumPy is
+installed, and fall back to the ListView slice-assignment path if not.
+"""
+
+import operator
+import struct
+from array import array, typecodes
+from typing import Any, Callable, Iterable, Iterator, Union
+
+from list_view import ListIndex, ListView
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# binary operators used by ListView._update and their NumPy ufunc names
+_UFUNCS = {
+    operator.add: "add",
+    operator.sub: "subtract",
+    operator.mul: "multiply",
+    operator.truediv: "true_divide",
+}
+
+# struct format characters that memoryview can index and assign
+_ELEMENT_FORMATS = frozenset("cbB?hHiIlLqQnNfdP")
+
+
+def _flat_memoryview(source: Any) -> memoryview:
+    """Return a 1-D memoryview of a buffer-protocol object.
+
+    Args:
+        source (Any): Object supporting the buffer protocol.
+
+    Raises:
+        TypeError: `source` does not support the buffer protocol, or its elements cannot be indexed by memoryview (e.g. non-native byte order, structs or half floats).
+        ValueError: `source` is multi-dimensional and not C-contiguous, so it cannot be flattened without copying.
+
+    Returns:
+        memoryview: View of all the elements of `source` in memory order.
+    """
+    memory = memoryview(source)
+    fmt = memory.format[1:] if memory.format.startswith("@") else memory.format
+    if len(fmt) != 1 or fmt not in _ELEMENT_FORMATS:
+        raise TypeError(
+            f"unsupported buffer format {memory.format!r}; only native single-character formats can be viewed")
+    if memory.ndim == 1:
+        return memory
+    if not memory.c_contiguous:
+        raise ValueError("multi-dimensional buffers must be C-contiguous")
+    return memory.cast("B").cast(memory.format)
+
+
+class BufferView(ListView):
+    """Mutable strided view of a buffer-protocol object."""
+
+    __slots__ = ("_object",)
+
+    def __init__(self, source: Any, start: int = 0, stop: int = ..., step: int = 1) -> None:
+        """Construct a view of the source buffer specified with start:stop:step positioning.
+
+        Multi-dimensional C-contiguous buffers are viewed as flat
+        sequences of their elements in memory order.
+
+        Args:
+            source (Any): The buffer-protocol object to track.
+            start (int, optional): The start element index of `source` to track. Defaults to 0.
+            stop (int, optional): The end element index of `source` to track. Exclusive like in ranges and slices. Defaults to the number of elements.
+            step (int, optional): The stride of the view. Defaults to 1. If it is negative, start:stop:step works the same as in ranges and slices.
+        """
+        self._object = source
+        super().__init__(source, start, stop, step)
+
+    # **************************************************
+    #                   PROPERTIES
+    # **************************************************
+
+    @property
+    def source(self) -> Any:
+        """The buffer-protocol object that this view tracks."""
+        return self._object
+
+    @property
+    def format(self) -> str:
+        """The struct format character of the elements."""
+        return self._source.format
+
+    @property
+    def itemsize(self) -> int:
+        """The size of each element in bytes."""
+        return self._source.itemsize
+
+    @property
+    def memory(self) -> memoryview:
+        """The viewed elements as a zero-copy strided memoryview."""
+        return self._source[self.slice]
+
+    def tolist(self) -> list:
+        """Return the viewed elements as a list."""
+        return self.memory.tolist()
+
+    def to_numpy(self) -> "np.ndarray":
+        """Return the viewed elements as a zero-copy NumPy array.
+
+        Writing to the array writes through to the source.
+
+        Raises:
+            ImportError: NumPy is not installed.
+        """
+        if np is None:
+            raise ImportError("to_numpy() requires NumPy")
+        return np.asarray(self.memory)
+
+    # **************************************************
+    #               HELPER METHODS
+    # **************************************************
+
+    @staticmethod
+    def _storage(source: Any) -> memoryview:
+        return _flat_memoryview(source)
+
+    def _pack(self, items: Any) -> Any:
+        """Helper function for converting items to a buffer with the same format as the source.
+
+        Args:
+            items (Any): Buffer-protocol object or iterable of elements.
+
+        Returns:
+            Any: Object that can be assigned to a slice of the source memoryview.
+        """
+        fmt = self.format
+        if isinstance(items, BufferView):
+            items = items.memory
+        try:
+            memory = memoryview(items)
+        except TypeError:
+            if fmt in typecodes:
+                if isinstance(items, list):
+                    packed = array(fmt)
+                    packed.fromlist(items)  # faster than array(fmt, items)
+                    return packed
+                return array(fmt, items)
+            items = tuple(items)
+            return memoryview(struct.pack(f"{len(items)}{fmt}", *items)).cast(fmt)
+        if memory.format != fmt:
+            if fmt in typecodes:
+                return array(fmt, memory.tolist())
+            return self._pack(memory.tolist())
+        return memory
+
+    def _gather(self, src_slice: slice) -> list:
+        return self._source[src_slice].tolist()
+
+    def _scatter(self, src_slice: slice, items: Any) -> None:
+        items = self._pack(items)
+        self._will_write(range(len(self._source))[src_slice])
+        self._source[src_slice] = items
+
+    # **************************************************
+    #           ACCESSING AND MUTATING
+    # **************************************************
+
+    def __getitem__(self, index: ListIndex) -> Union[memoryview, Any]:
+        """Return a viewed element, or a zero-copy memoryview for slices."""
+        if isinstance(index, slice):
+            return self._source[self._calc_src_slice(index)]
+        return super().__getitem__(index)
+
+    def __iter__(self) -> Iterator:
+        return iter(self.memory)
+
+    # **************************************************
+    #               BULK OPERATIONS
+    # **************************************************
+
+    def _operand(self, other: Any) -> Any:
+        """Helper function for converting an operand to something NumPy can broadcast.
+
+        Args:
+            other (Any): A sized iterable of the same length as the view, or a scalar.
+
+        Returns:
+            Any: NumPy array of the same length as the view, or the scalar itself.
+        """
+        if isinstance(other, BufferView):
+            other = other.memory
+        elif isinstance(other, ListView):
+            other = list(other)
+        elif isinstance(other, (str, bytes)) or not hasattr(other, "__len__"):
+            return other
+        if len(other) != len(self):
+            raise ValueError(
+                f"operands could not be broadcast together with lengths {len(self)} and {len(other)}")
+        return np.asarray(other)
+
+    def _update(self, op: Callable[[Any, Any], Any], other: Any) -> None:
+        if np is None or op not in _UFUNCS:
+            return super()._update(op, other)
+        arr = self.to_numpy()
+        self._will_write(self.range)
+        ufunc = getattr(np, _UFUNCS[op])
+        ufunc(arr, self._operand(other), out=arr)
+
+    def fill(self, value: Any) -> None:
+        if np is None:
+            return super().fill(value)
+        self._will_write(self.range)
+        self.to_numpy()[...] = value
+
+    def clip(self, lower: Any = None, upper: Any = None) -> None:
+        if np is None or (lower is None and upper is None):
+            return super().clip(lower, upper)
+        arr = self.to_numpy()
+        self._will_write(self.range)
+        np.clip(arr, lower, upper, out=arr)
+
+    def where(self, condition: Iterable[bool], other: Any) -> None:
+        if np is None:
+            return super().where(condition, other)
+        if len(condition) != len(self):
+            raise ValueError(
+                f"condition has length {len(condition)}, expected {len(self)}")
+        mask = np.asarray(self._operand(condition), dtype=bool)
+        self._will_write(self.range)
+        np.copyto(self.to_numpy(), self._operand(other), where=~mask)
@@ -0,0 +1,201 @@
+"""
+chain_view.py
+18 October 2026 01:55:09
+
+Implements the ChainView class, a rope-style concatenation of any
+number of ListViews, possibly over different sources.
+
+Unlike the commented-out `ListView.__add__`, the segments do not have
+to be adjacent or share a step, so fragmented buffers can be presented
+as one logical sequence without joining them into a new list:
+
+    a, b = list(range(5)), list("xyz")
+    chain = ChainView(ListView(a, 1, 4), ListView(b, 2, -1, -1))
+    list(chain)     # [1, 2, 3, 'z', 'y', 'x']
+    chain[4]        # 'y'
+    chain[2:5]      # ChainView of ListView(a, 3, 4), ListView(b, 2, 0, -1)
+
+A prefix sum of the segment lengths is kept, so indexing bisects it in
+O(log k) for k segments, and slicing returns a ChainView of subviews
+of only the segments it overlaps. Nothing is copied.
+
+The prefix sums are computed when segments are added. If a segment
+changes length afterwards (e.g. it is registered on a TrackedList that
+was edited), call `reindex` before using the chain again.
+"""
+
+import bisect
+import itertools
+from typing import Any, Iterable, Iterator, Union
+
+from list_view import ListIndex, ListView
+from pipeline import PipelineMethods
+
+
+class ChainView(PipelineMethods):
+    """Mutable concatenation of ListViews indexed through prefix sums."""
+
+    __slots__ = ("_views", "_offsets")
+
+    def __init__(self, *views: Union[ListView, "ChainView"]) -> None:
+        """Construct the concatenation of the given views, in order.
+
+        Args:
+            *views (Union[ListView, ChainView]): Views to concatenate. The segments of ChainViews are spliced in.
+        """
+        self._views = []
+        self._offsets = [0]
+        self.extend(views)
+
+    # **************************************************
+    #                   SEGMENTS
+    # **************************************************
+
+    @property
+    def segments(self) -> tuple:
+        """The concatenated views, in order."""
+        return tuple(self._views)
+
+    def append(self, view: Union[ListView, "ChainView"]) -> None:
+        """Add a view to the end of the chain.
+
+        Args:
+            view (Union[ListView, ChainView]): View to add. The segments of a ChainView are spliced in.
+
+        Raises:
+            TypeError: `view` is not a ListView or ChainView.
+        """
+        if isinstance(view, ChainView):
+            self.extend(view._views)
+            return
+        if not isinstance(view, ListView):
+            raise TypeError(
+                f"ChainView segments must be ListViews, not {type(view).__name__!r}")
+        self._views.append(view)
+        self._offsets.append(self._offsets[-1] + len(view))
+
+    def extend(self, views: Iterable[Union[ListView, "ChainView"]]) -> None:
+        """Add several views to the end of the chain."""
+        for view in views:
+            self.append(view)
+
+    def reindex(self) -> None:
+        """Recompute the prefix sums after segments changed length."""
+        self._offsets = list(itertools.accumulate(map(len, self._views), initial=0))
+
+    def locate(self, index: int) -> tuple[ListView, int]:
+        """Find the segment holding an element of the chain.
+
+        Args:
+            index (int): Index of the chain. Negative indices count from the end.
+
+        Raises:
+            IndexError: `index` is out of range.
+
+        Returns:
+            tuple[ListView, int]: The segment and the index of the element within it.
+        """
+        try:
+            i = range(len(self))[index]
+        except IndexError:
+            raise IndexError("ChainView index out of range") from None
+        except TypeError:
+            raise TypeError(
+                f"ChainView indices must be integers or slices, not {type(index).__name__!r}") from None
+        # bisect_right skips empty segments sharing the offset
+        k = bisect.bisect_right(self._offsets, i) - 1
+        return self._views[k], i - self._offsets[k]
+
+    # **************************************************
+    #               HELPER METHODS
+    # **************************************************
+
+    def _pieces(self, positions: range) -> list[ListView]:
+        """Helper function for splitting a range of chain indices into subviews of the segments.
+
+        Only the segments that the range overlaps are visited.
+
+        Args:
+            positions (range): Valid indices of the chain, ascending or descending.
+
+        Returns:
+            list[ListView]: Subviews that together select the same elements in the same order.
+        """
+        if not positions:
+            return []
+        ascending = positions if positions.step > 0 else positions[::-1]
+        step = ascending.step
+        last = ascending[-1]
+        pieces = []
+        k = bisect.bisect_right(self._offsets, ascending[0]) - 1
+        while k < len(self._views) and self._offsets[k] <= last:
+            lo, hi = self._offsets[k], self._offsets[k + 1]
+            # positions of `ascending` that fall inside [lo, hi)
+            first = max(-(-(lo - ascending.start) // step), 0)
+            end = -(-(hi - ascending.start) // step)
+            inside = ascending[first:end]
+            if inside:
+                pieces.append(self._views[k].subview(
+                    slice(inside.start - lo, inside.stop - lo, step)))
+            k += 1
+        if positions.step < 0:
+            pieces = [piece.subview(slice(None, None, -1)) for piece in reversed(pieces)]
+        return pieces
+
+    # **************************************************
+    #           ACCESSING AND MUTATING
+    # **************************************************
+
+    def __getitem__(self, index: ListIndex) -> Union["ChainView", Any]:
+        """Return an element, or a ChainView of subviews for slices."""
+        if isinstance(index, slice):
+            return ChainView(*self._pieces(range(len(self))[index]))
+        view, i = self.locate(index)
+        return view[i]
+
+    def __setitem__(self, index: ListIndex, value: Any) -> None:
+        if not isinstance(index, slice):
+            view, i = self.locate(index)
+            view[i] = value
+            return
+        positions = range(len(self))[index]
+        items = list(value)
+        if len(items) != len(positions):
+            raise ValueError(
+                f"attempt to assign sequence of size {len(items)} to ChainView slice of size {len(positions)}")
+        lo = 0
+        for piece in self._pieces(positions):
+            hi = lo + len(piece)
+            piece[:] = items[lo:hi]
+            lo = hi
+
+    def __delitem__(self, index: ListIndex) -> None:
+        raise TypeError("elements cannot be deleted through a ChainView")
+
+    def __iter__(self) -> Iterator:
+        return itertools.chain.from_iterable(self._views)
+
+    def __len__(self) -> int:
+        return self._offsets[-1]
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ChainView):
+            return len(self) == len(other) and self.to_list() == other.to_list()
+        return NotImplemented
+
+    def to_list(self) -> list:
+        """Return the elements of the chain as a list."""
+        return list(self)
+
+    # **************************************************
+    #               REPRESENTATIONS
+    # **************************************************
+
+    def __str__(self) -> str:
+        return f"ChainView({self.to_list()})"
+
+    def __repr__(self) -> str:
+        return f"ChainView(segments={len(self._views)}, length={len(self)})"
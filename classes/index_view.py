@@ -0,0 +1,220 @@
+"""
+index_view.py
+18 October 2026 01:56:18
+
+Implements the IndexView class, a view of an arbitrary selection of
+source positions (a permutation, the result of a mask, ...), i.e.
+gather/scatter "fancy indexing" for lists and ListViews.
+
+The positions are kept in an `array('q')`, 8 bytes each, and element
+access goes through builtin map over the source's __getitem__ and
+`operator.setitem`, so bulk gathers and scatters run without a Python-level
+loop and the selected elements are never copied into an intermediate
+list:
+
+    src = list(range(10, 20))
+    evens = ListView(src, 0, 10, 2)                 # [10, 12, 14, 16, 18]
+    big = IndexView.from_mask(evens, [x > 13 for x in evens])
+    big.positions                                   # array('q', [4, 6, 8])
+    big.scatter([0, 0, 0])                          # src[4] = src[6] = src[8] = 0
+
+When the source is a ListView, the given indices are indices of that
+view and are composed with its start:stop:step once, on construction,
+so the IndexView reads the underlying storage directly.
+"""
+
+import collections
+import itertools
+import operator
+from array import array
+from typing import Any, Iterable, Iterator, Union
+
+import snapshot
+from list_view import ListIndex, ListView
+from pipeline import PipelineMethods
+
+
+class IndexView(PipelineMethods):
+    """Mutable view of arbitrary positions of a list or ListView."""
+
+    __slots__ = ("_object", "_storage", "_positions")
+
+    def __init__(self, source: Union[list, ListView, "IndexView"], indices: Iterable[int]) -> None:
+        """Construct a view of the elements of the source at the given indices, in order.
+
+        Args:
+            source (Union[list, ListView, IndexView]): The list, or view of a list, to select from.
+            indices (Iterable[int]): Indices of `source` to view. Negative indices count from the end of `source`. Repeats are allowed.
+
+        Raises:
+            TypeError: `source` is not a list, ListView or IndexView.
+            IndexError: An index is out of range of `source`.
+        """
+        if isinstance(source, IndexView):
+            self._object = source._object
+            self._storage = source._storage
+            lookup = source._positions
+        elif isinstance(source, ListView):
+            self._object = source.source
+            self._storage = source._source
+            lookup = source.range
+        elif isinstance(source, list):
+            self._object = self._storage = source
+            lookup = range(len(source))
+        else:
+            raise TypeError(
+                f"source must be a list, ListView or IndexView, not {type(source).__name__!r}")
+        # composes the indices with the source in C; lookup raises IndexError
+        positions = map(lookup.__getitem__, indices)
+        try:
+            self._positions = array("q", positions)
+        except IndexError:
+            raise IndexError("IndexView index out of range") from None
+
+    @classmethod
+    def from_mask(cls, source: Union[list, ListView, "IndexView"], mask: Iterable[bool]) -> "IndexView":
+        """Construct a view of the elements of the source whose mask entry is true.
+
+        The mask is consumed in one pass with `itertools.compress`.
+
+        Args:
+            source (Union[list, ListView, IndexView]): The list, or view of a list, to select from.
+            mask (Iterable[bool]): One truth value per element of `source`. Extra entries are ignored.
+
+        Returns:
+            IndexView: View of the selected elements, in order.
+        """
+        return cls(source, itertools.compress(range(len(source)), mask))
+
+    # **************************************************
+    #                   PROPERTIES
+    # **************************************************
+
+    @property
+    def source(self) -> Any:
+        """The object that this view tracks."""
+        return self._object
+
+    @property
+    def positions(self) -> array:
+        """The viewed indices of the underlying storage, in view order."""
+        return self._positions
+
+    # **************************************************
+    #               HELPER METHODS
+    # **************************************************
+
+    def _will_write(self, positions: array) -> None:
+        """Helper function to call before writing to the underlying storage. See `ListView._will_write`."""
+        if snapshot._watchers and positions:
+            snapshot.notify_write(self._object, range(min(positions), max(positions) + 1))
+
+    def _normalize(self, index: int) -> int:
+        """Helper function for converting a view index to an index of the underlying storage."""
+        try:
+            return self._positions[index]
+        except IndexError:
+            raise IndexError("IndexView index out of range") from None
+        except TypeError:
+            raise TypeError(
+                f"IndexView indices must be integers or slices, not {type(index).__name__!r}") from None
+
+    # **************************************************
+    #               GATHER AND SCATTER
+    # **************************************************
+
+    def gather(self, typecode: str = None) -> Union[list, array]:
+        """Copy the viewed elements out of the source in one pass.
+
+        Args:
+            typecode (str, optional): Return an `array` of this type code instead of a list. Defaults to None.
+
+        Returns:
+            Union[list, array]: The viewed elements, in view order.
+        """
+        items = map(self._storage.__getitem__, self._positions)
+        if typecode is None:
+            return list(items)
+        return array(typecode, items)
+
+    def scatter(self, values: Iterable) -> None:
+        """Write one value to each viewed position in one pass.
+
+        If a position is viewed more than once, the last value written to it wins.
+
+        Args:
+            values (Iterable): One value per viewed element, in view order.
+
+        Raises:
+            ValueError: `values` is sized and its length differs from the view's.
+        """
+        self._scatter(self._positions, values)
+
+    def _scatter(self, positions: array, values: Iterable) -> None:
+        """Helper function for writing values to the given positions of the underlying storage."""
+        if hasattr(values, "__len__") and len(values) != len(positions):
+            raise ValueError(
+                f"attempt to assign sequence of size {len(values)} to {len(positions)} positions")
+        self._will_write(positions)
+        # deque(maxlen=0) drives the map without storing the Nones
+        collections.deque(map(operator.setitem, itertools.repeat(self._storage), positions, values), maxlen=0)
+
+    def subview(self, index: Union[slice, Iterable[int]]) -> "IndexView":
+        """Return a view of some of the viewed elements without copying them.
+
+        Args:
+            index (Union[slice, Iterable[int]]): A slice, or indices of this view.
+
+        Returns:
+            IndexView: View of the same source.
+        """
+        if isinstance(index, slice):
+            view = IndexView.__new__(IndexView)
+            view._object, view._storage = self._object, self._storage
+            view._positions = self._positions[index]
+            return view
+        return IndexView(self, index)
+
+    # **************************************************
+    #           ACCESSING AND MUTATING
+    # **************************************************
+
+    def __getitem__(self, index: ListIndex) -> Any:
+        if isinstance(index, slice):
+            return list(map(self._storage.__getitem__, self._positions[index]))
+        return self._storage[self._normalize(index)]
+
+    def __setitem__(self, index: ListIndex, value: Any) -> None:
+        if isinstance(index, slice):
+            self._scatter(self._positions[index], value)
+            return
+        i = self._normalize(index)
+        self._will_write(array("q", (i,)))
+        self._storage[i] = value
+
+    def __delitem__(self, index: ListIndex) -> None:
+        raise TypeError("elements cannot be deleted through an IndexView")
+
+    def __iter__(self) -> Iterator:
+        return map(self._storage.__getitem__, self._positions)
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, IndexView):
+            return self._object is other._object and self._positions == other._positions
+        return NotImplemented
+
+    # **************************************************
+    #               REPRESENTATIONS
+    # **************************************************
+
+    def __str__(self) -> str:
+        return f"IndexView({self.gather()})"
+
+    def __repr__(self) -> str:
+        return f"IndexView(<{type(self._object).__name__} object at {hex(id(self._object))}>, length={len(self)})"
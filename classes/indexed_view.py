@@ -0,0 +1,170 @@
+"""
+indexed_view.py
+18 October 2026 02:14:06
+
+Implements the IndexedView class, a ListView with an auxiliary hash
+index from each viewed value to its sorted view positions.
+
+Membership and lookups on a plain ListView scan the strided range. An
+IndexedView builds the index once, on the first query, after which
+`in` and `count` are O(1) and `index` is O(log n):
+
+    src = TrackedList(random.choices(range(1000), k=1_000_000))
+    view = IndexedView(src, 0, len(src), 3)
+    7 in view          # builds the index, then O(1)
+    view.index(7, 500) # O(log n): bisects the positions of 7
+    view[10] = 7       # moves position 10 in the index, O(log n)
+
+Assigning a single element through the view updates the index in
+place. Any other write through the view (slices, deletion, insertion,
+sort, bulk arithmetic, ...) marks it stale, and it is rebuilt on the
+next query. Writes that bypass the view are detected through the
+`version` counter of a TrackedList source, together with the source
+length and the view bounds. Plain list sources have no version
+counter, so for them only length and bound changes are detected; call
+`invalidate` after writing to such a list directly.
+
+Values must be hashable to be indexed. Queries fall back to the
+ListView scans when they are not.
+"""
+
+import bisect
+from typing import Any, Optional
+
+from list_view import ListIndex, ListView
+
+
+class IndexedView(ListView):
+    """ListView with a hash index from values to view positions for fast membership and lookup."""
+
+    __slots__ = ("_index", "_stamp")
+
+    def __init__(self, source: list, start: int = 0, stop: int = ..., step: int = 1) -> None:
+        """Construct an indexed view of the source list. See `ListView.__init__`.
+
+        The index is built lazily by the first query.
+        """
+        super().__init__(source, start, stop, step)
+        self._index = None
+        self._stamp = None
+
+    # **************************************************
+    #                   INDEX
+    # **************************************************
+
+    @property
+    def indexed(self) -> bool:
+        """Whether the index is currently up to date."""
+        return self._index is not None and self._stamp == self._current_stamp()
+
+    def _current_stamp(self) -> tuple:
+        """Helper function returning what must stay unchanged for the index to be valid. O(1)."""
+        source = self.source
+        return (getattr(source, "version", None), len(source), self.range)
+
+    def reindex(self) -> None:
+        """Rebuild the index from the viewed elements in one pass."""
+        index = {}
+        try:
+            for i, value in enumerate(self):
+                positions = index.get(value)
+                if positions is None:
+                    index[value] = [i]
+                else:
+                    positions.append(i)
+        except TypeError:
+            index = None  # unhashable values; queries scan instead
+        self._index = index
+        self._stamp = self._current_stamp()
+
+    def invalidate(self) -> None:
+        """Mark the index stale so the next query rebuilds it."""
+        self._index = None
+        self._stamp = None
+
+    def _positions_of(self, value: Any) -> Optional[list]:
+        """Helper function returning the sorted view positions of a value, or None if the index cannot be used.
+
+        Rebuilds the index first if it is stale.
+        """
+        if self._stamp != self._current_stamp():
+            self.reindex()
+        if self._index is None:
+            return None
+        try:
+            return self._index.get(value, [])
+        except TypeError:
+            return None
+
+    def _will_write(self, positions: range = None) -> None:
+        super()._will_write(positions)
+        self.invalidate()
+
+    # **************************************************
+    #           ACCESSING AND MUTATING
+    # **************************************************
+
+    def __setitem__(self, index: ListIndex, value: Any) -> None:
+        """Assign through the view, updating the index in place for single elements."""
+        if not isinstance(index, int) or not self.indexed:
+            return super().__setitem__(index, value)
+        try:
+            i = range(len(self))[index]
+        except IndexError:
+            raise IndexError(
+                f"{type(self).__name__} index out of range") from None
+        old = self[i]
+        table = self._index
+        super().__setitem__(i, value)  # invalidates through _will_write
+        # remove before adding, as value may equal old and share its entry
+        old_positions = table[old]
+        del old_positions[bisect.bisect_left(old_positions, i)]
+        if not old_positions:
+            del table[old]
+        try:
+            new_positions = table.setdefault(value, [])
+        except TypeError:
+            return  # an unhashable value cannot be indexed
+        bisect.insort(new_positions, i)
+        self._index = table
+        self._stamp = self._current_stamp()
+
+    # **************************************************
+    #                   SEARCHING
+    # **************************************************
+
+    def __contains__(self, value: Any) -> bool:
+        positions = self._positions_of(value)
+        if positions is None:
+            return super().__contains__(value)
+        return bool(positions)
+
+    def count(self, value: Any) -> int:
+        """Return the number of viewed elements equal to value, like `list.count`. O(1) once indexed."""
+        positions = self._positions_of(value)
+        if positions is None:
+            return super().count(value)
+        return len(positions)
+
+    def index(self, value: Any, start: int = 0, stop: int = None) -> int:
+        """Return the first view index of value, like `list.index`. O(log n) once indexed.
+
+        Args:
+            value (Any): The element to find.
+            start (int, optional): View index to start searching from. Defaults to 0.
+            stop (int, optional): View index to stop searching at. Defaults to the end of the view.
+
+        Raises:
+            ValueError: `value` is not in the searched part of the view.
+
+        Returns:
+            int: The view index of the first element equal to `value`.
+        """
+        positions = self._positions_of(value)
+        if positions is None:
+            return super().index(value, start, stop)
+        searched = range(len(self))[start:stop]
+        k = bisect.bisect_left(positions, searched.start)
+        if k < len(positions) and positions[k] < searched.stop:
+            return positions[k]
+        raise ValueError(f"{value!r} is not in {type(self).__name__}")
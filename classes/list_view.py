@@ -6,25 +6,34 @@ Implements the ListView class, an attempt at implementing mutable
 sublists ("views") of the builtin list.
 
 Also implements imitations of the higher-order JavaScript methods:
-for_each, map, and filter.
+for_each, map, filter, and reduce, from the PipelineMethods mixin.
 
-Unfortunately due to the fundamental design at the moment, these
-methods return a list, so chaining for_each, map, and filter is not
-possible at this time.
+map and filter return a lazy Pipeline (see pipeline.py), so they can
+be chained and are fused into a single pass over the view. Nothing is
+computed until the pipeline is consumed.
 """
 
+import bisect
 import copy
-from typing import Any, Callable, Iterator, NoReturn, Union
+import itertools
+import math
+import operator
+from typing import Any, Callable, Iterable, Iterator, NoReturn, Union
+
+import snapshot
+from pipeline import PipelineMethods
 
 # Type Aliases
 ListIndex = Union[int, slice]
 
 
-class ListView:
+class ListView(PipelineMethods):
     """Mutable sublist of a target list."""
 
     __slots__ = ("_source", "_start", "_stop", "_step")
 
+    CHUNK_SIZE = 1024  # elements copied at a time by __iter__
+
     def __init__(self, source: list, start: int = 0, stop: int = ..., step: int = 1) -> None:
         """Construct a view of the source list specified with start:stop:step positioning.
 
@@ -34,13 +43,9 @@ class ListView:
             stop (int, optional): The end index of `source` to track. Exclusive like in ranges and slices. Defaults to `len(source)`.
             step (int, optional): The stride of the view. Defaults to 1. If it is negative, start:stop:step works the same as in ranges and slices.
         """
-        if not isinstance(source, list):
-            raise TypeError(
-                f"source must be a list, not {type(source).__name__!r}")
-
-        self._source = source
+        self._source = self._storage(source)
         self._start = start
-        self._stop = len(source) if stop is ... else stop
+        self._stop = len(self._source) if stop is ... else stop
         self._step = step
 
         for param in (self.start, self.stop, self.step):
@@ -102,8 +107,12 @@ class ListView:
 
     @property
     def slice(self) -> slice:
-        """The start, stop, and step properties as a slice object."""
-        return slice(self.start, self.stop, self.step)
+        """The start, stop, and step properties as a slice object.
+
+        A negative stop that only marks "past index 0" for a negative
+        step is replaced with None so the slice selects the same items.
+        """
+        return self._range_to_slice(self.range)
 
     @property
     def tuple(self) -> tuple:
@@ -114,46 +123,167 @@ class ListView:
         """Return a deepcopy of the viewed sublist as a list.
 
         Use this instead of `list(view)` when elements need to be copied recursively.
+        See `snapshot` for a copy that only copies the elements that later change.
+        """
+        return copy.deepcopy(self._gather(self.slice))
+
+    def snapshot(self, page_size: int = snapshot.Snapshot.PAGE_SIZE) -> snapshot.Snapshot:
+        """Return a copy-on-write deep copy of the viewed elements.
+
+        The snapshot reads from the source until the snapshot or the
+        source (through any ListView) writes to an element; only the
+        page of `page_size` elements around it is deep-copied then.
+        See snapshot.py for details.
+
+        Args:
+            page_size (int, optional): Number of elements copied together. Defaults to Snapshot.PAGE_SIZE.
+
+        Returns:
+            Snapshot: Sequence with the elements currently viewed.
         """
-        return copy.deepcopy(self.source[self.slice])
+        return snapshot.Snapshot(self, page_size)
 
     # **************************************************
     #               HELPER METHODS
     # **************************************************
 
+    @staticmethod
+    def _storage(source: Any) -> list:
+        """Helper function for validating the source and returning the object to index into.
+
+        Subclasses override this to support other kinds of sources.
+
+        Args:
+            source (Any): The source passed to the constructor.
+
+        Raises:
+            TypeError: `source` is not a list.
+
+        Returns:
+            list: The object indexed by the view's start:stop:step positions.
+        """
+        if not isinstance(source, list):
+            raise TypeError(
+                f"source must be a list, not {type(source).__name__!r}")
+        return source
+
+    def _gather(self, src_slice: slice) -> list:
+        """Helper function for copying a slice of the underlying storage into a new list.
+
+        Args:
+            src_slice (slice): Slice of the underlying storage.
+
+        Returns:
+            list: Shallow copy of the selected elements.
+        """
+        return self._source[src_slice]
+
+    def _scatter(self, src_slice: slice, items: Any) -> None:
+        """Helper function for writing a sequence into a slice of the underlying storage.
+
+        Args:
+            src_slice (slice): Slice of the underlying storage.
+            items (Any): Iterable of new elements. Must match the slice length if the slice is extended.
+        """
+        positions = range(len(self._source))[src_slice]
+        if positions.step == 1 and (not hasattr(items, "__len__") or len(items) != len(positions)):
+            positions = None  # may resize the source
+        self._will_write(positions)
+        self._source[src_slice] = items
+
+    def _will_write(self, positions: range = None) -> None:
+        """Helper function to call before every write to the underlying storage.
+
+        Lets copy-on-write snapshots of the source preserve the elements
+        about to change. See snapshot.py.
+
+        Args:
+            positions (range, optional): Indices of the underlying storage about to be written. Defaults to None, meaning elements will be inserted or deleted.
+        """
+        if snapshot._watchers:
+            snapshot.notify_write(self.source, positions)
+
+    @staticmethod
+    def _range_to_slice(src_range: range) -> slice:
+        """Helper function for converting a range of source indices to an equivalent slice.
+
+        A range such as `range(4, -1, -1)` ends before index 0, but the
+        slice `slice(4, -1, -1)` would count -1 from the end of the list.
+
+        Args:
+            src_range (range): Range of non-negative indices of the underlying list.
+
+        Returns:
+            slice: Slice selecting the same indices in the same order.
+        """
+        if not src_range:
+            # keep the position, so assigning to the empty slice inserts there
+            start = max(src_range.start, 0)
+            return slice(start, start, src_range.step)
+        stop = src_range.stop
+        if stop < 0 and src_range.step < 0:
+            stop = None
+        return slice(src_range.start, stop, src_range.step)
+
+    @classmethod
+    def _from_bounds(cls, source: Any, start: int, stop: int, step: int) -> "ListView":
+        """Helper function for constructing a view of this type from a source and start:stop:step positioning.
+
+        Subclasses whose constructor takes other arguments override this.
+
+        Args:
+            source (Any): The source the new view tracks, as returned by the `source` property.
+            start (int): The start index to track.
+            stop (int): The end index to track.
+            step (int): The stride of the view.
+
+        Returns:
+            ListView: View of this type.
+        """
+        return cls(source, start, stop, step)
+
+    def _derive(self, src_range: range) -> "ListView":
+        """Helper function for constructing a view of the same source over a range of source indices.
+
+        Args:
+            src_range (range): Source indices the new view tracks.
+
+        Returns:
+            ListView: View of the same type and source.
+        """
+        return self._from_bounds(self.source, src_range.start, src_range.stop, src_range.step)
+
     def _calc_src_slice(self, view_slice: "slice") -> slice:
         """Helper function for converting a view slice to a slice for the underlying list.
 
+        Negative and out-of-range bounds are normalized against the
+        length of the view, exactly like slicing a list.
+
         Args:
             view_slice (slice): The desired slice of the view.
 
         Returns:
             slice: The equivalent slice of the underlying list.
         """
-        start = view_slice.start
-        if start is None:
-            start = 0
-        stop = view_slice.stop
-        if stop is None:
-            stop = len(self)
-        step = view_slice.step
-        if step is None:
-            step = 1
-        s = slice(self.start + start * self.step,
-                  self.start + stop * self.step,
-                  self.step * step)
-        return s
+        return self._range_to_slice(self.range[view_slice])
 
     def _calc_src_index(self, view_index: int) -> int:
         """Helper function for converting a view index to an index for the underlying list.
 
         Args:
-            view_index (int): The desired index of the view.
+            view_index (int): The desired index of the view. Negative indices count from the end of the view.
+
+        Raises:
+            IndexError: `view_index` is out of range of the view.
 
         Returns:
             int: The equivalent index of the underlying list.
         """
-        return self.start + view_index * self.step
+        try:
+            return self.range[view_index]
+        except IndexError:
+            raise IndexError(
+                f"{type(self).__name__} index out of range") from None
 
     def _raise_index_type_error(self, index: Any) -> NoReturn:
         """Raise an error informing of illegal ListView indexing type.
@@ -171,37 +301,296 @@ class ListView:
     #           ACCESSING AND MUTATING
     # **************************************************
 
+    def subview(self, index: "slice") -> "ListView":
+        """Return a view of a slice of this view without copying any elements.
+
+        The start:stop:step arithmetic of both slices is composed, so
+        the new view tracks the same source list directly and nesting
+        views costs O(1) regardless of their size.
+
+        Example:
+            ```
+            src = [i for i in range(10)]
+            view = ListView(src, 1, 9, 2)  # [1, 3, 5, 7]
+            sub = view.subview(slice(None, None, -1))
+            print(list(sub))  # [7, 5, 3, 1]
+            sub[0] = None
+            print(src[7])  # None
+            ```
+
+        Args:
+            index (slice): The desired slice of the view.
+
+        Returns:
+            ListView: View of the same source list.
+        """
+        if not isinstance(index, slice):
+            raise TypeError(
+                f"{type(self).__name__} subviews must be taken with slices, not {type(index).__name__!r}")
+        return self._derive(self.range[index])
+
+    def partition(self, n: int) -> list["ListView"]:
+        """Split the view into n disjoint, consecutive subviews.
+
+        The subviews differ in length by at most one and together cover
+        the view in order. Some are empty if n exceeds the view length.
+
+        Args:
+            n (int): Number of subviews.
+
+        Returns:
+            list[ListView]: Views of the same source list, in order.
+        """
+        if n < 1:
+            raise ValueError("n must be positive")
+        size, extra = divmod(len(self), n)
+        views = []
+        lo = 0
+        for k in range(n):
+            hi = lo + size + (k < extra)
+            views.append(self.subview(slice(lo, hi)))
+            lo = hi
+        return views
+
+    def windows(self, size: int, stride: int = 1, reuse: bool = False) -> Iterator["ListView"]:
+        """Yield views of every full window of consecutive viewed elements.
+
+        Example:
+            ```
+            view = ListView(list(range(6)))
+            [list(w) for w in view.windows(3, 2)]  # [[0, 1, 2], [2, 3, 4]]
+            ```
+
+        Args:
+            size (int): Number of elements in each window.
+            stride (int, optional): Distance between the starts of consecutive windows. Defaults to 1.
+            reuse (bool, optional): Yield the same view object every time, moved to each window in turn, instead of a new view per window. Defaults to False.
+
+        Yields:
+            ListView: View of the same source list for each window.
+        """
+        if size < 1 or stride < 1:
+            raise ValueError("size and stride must be positive")
+        return self._windows(range(0, len(self) - size + 1, stride), size, reuse)
+
+    def chunks(self, size: int, reuse: bool = False) -> Iterator["ListView"]:
+        """Yield views of consecutive, non-overlapping chunks of the view.
+
+        The last chunk is shorter if the view length is not a multiple of `size`.
+
+        Args:
+            size (int): Number of elements in each chunk.
+            reuse (bool, optional): Yield the same view object every time, moved to each chunk in turn, instead of a new view per chunk. Defaults to False.
+
+        Yields:
+            ListView: View of the same source list for each chunk.
+        """
+        if size < 1:
+            raise ValueError("size must be positive")
+        return self._windows(range(0, len(self), size), size, reuse)
+
+    def _windows(self, offsets: range, size: int, reuse: bool) -> Iterator["ListView"]:
+        """Helper generator for `windows` and `chunks` yielding views at each offset of the view."""
+        window = None
+        for i in offsets:
+            if window is None or not reuse:
+                window = self.subview(slice(i, i + size))
+            else:
+                r = self.range[i:i + size]
+                window.start, window.stop = r.start, r.stop
+            yield window
+
     def __getitem__(self, index: ListIndex) -> Union[list, Any]:
         if isinstance(index, int):
             i = self._calc_src_index(index)
-            return self.source[i]
+            return self._source[i]
         if isinstance(index, slice):
             s = self._calc_src_slice(index)
-            return self.source[s]
+            return self._gather(s)
         self._raise_index_type_error(index)
 
     def __setitem__(self, index: ListIndex, value: Any) -> None:
         if isinstance(index, int):
             i = self._calc_src_index(index)
-            self.source[i] = value
+            self._will_write(range(i, i + 1))
+            self._source[i] = value
         elif isinstance(index, slice):
             s = self._calc_src_slice(index)
-            self.source[s] = value
+            self._scatter(s, value)
         else:
             self._raise_index_type_error(index)
 
     def __delitem__(self, index: ListIndex) -> None:
+        self._will_write()
         if isinstance(index, int):
             i = self._calc_src_index(index)
-            del self.source[i]
+            del self._source[i]
         elif isinstance(index, slice):
             s = self._calc_src_slice(index)
-            del self.source[s]
+            del self._source[s]
         else:
             self._raise_index_type_error(index)
 
+    def insert(self, index: int, value: Any) -> None:
+        """Insert an element into the target list before a view index, like `list.insert`.
+
+        The view grows to include the new element. Only views with a
+        step of 1 or -1 can grow this way. If the target list is a
+        TrackedList (see view_registry.py), its other registered views
+        are updated as well.
+
+        Args:
+            index (int): Index of the view before which to insert. Clamped to the view like in `list.insert`.
+            value (Any): The element to insert.
+
+        Raises:
+            ValueError: The step of the view is not 1 or -1.
+        """
+        if self.step not in (1, -1):
+            raise ValueError(
+                f"cannot insert into a {type(self).__name__} with a step other than 1 or -1")
+        n = len(self)
+        index = min(max(index + n if index < 0 else index, 0), n)
+        start = self.start
+        self._will_write()
+        registry = getattr(self._source, "registry", None)
+        if registry is not None and self in registry:
+            registry.unregister(self)
+        else:
+            registry = None
+        if self.step > 0:
+            self._source.insert(start + index, value)
+            self.start, self.stop = start, start + n + 1
+        else:
+            self._source.insert(start - index + 1, value)
+            self.start, self.stop = start + 1, start - n
+        if registry is not None:
+            registry.register(self)
+
+    def blocks(self, size: int = None) -> Iterator[list]:
+        """Yield the viewed elements as consecutive lists of at most `size` elements.
+
+        Each block is copied out of the target list with one slice, so
+        memory stays bounded by the block size while the per-element
+        work runs in C.
+
+        Args:
+            size (int, optional): Maximum number of elements per block. Defaults to ListView.CHUNK_SIZE.
+
+        Yields:
+            list: Shallow copy of the next run of viewed elements.
+        """
+        size = self.CHUNK_SIZE if size is None else size
+        if size < 1:
+            raise ValueError("size must be positive")
+        r = self.range
+        n = len(r)
+        bounds = map(slice, range(0, n, size), range(size, n + size, size))
+        src_slices = map(self._range_to_slice, map(r.__getitem__, bounds))
+        return map(self._gather, src_slices)
+
     def __iter__(self) -> Iterator:
-        return (self.source[i] for i in self.range)
+        """Iterate over the viewed elements, copying them out in blocks of CHUNK_SIZE.
+
+        The bounds are read when iteration starts. Writes to the target
+        list during iteration are only seen from the next block on.
+        """
+        return itertools.chain.from_iterable(self.blocks())
+
+    # **************************************************
+    #                   SEARCHING
+    # **************************************************
+
+    def __contains__(self, value: Any) -> bool:
+        """Scan the viewed elements block by block, so only the viewed range is read."""
+        return any(value in block for block in self.blocks())
+
+    def count(self, value: Any) -> int:
+        """Return the number of viewed elements equal to value, like `list.count`.
+
+        Each block is counted in C with `list.count`.
+        """
+        return sum(block.count(value) for block in self.blocks())
+
+    def index(self, value: Any, start: int = 0, stop: int = None) -> int:
+        """Return the first view index of value, like `list.index`.
+
+        Only the searched range is read: with `list.index` directly on
+        the target list when the step is 1, and block by block otherwise.
+
+        Args:
+            value (Any): The element to find.
+            start (int, optional): View index to start searching from. Defaults to 0.
+            stop (int, optional): View index to stop searching at. Defaults to the end of the view.
+
+        Raises:
+            ValueError: `value` is not in the searched part of the view.
+
+        Returns:
+            int: The view index of the first element equal to `value`.
+        """
+        searched = range(len(self))[start:stop]
+        r = self.range[searched.start:searched.stop]
+        if r.step == 1 and isinstance(self._source, list):
+            try:
+                return searched.start + self._source.index(value, r.start, max(r.stop, r.start)) - r.start
+            except ValueError:
+                pass
+        else:
+            offset = searched.start
+            for block in self.subview(slice(searched.start, searched.stop)).blocks():
+                try:
+                    return offset + block.index(value)
+                except ValueError:
+                    offset += len(block)
+        raise ValueError(f"{value!r} is not in {type(self).__name__}")
+
+    def bisect_left(self, x: Any, key: Callable[[Any], Any] = None) -> int:
+        """Return the view index at which to insert x to keep a sorted view sorted, before equal elements.
+
+        Like `bisect.bisect_left` over the view's coordinates. It runs in
+        O(log n), directly on the underlying storage when the step is 1.
+
+        Args:
+            x (Any): The value (or key, if `key` is given) to locate.
+            key (Callable[[Any], Any], optional): Function computing the comparison key of each element. Not applied to `x`.
+
+        Returns:
+            int: The insertion index in the view.
+        """
+        if self.step == 1:
+            r = self.range
+            return bisect.bisect_left(self._source, x, r.start, max(r.stop, r.start), key=key) - r.start
+        return bisect.bisect_left(self, x, key=key)
+
+    def bisect_right(self, x: Any, key: Callable[[Any], Any] = None) -> int:
+        """Return the view index at which to insert x to keep a sorted view sorted, after equal elements.
+
+        See `bisect_left`.
+
+        Args:
+            x (Any): The value (or key, if `key` is given) to locate.
+            key (Callable[[Any], Any], optional): Function computing the comparison key of each element. Not applied to `x`.
+
+        Returns:
+            int: The insertion index in the view.
+        """
+        if self.step == 1:
+            r = self.range
+            return bisect.bisect_right(self._source, x, r.start, max(r.stop, r.start), key=key) - r.start
+        return bisect.bisect_right(self, x, key=key)
+
+    def insort(self, x: Any, key: Callable[[Any], Any] = None) -> None:
+        """Insert x into a sorted view after any equal elements, keeping it sorted.
+
+        Like `bisect.insort`. See `insert` for the supported views.
+
+        Args:
+            x (Any): The element to insert.
+            key (Callable[[Any], Any], optional): Function computing the comparison key of each element, including `x`.
+        """
+        i = self.bisect_right(x if key is None else key(x), key=key)
+        self.insert(i, x)
 
     # **************************************************
     #                   TRUTHINESS
@@ -227,10 +616,10 @@ class ListView:
     # **************************************************
 
     def __str__(self) -> str:
-        return f"ListView({self.source[self.slice]})"
+        return f"{type(self).__name__}({self._gather(self.slice)})"
 
     def __repr__(self) -> str:
-        return f"ListView(<list object at {hex(id(self.source))}>, start={self.start}, stop={self.stop}, step={self.step})"
+        return f"{type(self).__name__}(<{type(self.source).__name__} object at {hex(id(self.source))}>, start={self.start}, stop={self.stop}, step={self.step})"
 
     # def __add__(self, obj: Any) -> "ListView":
     #     if not isinstance(obj, self.__class__):
@@ -268,63 +657,217 @@ class ListView:
     #     return result
 
     # **************************************************
-    #               HIGHER ORDER METHODS
+    #               IN-PLACE ALGORITHMS
     # **************************************************
 
-    def apply(self, callback: Callable, *args: Any, **kwargs: Any) -> Any:
-        """Apply a function with the viewed sublist as an argument.
+    def swap(self, i: int, j: int) -> None:
+        """Swap two viewed elements in the target list.
+
+        Args:
+            i (int): Index of the first element in the view.
+            j (int): Index of the second element in the view.
+        """
+        a = self._calc_src_index(i)
+        b = self._calc_src_index(j)
+        self._will_write(range(a, a + 1))
+        self._will_write(range(b, b + 1))
+        src = self._source
+        src[a], src[b] = src[b], src[a]
+
+    def reverse(self) -> None:
+        """Reverse the viewed elements in place within the target list.
+
+        The elements are read through the reversed slice and written
+        back with a single slice assignment.
+        """
+        r = self.range
+        self._will_write(r)
+        self._source[self._range_to_slice(r)] = \
+            self._source[self._range_to_slice(r[::-1])]
+
+    def sort(self, key: Callable[[Any], Any] = None, reverse: bool = False) -> None:
+        """Stable sort of the viewed elements in place within the target list.
+
+        Equivalent to `view.apply(list.sort, key=key, reverse=reverse)`
+        but without the callback indirection: the elements are gathered
+        once, sorted, and scattered back with a single slice assignment.
+
+        Args:
+            key (Callable[[Any], Any], optional): Function computing the sort key of each element. Defaults to the elements themselves.
+            reverse (bool, optional): Sort in descending order. Defaults to False.
+        """
+        s = self.slice
+        items = self._gather(s)
+        items.sort(key=key, reverse=reverse)
+        self._scatter(s, items)
+
+    def rotate(self, k: int = 1) -> None:
+        """Rotate the viewed elements k steps to the right, like `collections.deque.rotate`.
+
+        Uses the juggling algorithm: every element is moved exactly once
+        along the gcd(len, k) cycles of the rotation, so no extra memory
+        proportional to the view is needed.
 
         Example:
             ```
             src = [i for i in range(10)]
-            view = ListView(src, 3, 8)
-            view.apply(list.sort, reverse=True)
-            print(src)  # [1, 2, 7, 6, 5, 4, 3, 8, 9]
+            view = ListView(src, 0, 10, 2)  # [0, 2, 4, 6, 8]
+            view.rotate(2)
+            print(src)  # [6, 1, 8, 3, 0, 5, 2, 7, 4, 9]
             ```
 
         Args:
-            callback (Callable): The function to call with the view as the first positional argument.
-            *args (Any): Additional positional arguments to supply to `callback`.
-            **kwargs (Any): Keyword arguments to supply to `callback`.
+            k (int, optional): Number of steps to rotate. Negative values rotate to the left. Defaults to 1.
+        """
+        n = len(self)
+        if n == 0:
+            return
+        shift = -k % n  # element at view index i + shift moves to i
+        if shift == 0:
+            return
+        self._will_write(self.range)
+        src = self._source
+        start = self.start
+        step = self.step
+        for cycle in range(math.gcd(n, shift)):
+            i = cycle
+            first = src[start + i * step]
+            while True:
+                j = i + shift
+                if j >= n:
+                    j -= n
+                if j == cycle:
+                    break
+                src[start + i * step] = src[start + j * step]
+                i = j
+            src[start + i * step] = first
+
+    # **************************************************
+    #               BULK OPERATIONS
+    # **************************************************
+
+    def _broadcast(self, other: Any) -> Iterable:
+        """Helper function for pairing an operand with each viewed element.
+
+        Args:
+            other (Any): A sized iterable (e.g. another view) of the same length as the view, or a scalar.
+
+        Raises:
+            ValueError: `other` is sized but its length differs from the view's.
 
         Returns:
-            Any: The return value of `callback`.
+            Iterable: Iterable yielding one operand per viewed element.
         """
-        copy = self.source[self.slice]
-        retval = callback(copy, *args, **kwargs)
-        self.source[self.slice] = copy
-        return retval
+        if isinstance(other, (str, bytes)) or not hasattr(other, "__len__"):
+            return itertools.repeat(other)
+        if len(other) != len(self):
+            raise ValueError(
+                f"operands could not be broadcast together with lengths {len(self)} and {len(other)}")
+        return other
 
-    def for_each(self, callback: Callable[[Any], Any]) -> None:
-        """Imitation of the JavaScript Array.forEach method.
+    def _update(self, op: Callable[[Any, Any], Any], other: Any) -> None:
+        """Helper function for replacing every viewed element x with op(x, operand).
 
         Args:
-            callback (Callable[[Any], Any]): Function to call with each viewed element as an argument.
+            op (Callable[[Any, Any], Any]): Binary operator, e.g. `operator.add`.
+            other (Any): Operand broadcast with `_broadcast`.
         """
-        for item in self:
-            callback(item)
+        s = self.slice
+        items = self._gather(s)
+        self._scatter(s, list(map(op, items, self._broadcast(other))))
+
+    def __iadd__(self, other: Any) -> "ListView":
+        self._update(operator.add, other)
+        return self
 
-    def map(self, callback: Callable[[Any], Any]) -> list:
-        """Imitation of the JavaScript Array.map method.
+    def __isub__(self, other: Any) -> "ListView":
+        self._update(operator.sub, other)
+        return self
+
+    def __imul__(self, other: Any) -> "ListView":
+        self._update(operator.mul, other)
+        return self
+
+    def __itruediv__(self, other: Any) -> "ListView":
+        self._update(operator.truediv, other)
+        return self
+
+    def fill(self, value: Any) -> None:
+        """Set every viewed element to the same value.
 
         Args:
-            callback (Callable[[Any], Any]): Function to call with each viewed element as an argument.
+            value (Any): The new value of every element.
+        """
+        self._scatter(self.slice, [value] * len(self))
 
-        Returns:
-            list: List of items returned from `callback`.
+    def clip(self, lower: Any = None, upper: Any = None) -> None:
+        """Limit the viewed elements to the closed interval [lower, upper].
+
+        Args:
+            lower (Any, optional): Minimum value. Defaults to no lower bound.
+            upper (Any, optional): Maximum value. Defaults to no upper bound.
         """
-        return [callback(item) for item in self]
+        if lower is None and upper is None:
+            return
+        s = self.slice
+        items = self._gather(s)
+        if lower is not None:
+            items = map(max, items, itertools.repeat(lower))
+        if upper is not None:
+            items = map(min, items, itertools.repeat(upper))
+        self._scatter(s, list(items))
+
+    def where(self, condition: Iterable[bool], other: Any) -> None:
+        """Keep the viewed elements where condition is true and replace the rest with other.
 
-    def filter(self, predicate: Callable[[Any], bool]) -> list:
-        """Imitation of the JavaScript Array.filter method.
+        Example:
+            ```
+            src = [3, -1, 4, -1, 5]
+            view = ListView(src)
+            view.where([x >= 0 for x in src], 0)
+            print(src)  # [3, 0, 4, 0, 5]
+            ```
 
         Args:
-            predicate (Callable[[Any], bool]): Function to call with each viewed element as an argument.
+            condition (Iterable[bool]): Sized iterable of flags with the same length as the view.
+            other (Any): Replacement value, or a sized iterable of replacements with the same length as the view.
+        """
+        if len(condition) != len(self):
+            raise ValueError(
+                f"condition has length {len(condition)}, expected {len(self)}")
+        s = self.slice
+        items = self._gather(s)
+        self._scatter(s, [x if keep else y for x, keep, y in
+                          zip(items, condition, self._broadcast(other))])
+
+    # **************************************************
+    #               HIGHER ORDER METHODS
+    # **************************************************
+
+    def apply(self, callback: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Apply a function with the viewed sublist as an argument.
+
+        Example:
+            ```
+            src = [i for i in range(10)]
+            view = ListView(src, 3, 8)
+            view.apply(list.sort, reverse=True)
+            print(src)  # [1, 2, 7, 6, 5, 4, 3, 8, 9]
+            ```
+
+        Args:
+            callback (Callable): The function to call with the view as the first positional argument.
+            *args (Any): Additional positional arguments to supply to `callback`.
+            **kwargs (Any): Keyword arguments to supply to `callback`.
 
         Returns:
-            list: List of items in the target list for which `predicate` returned `True`.
+            Any: The return value of `callback`.
         """
-        return [item for item in self if predicate(item)]
+        s = self.slice
+        copy = self._gather(s)
+        retval = callback(copy, *args, **kwargs)
+        self._scatter(s, copy)
+        return retval
 
 
 def test_code() -> None:
@@ -0,0 +1,316 @@
+"""
+nd_view.py
+18 October 2026 01:54:14
+
+Implements the NDView class, an N-dimensional generalization of
+ListView over a flat list.
+
+A view is an offset into the source list plus a shape and one stride
+per axis, like a NumPy array over its buffer. Indexing composes that
+arithmetic instead of copying, so blocks, transposes, rows, columns and
+diagonals are all views that read and write the same source list:
+
+    src = list(range(12))          # 3x4 matrix stored row-major
+    m = NDView(src, (3, 4))
+    m[1:, 2:].tolist()             # [[6, 7], [10, 11]]
+    m.T.shape                      # (4, 3)
+    col = m[:, 1]                  # ListView(src, 1, 13, 4)
+    col[:] = [0, 0, 0]             # writes src[1], src[5], src[9]
+
+Results with one axis left are plain ListViews, so every ListView
+method (sort, map, rolling aggregates, ...) works on rows, columns and
+diagonals. Indexing down to a single element returns the element.
+"""
+
+from typing import Any, Iterable, Iterator, Union
+
+from list_view import ListView
+
+# Type Aliases
+NDIndex = Union[int, slice, tuple]
+
+
+def _contiguous_strides(shape: tuple) -> tuple:
+    """Return the strides of a row-major (C-order) layout of a shape."""
+    strides = []
+    stride = 1
+    for n in reversed(shape):
+        strides.append(stride)
+        stride *= n
+    return tuple(reversed(strides))
+
+
+class NDView:
+    """Mutable N-dimensional strided view of a flat list."""
+
+    __slots__ = ("_source", "_shape", "_strides", "_offset")
+
+    def __init__(self, source: list, shape: Iterable[int], strides: Iterable[int] = None, offset: int = 0) -> None:
+        """Construct an N-dimensional view of the source list.
+
+        Element (i, j, ...) of the view is `source[offset + i*strides[0] + j*strides[1] + ...]`.
+
+        Args:
+            source (list): The list object to track.
+            shape (Iterable[int]): The length of each axis.
+            strides (Iterable[int], optional): The distance in the source between consecutive elements along each axis. May be negative. Defaults to a row-major layout of `shape`.
+            offset (int, optional): The source index of element (0, 0, ...). Defaults to 0.
+
+        Raises:
+            TypeError: `source` is not a list.
+            ValueError: `shape` and `strides` have different lengths, or the view reaches outside the source.
+        """
+        if not isinstance(source, list):
+            raise TypeError(
+                f"source must be a list, not {type(source).__name__!r}")
+        shape = tuple(shape)
+        strides = _contiguous_strides(shape) if strides is None else tuple(strides)
+        if len(shape) != len(strides):
+            raise ValueError("shape and strides must have the same length")
+        for param in (*shape, *strides, offset):
+            if not isinstance(param, int):
+                raise TypeError(
+                    f"{type(param).__name__!r} object cannot be interpreted as an integer")
+        if any(n < 0 for n in shape):
+            raise ValueError("negative dimensions are not allowed")
+        self._source = source
+        self._shape = shape
+        self._strides = strides
+        self._offset = offset
+        if self.size:
+            lo, hi = self._extent()
+            if lo < 0 or hi >= len(source):
+                raise ValueError(
+                    f"view reaches source indices {lo} to {hi}, outside a source of length {len(source)}")
+
+    # **************************************************
+    #                   PROPERTIES
+    # **************************************************
+
+    @property
+    def source(self) -> list:
+        """The list that this view tracks."""
+        return self._source
+
+    @property
+    def shape(self) -> tuple:
+        """The length of each axis."""
+        return self._shape
+
+    @property
+    def strides(self) -> tuple:
+        """The distance in the source between consecutive elements along each axis."""
+        return self._strides
+
+    @property
+    def offset(self) -> int:
+        """The source index of the first element."""
+        return self._offset
+
+    @property
+    def ndim(self) -> int:
+        """The number of axes."""
+        return len(self._shape)
+
+    @property
+    def size(self) -> int:
+        """The total number of viewed elements."""
+        size = 1
+        for n in self._shape:
+            size *= n
+        return size
+
+    @property
+    def T(self) -> "NDView":
+        """The transposed view, with the order of the axes reversed."""
+        return self.transpose()
+
+    # **************************************************
+    #               HELPER METHODS
+    # **************************************************
+
+    def _extent(self) -> tuple[int, int]:
+        """Helper function returning the lowest and highest source index reached by a non-empty view."""
+        lo = hi = self._offset
+        for n, stride in zip(self._shape, self._strides):
+            if stride > 0:
+                hi += (n - 1) * stride
+            else:
+                lo += (n - 1) * stride
+        return lo, hi
+
+    def _require_2d(self, name: str) -> None:
+        """Helper function for rejecting views that are not 2-D."""
+        if self.ndim != 2:
+            raise ValueError(
+                f"{name}() requires a 2-dimensional NDView, not {self.ndim}-dimensional")
+
+    def _normalize_key(self, key: NDIndex) -> tuple:
+        """Helper function for converting an index to one entry per axis."""
+        if not isinstance(key, tuple):
+            key = (key,)
+        if len(key) > self.ndim:
+            raise IndexError(
+                f"too many indices for {self.ndim}-dimensional NDView")
+        for index in key:
+            if not isinstance(index, (int, slice)):
+                raise TypeError(
+                    f"NDView indices must be integers, slices or tuples of them, not {type(index).__name__!r}")
+        return key + (slice(None),) * (self.ndim - len(key))
+
+    def _locate(self, key: NDIndex) -> tuple[int, tuple, tuple]:
+        """Helper function for composing an index with the view's layout.
+
+        Args:
+            key (NDIndex): Integer, slice, or tuple of integers and slices, one per leading axis.
+
+        Raises:
+            IndexError: An integer index is out of range of its axis.
+
+        Returns:
+            tuple[int, tuple, tuple]: Offset, shape and strides of the selected elements. Axes indexed by integers are dropped.
+        """
+        offset = self._offset
+        shape = []
+        strides = []
+        for index, n, stride in zip(self._normalize_key(key), self._shape, self._strides):
+            r = range(n)[index] if isinstance(index, slice) else None
+            if r is None:
+                try:
+                    offset += range(n)[index] * stride
+                except IndexError:
+                    raise IndexError("NDView index out of range") from None
+            else:
+                offset += r.start * stride
+                shape.append(len(r))
+                strides.append(r.step * stride)
+        return offset, tuple(shape), tuple(strides)
+
+    def _build(self, offset: int, shape: tuple, strides: tuple) -> Union["NDView", ListView, Any]:
+        """Helper function for wrapping a layout of the source in the simplest matching object.
+
+        Returns:
+            Union[NDView, ListView, Any]: The element for 0 axes, a ListView for 1 axis, an NDView otherwise.
+        """
+        if not shape:
+            return self._source[offset]
+        if len(shape) == 1:
+            n, step = shape[0], strides[0]
+            if n == 0 or step == 0:
+                # a zero stride (e.g. from a broadcast layout) cannot be a ListView
+                return NDView(self._source, shape, strides, offset) if n else ListView(self._source, offset, offset)
+            return ListView(self._source, offset, offset + n * step, step)
+        return NDView(self._source, shape, strides, offset)
+
+    # **************************************************
+    #           ACCESSING AND MUTATING
+    # **************************************************
+
+    def __getitem__(self, key: NDIndex) -> Union["NDView", ListView, Any]:
+        """Return a zero-copy view of the selected elements, or a single element."""
+        return self._build(*self._locate(key))
+
+    def __setitem__(self, key: NDIndex, value: Any) -> None:
+        """Assign an element, or a nested sequence shaped like the selected elements."""
+        offset, shape, strides = self._locate(key)
+        if not shape:
+            target = ListView(self._source, offset, offset + 1)
+            target[0] = value
+            return
+        target = self._build(offset, shape, strides)
+        if isinstance(target, ListView):
+            target[:] = value
+            return
+        if len(value) != shape[0]:
+            raise ValueError(
+                f"cannot assign a sequence of length {len(value)} to an axis of length {shape[0]}")
+        for i, row in enumerate(value):
+            target[i] = row
+
+    def __len__(self) -> int:
+        if not self._shape:
+            raise TypeError("len() of a 0-dimensional NDView")
+        return self._shape[0]
+
+    def __iter__(self) -> Iterator:
+        """Iterate over the sub-views along the first axis."""
+        for i in range(len(self)):
+            yield self[i]
+
+    def rows(self) -> Iterator[ListView]:
+        """Yield a view of each row of a 2-D view."""
+        self._require_2d("rows")
+        return iter(self)
+
+    def columns(self) -> Iterator[ListView]:
+        """Yield a view of each column of a 2-D view."""
+        self._require_2d("columns")
+        return iter(self.T)
+
+    def transpose(self, *axes: int) -> "NDView":
+        """Return a view with its axes permuted.
+
+        Args:
+            *axes (int): The new order of the axes. Defaults to reversing them.
+
+        Returns:
+            NDView: View of the same source list.
+        """
+        if not axes:
+            axes = tuple(reversed(range(self.ndim)))
+        if sorted(axes) != list(range(self.ndim)):
+            raise ValueError("axes must be a permutation of the view's axes")
+        return NDView(self._source,
+                      (self._shape[axis] for axis in axes),
+                      (self._strides[axis] for axis in axes),
+                      self._offset)
+
+    def diagonal(self, k: int = 0) -> ListView:
+        """Return a view of a diagonal of a 2-D view.
+
+        Example:
+            ```
+            m = NDView(list(range(12)), (3, 4))
+            list(m.diagonal())   # [0, 5, 10]
+            list(m.diagonal(1))  # [1, 6, 11]
+            list(m.diagonal(-1)) # [4, 9]
+            ```
+
+        Args:
+            k (int, optional): Diagonal above (positive) or below (negative) the main one. Defaults to 0.
+
+        Returns:
+            ListView: View of the same source list.
+        """
+        self._require_2d("diagonal")
+        (rows, cols), (row_stride, col_stride) = self._shape, self._strides
+        if k >= 0:
+            n = max(min(rows, cols - k), 0)
+            offset = self._offset + k * col_stride
+        else:
+            n = max(min(rows + k, cols), 0)
+            offset = self._offset - k * row_stride
+        return self._build(offset, (n,), (row_stride + col_stride,))
+
+    def tolist(self) -> Union[list, Any]:
+        """Return the viewed elements as nested lists."""
+        if not self._shape:
+            return self._source[self._offset]
+        if self.ndim == 1:
+            return [self._source[self._offset + i * self._strides[0]] for i in range(self._shape[0])]
+        return [row.tolist() if isinstance(row, NDView) else list(row) for row in self]
+
+    # **************************************************
+    #               REPRESENTATIONS
+    # **************************************************
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, NDView):
+            return self._shape == other._shape and self.tolist() == other.tolist()
+        return NotImplemented
+
+    def __str__(self) -> str:
+        return str(self.tolist())
+
+    def __repr__(self) -> str:
+        return f"NDView(shape={self._shape}, strides={self._strides}, offset={self._offset})"
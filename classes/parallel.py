@@ -0,0 +1,236 @@
+"""
+parallel.py
+18 October 2026 01:45:45
+
+Parallel imitations of the higher-order ListView methods: map, filter,
+and reduce run over the chunks of `ListView.partition` in a thread or
+process pool. `parallel_sort` sorts the chunks in the pool and merges
+the sorted runs back into the view.
+
+For process pools, list chunks are pickled to the workers. The elements
+of a BufferView are instead copied once into shared memory, and each
+worker attaches to its chunk there, so numeric data is never pickled.
+Callbacks must be picklable (e.g. module-level functions) when using
+processes.
+"""
+
+import contextlib
+import functools
+import itertools
+import os
+import struct
+from array import array, typecodes
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Iterable, Iterator
+
+from buffer_view import BufferView
+from list_view import ListView
+from pipeline import MISSING
+
+
+def _map_chunk(callback: Callable[[Any], Any], items: Iterable) -> list:
+    return list(map(callback, items))
+
+
+def _filter_chunk(predicate: Callable[[Any], bool], items: Iterable) -> list:
+    return list(filter(predicate, items))
+
+
+def _reduce_chunk(callback: Callable[[Any, Any], Any], items: Iterable) -> Any:
+    return functools.reduce(callback, items)
+
+
+def _sort_chunk(options: tuple, items: Iterable) -> list:
+    key, reverse = options
+    return sorted(items, key=key, reverse=reverse)
+
+
+def _sort_chunk_in_place(options: tuple, memory: memoryview) -> None:
+    """Sort a chunk of shared memory in place, so the result does not need to be pickled back."""
+    fmt = memory.format
+    items = _sort_chunk(options, memory)
+    memory[:] = array(fmt, items) if fmt in typecodes else \
+        memoryview(struct.pack(f"{len(items)}{fmt}", *items)).cast(fmt)
+
+
+def _shared_chunk(task: Callable, callback: Callable, name: str, fmt: str, lo: int, hi: int) -> Any:
+    """Worker entry point running a chunk task on elements lo:hi of a shared memory block.
+
+    Args:
+        task (Callable): One of the chunk functions above.
+        callback (Callable): Callback to pass on to `task`.
+        name (str): Name of the shared memory block.
+        fmt (str): Struct format character of the elements.
+        lo (int): Index of the first element of the chunk.
+        hi (int): Index one past the last element of the chunk.
+
+    Returns:
+        Any: The return value of `task`.
+    """
+    shm = SharedMemory(name)
+    try:
+        itemsize = struct.calcsize(fmt)
+        memory = shm.buf[lo * itemsize:hi * itemsize].cast(fmt)
+        try:
+            return task(callback, memory)
+        finally:
+            memory.release()
+    finally:
+        shm.close()
+
+
+def _executor(workers: int, threads: bool) -> Executor:
+    return ThreadPoolExecutor(workers) if threads else ProcessPoolExecutor(workers)
+
+
+def _run(task: Callable, callback: Callable, view: ListView, workers: int = None, threads: bool = False) -> list:
+    """Run a chunk task on every non-empty chunk of a view in a pool.
+
+    Args:
+        task (Callable): One of the chunk functions above.
+        callback (Callable): Callback to pass on to `task`.
+        view (ListView): The view to process.
+        workers (int, optional): Number of chunks and pool workers. Defaults to the number of CPUs.
+        threads (bool, optional): Use a thread pool instead of a process pool. Defaults to False.
+
+    Returns:
+        list: The result of `task` for each chunk, in order.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = [chunk for chunk in view.partition(workers) if chunk]
+    if not chunks:
+        return []
+    if threads or not isinstance(view, BufferView):
+        # threads share the views; processes receive pickled lists
+        items = chunks if threads else map(list, chunks)
+        with _executor(workers, threads) as executor:
+            return list(executor.map(task, itertools.repeat(callback), items))
+
+    with _shared_copy(view) as shm:
+        return _run_shared(task, callback, shm, view.format, chunks, workers)
+
+
+@contextlib.contextmanager
+def _shared_copy(view: BufferView) -> Iterator[SharedMemory]:
+    """Copy the elements of a BufferView contiguously into a shared memory block for the duration of a with block."""
+    nbytes = len(view) * view.itemsize
+    shm = SharedMemory(create=True, size=max(nbytes, 1))
+    try:
+        shared = shm.buf[:nbytes].cast(view.format)
+        shared[:] = view.memory
+        shared.release()
+        yield shm
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _run_shared(task: Callable, callback: Callable, shm: SharedMemory, fmt: str, chunks: list, workers: int) -> list:
+    """Run a chunk task in a process pool on consecutive chunks of a shared memory block.
+
+    Returns:
+        list: The result of `task` for each chunk, in order.
+    """
+    bounds = list(itertools.accumulate(map(len, chunks), initial=0))
+    with _executor(workers, False) as executor:
+        return list(executor.map(_shared_chunk,
+                                 itertools.repeat(task),
+                                 itertools.repeat(callback),
+                                 itertools.repeat(shm.name),
+                                 itertools.repeat(fmt),
+                                 bounds[:-1], bounds[1:]))
+
+
+def parallel_map(view: ListView, callback: Callable[[Any], Any], workers: int = None, threads: bool = False) -> list:
+    """Parallel imitation of the JavaScript Array.map method.
+
+    Args:
+        view (ListView): The view whose elements to map.
+        callback (Callable[[Any], Any]): Function to call with each viewed element as an argument.
+        workers (int, optional): Number of chunks and pool workers. Defaults to the number of CPUs.
+        threads (bool, optional): Use a thread pool instead of a process pool. Defaults to False.
+
+    Returns:
+        list: List of items returned from `callback`, in view order.
+    """
+    chunks = _run(_map_chunk, callback, view, workers, threads)
+    return list(itertools.chain.from_iterable(chunks))
+
+
+def parallel_filter(view: ListView, predicate: Callable[[Any], bool], workers: int = None, threads: bool = False) -> list:
+    """Parallel imitation of the JavaScript Array.filter method.
+
+    Args:
+        view (ListView): The view whose elements to filter.
+        predicate (Callable[[Any], bool]): Function to call with each viewed element as an argument.
+        workers (int, optional): Number of chunks and pool workers. Defaults to the number of CPUs.
+        threads (bool, optional): Use a thread pool instead of a process pool. Defaults to False.
+
+    Returns:
+        list: List of viewed items for which `predicate` returned `True`, in view order.
+    """
+    chunks = _run(_filter_chunk, predicate, view, workers, threads)
+    return list(itertools.chain.from_iterable(chunks))
+
+
+def parallel_reduce(view: ListView, callback: Callable[[Any, Any], Any], initial: Any = MISSING, workers: int = None, threads: bool = False) -> Any:
+    """Parallel imitation of the JavaScript Array.reduce method.
+
+    Each chunk is reduced separately and the partial results are then
+    reduced in order, so `callback` must be associative.
+
+    Args:
+        view (ListView): The view whose elements to reduce.
+        callback (Callable[[Any, Any], Any]): Associative function to call with the accumulator and each element.
+        initial (Any, optional): Starting value of the accumulator. Defaults to the first viewed element.
+        workers (int, optional): Number of chunks and pool workers. Defaults to the number of CPUs.
+        threads (bool, optional): Use a thread pool instead of a process pool. Defaults to False.
+
+    Raises:
+        TypeError: The view is empty and no initial value was given.
+
+    Returns:
+        Any: The final value of the accumulator.
+    """
+    partials = _run(_reduce_chunk, callback, view, workers, threads)
+    if initial is MISSING:
+        return functools.reduce(callback, partials)
+    return functools.reduce(callback, partials, initial)
+
+
+def parallel_sort(view: ListView, key: Callable[[Any], Any] = None, reverse: bool = False, workers: int = None, threads: bool = False) -> None:
+    """Stable sort of the viewed elements in place, sorting chunks of the view in parallel.
+
+    Each chunk of `view.partition(workers)` is sorted in a worker. The
+    elements of a BufferView are sorted in place in shared memory;
+    other views send their chunks to the workers and get sorted lists
+    back. The sorted runs are then merged with one `list.sort` call,
+    which finds the runs and merges them in C, and written back to the
+    view with one slice assignment. The result is the same as
+    `view.sort(key=key, reverse=reverse)`.
+
+    Args:
+        view (ListView): The view whose elements to sort.
+        key (Callable[[Any], Any], optional): Function computing the sort key of each element. Must be picklable when using processes. Defaults to the elements themselves.
+        reverse (bool, optional): Sort in descending order. Defaults to False.
+        workers (int, optional): Number of chunks and pool workers. Defaults to the number of CPUs.
+        threads (bool, optional): Use a thread pool instead of a process pool. Defaults to False.
+    """
+    workers = workers or os.cpu_count() or 1
+    options = (key, reverse)
+    if threads or not isinstance(view, BufferView):
+        runs = _run(_sort_chunk, options, view, workers, threads)
+        merged = list(itertools.chain.from_iterable(runs))
+    else:
+        chunks = [chunk for chunk in view.partition(workers) if chunk]
+        if not chunks:
+            return
+        with _shared_copy(view) as shm:
+            _run_shared(_sort_chunk_in_place, options, shm, view.format, chunks, workers)
+            shared = shm.buf[:len(view) * view.itemsize].cast(view.format)
+            merged = shared.tolist()
+            shared.release()
+    # Timsort merges presorted runs in O(n log k); see the commit notes
+    merged.sort(key=key, reverse=reverse)
+    view[:] = merged
@@ -0,0 +1,201 @@
+"""
+pipeline.py
+18 October 2026 01:40:30
+
+Implements the Pipeline class, a lazy chain of map/filter stages over
+an iterable (usually a ListView), and the PipelineMethods mixin giving
+view classes the pipeline-building higher-order methods.
+
+No stage runs until the pipeline is consumed by iteration, `to_list`,
+`reduce`, `for_each`, or `first`. All stages are fused into a single
+pass over the source, so chaining does not build intermediate lists.
+"""
+
+import functools
+import itertools
+from typing import Any, Callable, Iterable, Iterator
+
+# sentinel for "no initial value" since None is a valid reduce initializer
+MISSING = object()
+
+
+class Pipeline:
+    """Lazy, chainable sequence of map/filter stages over an iterable."""
+
+    __slots__ = ("_source", "_stages")
+
+    def __init__(self, source: Iterable, stages: tuple = ()) -> None:
+        """Construct a pipeline over an iterable.
+
+        Args:
+            source (Iterable): The iterable to pull elements from. It is iterated anew every time the pipeline is consumed.
+            stages (tuple, optional): Functions each taking and returning an iterator. Defaults to no stages.
+        """
+        self._source = source
+        self._stages = stages
+
+    @property
+    def source(self) -> Iterable:
+        """The iterable that this pipeline pulls elements from."""
+        return self._source
+
+    def _then(self, stage: Callable[[Iterator], Iterator]) -> "Pipeline":
+        """Return a new pipeline with an additional stage appended.
+
+        Pipelines are immutable, so a partially built pipeline can be branched.
+        """
+        return type(self)(self._source, self._stages + (stage,))
+
+    # **************************************************
+    #                   STAGES
+    # **************************************************
+
+    def map(self, callback: Callable[[Any], Any]) -> "Pipeline":
+        """Lazily transform each element.
+
+        Args:
+            callback (Callable[[Any], Any]): Function to call with each element as an argument.
+
+        Returns:
+            Pipeline: New pipeline yielding the items returned from `callback`.
+        """
+        return self._then(functools.partial(map, callback))
+
+    def filter(self, predicate: Callable[[Any], bool]) -> "Pipeline":
+        """Lazily keep only the elements satisfying a predicate.
+
+        Args:
+            predicate (Callable[[Any], bool]): Function to call with each element as an argument.
+
+        Returns:
+            Pipeline: New pipeline yielding the items for which `predicate` returned `True`.
+        """
+        return self._then(functools.partial(filter, predicate))
+
+    def take(self, n: int) -> "Pipeline":
+        """Stop the pipeline after at most n elements.
+
+        Upstream stages are not evaluated past the nth element.
+
+        Args:
+            n (int): Maximum number of elements to yield.
+
+        Returns:
+            Pipeline: New pipeline yielding at most `n` items.
+        """
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        return self._then(lambda items: itertools.islice(items, n))
+
+    # **************************************************
+    #                   TERMINALS
+    # **************************************************
+
+    def __iter__(self) -> Iterator:
+        items = iter(self._source)
+        for stage in self._stages:
+            items = stage(items)
+        return items
+
+    def to_list(self) -> list:
+        """Run the pipeline and collect the results into a list."""
+        return list(self)
+
+    def for_each(self, callback: Callable[[Any], Any]) -> None:
+        """Imitation of the JavaScript Array.forEach method. Runs the pipeline.
+
+        Args:
+            callback (Callable[[Any], Any]): Function to call with each resulting element as an argument.
+        """
+        for item in self:
+            callback(item)
+
+    def reduce(self, callback: Callable[[Any, Any], Any], initial: Any = MISSING) -> Any:
+        """Imitation of the JavaScript Array.reduce method. Runs the pipeline.
+
+        Args:
+            callback (Callable[[Any, Any], Any]): Function to call with the accumulator and each resulting element.
+            initial (Any, optional): Starting value of the accumulator. Defaults to the first resulting element.
+
+        Raises:
+            TypeError: The pipeline is empty and no initial value was given.
+
+        Returns:
+            Any: The final value of the accumulator.
+        """
+        if initial is MISSING:
+            return functools.reduce(callback, self)
+        return functools.reduce(callback, self, initial)
+
+    def first(self, default: Any = None) -> Any:
+        """Run the pipeline only until its first result.
+
+        Args:
+            default (Any, optional): Value to return if the pipeline is empty. Defaults to None.
+
+        Returns:
+            Any: The first resulting element, or `default`.
+        """
+        return next(iter(self), default)
+
+    # **************************************************
+    #               REPRESENTATIONS
+    # **************************************************
+
+    def __repr__(self) -> str:
+        return f"Pipeline({self._source!r}, stages={len(self._stages)})"
+
+
+class PipelineMethods:
+    """Mixin adding for_each, map, filter and reduce, run through a Pipeline over the iterable itself."""
+
+    __slots__ = ()
+
+    def for_each(self, callback: Callable[[Any], Any]) -> None:
+        """Imitation of the JavaScript Array.forEach method.
+
+        Args:
+            callback (Callable[[Any], Any]): Function to call with each element as an argument.
+        """
+        Pipeline(self).for_each(callback)
+
+    def map(self, callback: Callable[[Any], Any]) -> Pipeline:
+        """Imitation of the JavaScript Array.map method. Lazy, like `Pipeline.map`.
+
+        Example:
+            ```
+            view = ListView(list(range(10)), 1, 8, 2)
+            view.map(lambda x: x * 10).filter(lambda x: x > 20).to_list()
+            # [30, 50, 70]
+            ```
+
+        Args:
+            callback (Callable[[Any], Any]): Function to call with each element as an argument.
+
+        Returns:
+            Pipeline: Lazy sequence of items returned from `callback`.
+        """
+        return Pipeline(self).map(callback)
+
+    def filter(self, predicate: Callable[[Any], bool]) -> Pipeline:
+        """Imitation of the JavaScript Array.filter method. Lazy, like `Pipeline.filter`.
+
+        Args:
+            predicate (Callable[[Any], bool]): Function to call with each element as an argument.
+
+        Returns:
+            Pipeline: Lazy sequence of elements for which `predicate` returned `True`.
+        """
+        return Pipeline(self).filter(predicate)
+
+    def reduce(self, callback: Callable[[Any, Any], Any], initial: Any = MISSING) -> Any:
+        """Imitation of the JavaScript Array.reduce method.
+
+        Args:
+            callback (Callable[[Any, Any], Any]): Function to call with the accumulator and each element.
+            initial (Any, optional): Starting value of the accumulator. Defaults to the first element.
+
+        Returns:
+            Any: The final value of the accumulator.
+        """
+        return Pipeline(self).reduce(callback, initial)
@@ -0,0 +1,235 @@
+"""
+record_view.py
+18 October 2026 01:53:15
+
+Implements the RecordView class, a ListView over the fixed-width
+binary records of a memory-mapped file, and the RecordFile sequence it
+indexes into.
+
+Each record is laid out by a `struct` format and decoded only when it
+is read, so multi-GB files can be scanned and patched without reading
+them into a list:
+
+    with RecordView("samples.bin", "<Id") as view:  # (uint32, double)
+        evens = view.subview(slice(None, None, 2))
+        hot = evens.filter(lambda rec: rec[1] > 100.0).take(10).to_list()
+
+Records of a single field are decoded to the bare value instead of a
+1-tuple. Slices are decoded in bulk with `struct.iter_unpack` after
+gathering the strided bytes in C, and slice assignments are encoded
+in bulk and copied into the mapping with memoryview slice assignments.
+"""
+
+import itertools
+import mmap
+import operator
+import os
+import struct
+from typing import Any, Iterable, Iterator, Union
+
+from list_view import ListIndex, ListView
+
+PathLike = Union[str, bytes, os.PathLike]
+
+
+class RecordFile:
+    """Mutable sequence of the fixed-width records of a memory-mapped file."""
+
+    __slots__ = ("_file", "_mmap", "_bytes", "_struct", "_scalar", "_length")
+
+    BLOCK = 4096  # records decoded together when iterating
+
+    def __init__(self, path: PathLike, fmt: str, writable: bool = False) -> None:
+        """Memory-map a file of records.
+
+        Args:
+            path (PathLike): Path of the file. Its size must be a non-zero multiple of the record size.
+            fmt (str): The `struct` format of one record, e.g. "<Id".
+            writable (bool, optional): Map the file for writing. Defaults to False.
+        """
+        self._struct = struct.Struct(fmt)
+        size = self._struct.size
+        if size == 0:
+            raise ValueError("record format must not be empty")
+        self._scalar = len(self._struct.unpack(bytes(size))) == 1
+        self._file = open(path, "r+b" if writable else "rb")
+        try:
+            file_size = os.fstat(self._file.fileno()).st_size
+            if file_size == 0:
+                raise ValueError("cannot map an empty file")
+            if file_size % size:
+                raise ValueError(
+                    f"file size {file_size} is not a multiple of the record size {size}")
+            access = mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=access)
+        except BaseException:
+            self._file.close()
+            raise
+        self._bytes = memoryview(self._mmap)
+        self._length = file_size // size
+
+    # **************************************************
+    #                   PROPERTIES
+    # **************************************************
+
+    @property
+    def format(self) -> str:
+        """The struct format of one record."""
+        return self._struct.format
+
+    @property
+    def record_size(self) -> int:
+        """The size of one record in bytes."""
+        return self._struct.size
+
+    @property
+    def closed(self) -> bool:
+        """Whether the mapping has been closed."""
+        return self._mmap.closed
+
+    def flush(self) -> None:
+        """Write changes to the mapping back to the file."""
+        self._mmap.flush()
+
+    def close(self) -> None:
+        """Unmap and close the file. Views of it can no longer be used."""
+        if not self._mmap.closed:
+            self._bytes.release()
+            self._mmap.close()
+            self._file.close()
+
+    # **************************************************
+    #               HELPER METHODS
+    # **************************************************
+
+    def _byte_slices(self, records: range) -> Iterable[slice]:
+        """Helper function yielding, for each byte of a record, the byte slice covering that byte in every record of a range."""
+        size = self._struct.size
+        step = records.step * size
+        for j in range(size):
+            start = records.start * size + j
+            stop = start + len(records) * step
+            yield slice(start, stop if stop >= 0 else None, step)
+
+    def _decode(self, data: Any) -> list:
+        records = self._struct.iter_unpack(data)
+        if self._scalar:
+            return list(map(operator.itemgetter(0), records))
+        return list(records)
+
+    def _encode(self, values: Iterable) -> bytes:
+        if self._scalar:
+            return b"".join(map(self._struct.pack, values))
+        return b"".join(itertools.starmap(self._struct.pack, values))
+
+    # **************************************************
+    #           ACCESSING AND MUTATING
+    # **************************************************
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: ListIndex) -> Any:
+        size = self._struct.size
+        if isinstance(index, slice):
+            r = range(self._length)[index]
+            if not r:
+                return []
+            if r.step == 1:
+                return self._decode(self._bytes[r.start * size:r.stop * size])
+            # gather the strided records into contiguous bytes first
+            data = bytearray(len(r) * size)
+            for j, byte_slice in enumerate(self._byte_slices(r)):
+                data[j::size] = self._bytes[byte_slice]
+            return self._decode(data)
+        i = range(self._length)[index]
+        record = self._struct.unpack_from(self._bytes, i * size)
+        return record[0] if self._scalar else record
+
+    def __setitem__(self, index: ListIndex, value: Any) -> None:
+        size = self._struct.size
+        if isinstance(index, slice):
+            r = range(self._length)[index]
+            data = self._encode(value)
+            if len(data) != len(r) * size:
+                raise ValueError(
+                    f"attempt to assign {len(data) // size} records to a slice of {len(r)} records")
+            if not r:
+                return
+            if r.step == 1:
+                self._bytes[r.start * size:r.stop * size] = data
+                return
+            for j, byte_slice in enumerate(self._byte_slices(r)):
+                self._bytes[byte_slice] = data[j::size]
+            return
+        i = range(self._length)[index]
+        values = (value,) if self._scalar else value
+        self._struct.pack_into(self._bytes, i * size, *values)
+
+    def __delitem__(self, index: ListIndex) -> None:
+        raise TypeError("records cannot be deleted from a RecordFile")
+
+    def insert(self, index: int, value: Any) -> None:
+        raise TypeError("records cannot be inserted into a RecordFile")
+
+    def __iter__(self) -> Iterator:
+        # decode a block of records at a time instead of the whole file
+        for lo in range(0, self._length, self.BLOCK):
+            yield from self[lo:lo + self.BLOCK]
+
+    def __repr__(self) -> str:
+        return f"RecordFile(<{self._file.name!r}>, format={self.format!r}, length={self._length})"
+
+
+class RecordView(ListView):
+    """Mutable strided view of the records of a memory-mapped file."""
+
+    __slots__ = ()
+
+    def __init__(self, source: Union[PathLike, RecordFile], fmt: str = None, start: int = 0, stop: int = ..., step: int = 1, writable: bool = False) -> None:
+        """Construct a view of the records of a file specified with start:stop:step positioning.
+
+        Args:
+            source (Union[PathLike, RecordFile]): Path of the file to map, or an already mapped RecordFile to share.
+            fmt (str, optional): The `struct` format of one record. Required when `source` is a path.
+            start (int, optional): The start record index to track. Defaults to 0.
+            stop (int, optional): The end record index to track. Exclusive like in ranges and slices. Defaults to the number of records.
+            step (int, optional): The stride of the view. Defaults to 1. If it is negative, start:stop:step works the same as in ranges and slices.
+            writable (bool, optional): Map the file for writing. Ignored when `source` is a RecordFile. Defaults to False.
+        """
+        if not isinstance(source, RecordFile):
+            if fmt is None:
+                raise TypeError("fmt is required when source is a path")
+            source = RecordFile(source, fmt, writable)
+        elif fmt is not None and struct.calcsize(fmt) != source.record_size:
+            raise ValueError("fmt does not match the record format of source")
+        super().__init__(source, start, stop, step)
+
+    def __enter__(self) -> "RecordView":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unmap and close the underlying file, invalidating every view of it."""
+        self._source.close()
+
+    def flush(self) -> None:
+        """Write changes to the mapping back to the file."""
+        self._source.flush()
+
+    # **************************************************
+    #               HELPER METHODS
+    # **************************************************
+
+    @staticmethod
+    def _storage(source: Any) -> RecordFile:
+        if not isinstance(source, RecordFile):
+            raise TypeError(
+                f"source must be a RecordFile, not {type(source).__name__!r}")
+        return source
+
+    @classmethod
+    def _from_bounds(cls, source: RecordFile, start: int, stop: int, step: int) -> "RecordView":
+        return cls(source, None, start, stop, step)
@@ -0,0 +1,231 @@
+"""
+ring_view.py
+18 October 2026 02:12:49
+
+Implements the RingView class, a circular buffer over a fixed region
+of a list for streaming windows.
+
+The region is described like a ListView (start:stop:step of a source
+list) and never moves. A head offset marks the oldest element, so
+appending to a full ring overwrites the oldest slot in O(1) instead of
+shifting the whole window:
+
+    samples = [None] * 4
+    ring = RingView(samples)
+    ring.extend([1, 2, 3, 4, 5, 6])
+    ring.append(7)
+    list(ring)   # [4, 5, 6, 7]
+    samples      # [7, 4, 5, 6]
+    ring[0]      # 4 (oldest)
+    ring[-1]     # 7 (newest)
+
+Logically, the ring is the part of the region from the head to its end
+followed by the part from its start, so every read and write goes
+through at most two contiguous ListViews (see `segments`) instead of
+doing modulo arithmetic per element.
+"""
+
+import itertools
+from typing import Any, Iterable, Iterator, Union
+
+from chain_view import ChainView
+from list_view import ListIndex, ListView
+from pipeline import PipelineMethods
+
+
+class RingView(PipelineMethods):
+    """Fixed-capacity circular buffer over a region of a list."""
+
+    __slots__ = ("_region", "_head", "_length")
+
+    def __init__(self, source: list, start: int = 0, stop: int = ..., step: int = 1, full: bool = False) -> None:
+        """Construct a ring over the region of the source list specified with start:stop:step positioning.
+
+        Args:
+            source (list): The list object to track.
+            start (int, optional): The start index of the region. Defaults to 0.
+            stop (int, optional): The end index of the region. Exclusive like in ranges and slices. Defaults to `len(source)`.
+            step (int, optional): The stride of the region. Defaults to 1.
+            full (bool, optional): Treat the elements already in the region as the ring's contents, oldest first. Defaults to False, an empty ring.
+
+        Raises:
+            ValueError: The region is empty.
+        """
+        self._region = ListView(source, start, stop, step)
+        if not self._region:
+            raise ValueError("RingView region must not be empty")
+        self._head = 0
+        self._length = len(self._region) if full else 0
+
+    # **************************************************
+    #                   PROPERTIES
+    # **************************************************
+
+    @property
+    def source(self) -> list:
+        """The list that this ring tracks."""
+        return self._region.source
+
+    @property
+    def region(self) -> ListView:
+        """A view of the whole region the ring cycles over, in source order."""
+        return self._region.subview(slice(None))
+
+    @property
+    def capacity(self) -> int:
+        """The maximum number of elements the ring holds."""
+        return len(self._region)
+
+    @property
+    def head(self) -> int:
+        """The index within the region of the oldest element."""
+        return self._head
+
+    @property
+    def full(self) -> bool:
+        """Whether appending will overwrite the oldest element."""
+        return self._length == self.capacity
+
+    def segments(self) -> tuple[ListView, ListView]:
+        """Return the two contiguous parts of the region holding the ring's elements.
+
+        Returns:
+            tuple[ListView, ListView]: The older part, from the head towards the end of the region, and the newer part that wrapped around to its start. Either may be empty.
+        """
+        capacity = self.capacity
+        end = self._head + self._length
+        older = self._region.subview(slice(self._head, min(end, capacity)))
+        newer = self._region.subview(slice(0, max(end - capacity, 0)))
+        return older, newer
+
+    # **************************************************
+    #               HELPER METHODS
+    # **************************************************
+
+    def _locate(self, index: int) -> int:
+        """Helper function for converting a logical index to an index within the region."""
+        try:
+            i = range(self._length)[index]
+        except IndexError:
+            raise IndexError("RingView index out of range") from None
+        except TypeError:
+            raise TypeError(
+                f"RingView indices must be integers or slices, not {type(index).__name__!r}") from None
+        i += self._head
+        capacity = self.capacity
+        return i - capacity if i >= capacity else i
+
+    # **************************************************
+    #               STREAMING
+    # **************************************************
+
+    def append(self, value: Any) -> None:
+        """Add an element as the newest, overwriting the oldest if the ring is full. O(1).
+
+        Args:
+            value (Any): The element to add.
+        """
+        capacity = self.capacity
+        if self._length < capacity:
+            i = self._head + self._length
+            self._region[i - capacity if i >= capacity else i] = value
+            self._length += 1
+        else:
+            self._region[self._head] = value
+            self._head = self._head + 1 if self._head + 1 < capacity else 0
+
+    def extend(self, values: Iterable) -> None:
+        """Add several elements, oldest first, with at most two slice assignments.
+
+        Only the last `capacity` values can survive, so earlier ones are skipped.
+
+        Args:
+            values (Iterable): The elements to add.
+        """
+        capacity = self.capacity
+        if not isinstance(values, (list, tuple)):
+            values = list(values)
+        values = values[-capacity:]
+        n = len(values)
+        if not n:
+            return
+        overwritten = max(self._length + n - capacity, 0)
+        tail = (self._head + self._length) % capacity
+        first = min(n, capacity - tail)
+        self._region[tail:tail + first] = values[:first]
+        self._region[:n - first] = values[first:]
+        self._head = (self._head + overwritten) % capacity
+        self._length = min(self._length + n, capacity)
+
+    def popleft(self) -> Any:
+        """Remove and return the oldest element. O(1).
+
+        Raises:
+            IndexError: The ring is empty.
+        """
+        if not self._length:
+            raise IndexError("pop from an empty RingView")
+        value = self._region[self._head]
+        self._head = (self._head + 1) % self.capacity
+        self._length -= 1
+        return value
+
+    def clear(self) -> None:
+        """Remove every element. The source list is left unchanged."""
+        self._head = 0
+        self._length = 0
+
+    # **************************************************
+    #           ACCESSING AND MUTATING
+    # **************************************************
+
+    def subview(self, index: slice) -> ChainView:
+        """Return a view of a logical slice of the ring without copying any elements.
+
+        The result keeps pointing at the same slots of the source after
+        the ring advances.
+
+        Args:
+            index (slice): The desired logical slice.
+
+        Returns:
+            ChainView: Concatenation of at most two ListViews of the source.
+        """
+        return ChainView(*self.segments())[index]
+
+    def __getitem__(self, index: ListIndex) -> Union[list, Any]:
+        if isinstance(index, slice):
+            return self.subview(index).to_list()
+        return self._region[self._locate(index)]
+
+    def __setitem__(self, index: ListIndex, value: Any) -> None:
+        if isinstance(index, slice):
+            chain = self.subview(index)
+            chain[:] = value
+            return
+        self._region[self._locate(index)] = value
+
+    def __iter__(self) -> Iterator:
+        """Iterate from the oldest to the newest element, through the two segments."""
+        return itertools.chain(*self.segments())
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __bool__(self) -> bool:
+        return self._length > 0
+
+    def to_list(self) -> list:
+        """Return the elements, oldest first, as a list with two slices of the source."""
+        older, newer = self.segments()
+        return older[:] + newer[:]
+
+    # **************************************************
+    #               REPRESENTATIONS
+    # **************************************************
+
+    def __str__(self) -> str:
+        return f"RingView({self.to_list()})"
+
+    def __repr__(self) -> str:
+        return f"RingView(<list object at {hex(id(self.source))}>, capacity={self.capacity}, head={self._head}, length={self._length})"
@@ -0,0 +1,96 @@
+"""
+rolling.py
+18 October 2026 01:49:00
+
+Incremental rolling aggregates over the full windows of an iterable,
+such as a ListView. Each yields one value per window of `size`
+consecutive elements in a single O(n) pass, instead of re-aggregating
+every window in O(size).
+
+    view = ListView([4, 2, 12, 3, 8, 1])
+    list(rolling_sum(view, 3))  # [18, 17, 23, 12]
+    list(rolling_max(view, 3))  # [12, 12, 12, 8]
+"""
+
+import collections
+import itertools
+import operator
+from typing import Any, Callable, Iterable, Iterator
+
+
+def rolling_sum(items: Iterable, size: int) -> Iterator:
+    """Yield the sum of every window of consecutive elements.
+
+    The running total is updated by adding the entering element and
+    subtracting the leaving one, so float sums may drift slightly from
+    summing each window separately.
+
+    Args:
+        items (Iterable): The elements to aggregate.
+        size (int): Number of elements in each window.
+
+    Yields:
+        Any: The sum of each window, in order.
+    """
+    if size < 1:
+        raise ValueError("size must be positive")
+    it = iter(items)
+    window = collections.deque(itertools.islice(it, size))
+    if len(window) < size:
+        return
+    total = sum(window)
+    yield total
+    for item in it:
+        total += item - window.popleft()
+        window.append(item)
+        yield total
+
+
+def _rolling_extreme(items: Iterable, size: int, dominates: Callable[[Any, Any], bool]) -> Iterator:
+    """Yield the extreme of every window of consecutive elements using a monotonic deque.
+
+    Args:
+        items (Iterable): The elements to aggregate.
+        size (int): Number of elements in each window.
+        dominates (Callable[[Any, Any], bool]): dominates(new, old) is true if `old` can never be the extreme again once `new` has entered.
+
+    Yields:
+        Any: The extreme of each window, in order.
+    """
+    if size < 1:
+        raise ValueError("size must be positive")
+    candidates = collections.deque()  # (index, item), extreme first
+    for i, item in enumerate(items):
+        while candidates and dominates(item, candidates[-1][1]):
+            candidates.pop()
+        candidates.append((i, item))
+        if candidates[0][0] <= i - size:
+            candidates.popleft()
+        if i >= size - 1:
+            yield candidates[0][1]
+
+
+def rolling_min(items: Iterable, size: int) -> Iterator:
+    """Yield the minimum of every window of consecutive elements.
+
+    Args:
+        items (Iterable): The elements to aggregate.
+        size (int): Number of elements in each window.
+
+    Yields:
+        Any: The minimum of each window, in order.
+    """
+    return _rolling_extreme(items, size, operator.le)
+
+
+def rolling_max(items: Iterable, size: int) -> Iterator:
+    """Yield the maximum of every window of consecutive elements.
+
+    Args:
+        items (Iterable): The elements to aggregate.
+        size (int): Number of elements in each window.
+
+    Yields:
+        Any: The maximum of each window, in order.
+    """
+    return _rolling_extreme(items, size, operator.ge)
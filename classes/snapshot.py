@@ -0,0 +1,195 @@
+"""
+snapshot.py
+18 October 2026 01:50:35
+
+Implements the Snapshot class, a copy-on-write alternative to
+ListView.deepcopy.
+
+A snapshot starts out reading straight from the viewed elements. Its
+elements are split into fixed-size pages, and a page is deep-copied only
+when one of its elements is about to change, either by writing to the
+snapshot or by writing to the source through any ListView. Time and
+memory therefore scale with the number of pages touched, not with the
+length of the view.
+
+Writes to the source that bypass ListView (e.g. `src[3] = x` on the
+list itself) are not seen. Elements read from pages that have not been
+copied yet are the original objects, so they should be treated as
+read-only; replace them through the snapshot instead of mutating them.
+"""
+
+import weakref
+from typing import Any, Iterator, Optional, Union
+
+# id(source) -> snapshots of views of that source that still read from it
+_watchers: dict[int, weakref.WeakSet] = {}
+
+
+def notify_write(source: Any, positions: Optional[range]) -> None:
+    """Let the snapshots of a source preserve the elements about to be overwritten.
+
+    Called by ListView before every write to its source.
+
+    Args:
+        source (Any): The source object about to be written to.
+        positions (Optional[range]): Source indices about to be written, or None if elements will be inserted or deleted.
+    """
+    snapshots = _watchers.get(id(source))
+    if snapshots is None:
+        return
+    for snapshot in list(snapshots):
+        snapshot._preserve(positions)
+    if not snapshots:
+        del _watchers[id(source)]
+
+
+class Snapshot:
+    """Copy-on-write deep copy of the elements of a ListView."""
+
+    __slots__ = ("_backing", "_length", "_page_size", "_pages", "__weakref__")
+
+    PAGE_SIZE = 256
+
+    def __init__(self, view: Any, page_size: int = PAGE_SIZE) -> None:
+        """Construct a snapshot of the currently viewed elements.
+
+        Args:
+            view (ListView): The view to take a snapshot of. Later changes to its bounds do not affect the snapshot.
+            page_size (int, optional): Number of elements copied together. Defaults to Snapshot.PAGE_SIZE.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be positive")
+        self._backing = view.subview(slice(None))
+        self._length = len(view)
+        self._page_size = page_size
+        self._pages = {}
+        if self._length:
+            _watchers.setdefault(id(view.source), weakref.WeakSet()).add(self)
+        else:
+            self._backing = None
+
+    # **************************************************
+    #                   PROPERTIES
+    # **************************************************
+
+    @property
+    def page_size(self) -> int:
+        """The number of elements copied together."""
+        return self._page_size
+
+    @property
+    def page_count(self) -> int:
+        """The total number of pages."""
+        return -(-self._length // self._page_size)
+
+    @property
+    def copied_pages(self) -> int:
+        """The number of pages copied so far."""
+        return len(self._pages)
+
+    @property
+    def detached(self) -> bool:
+        """Whether every page has been copied, so the snapshot no longer reads from the source."""
+        return self._backing is None
+
+    # **************************************************
+    #               HELPER METHODS
+    # **************************************************
+
+    def _copy_page(self, page: int) -> list:
+        """Helper function for deep-copying a page out of the source."""
+        lo = page * self._page_size
+        copied = self._backing.subview(
+            slice(lo, lo + self._page_size)).deepcopy()
+        self._pages[page] = copied
+        if len(self._pages) == self.page_count:
+            self._detach()
+        return copied
+
+    def _detach(self) -> None:
+        """Helper function for no longer watching the source once every page is copied."""
+        snapshots = _watchers.get(id(self._backing.source))
+        if snapshots is not None:
+            snapshots.discard(self)
+        self._backing = None
+
+    def _preserve(self, positions: Optional[range]) -> None:
+        """Helper function for copying every page that a write to the source could change.
+
+        Args:
+            positions (Optional[range]): Source indices about to be written, or None to copy everything.
+        """
+        if self._backing is None:
+            return
+        first, last = 0, self._length - 1
+        if positions is not None:
+            if not positions:
+                return
+            lo, hi = sorted((positions[0], positions[-1]))
+            r = self._backing.range
+            if r.step > 0:
+                first = max(first, -(-(lo - r.start) // r.step))
+                last = min(last, (hi - r.start) // r.step)
+            else:
+                first = max(first, -(-(r.start - hi) // -r.step))
+                last = min(last, (r.start - lo) // -r.step)
+        for page in range(first // self._page_size, last // self._page_size + 1):
+            if page not in self._pages:
+                self._copy_page(page)
+                if self._backing is None:
+                    return
+
+    def _normalize(self, index: int) -> int:
+        """Helper function for converting a possibly negative index to a valid one."""
+        try:
+            return range(self._length)[index]
+        except IndexError:
+            raise IndexError("Snapshot index out of range") from None
+        except TypeError:
+            raise TypeError(
+                f"Snapshot indices must be integers or slices, not {type(index).__name__!r}") from None
+
+    # **************************************************
+    #           ACCESSING AND MUTATING
+    # **************************************************
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(self._length)[index]]
+        i = self._normalize(index)
+        page = self._pages.get(i // self._page_size)
+        if page is None:
+            return self._backing[i]
+        return page[i % self._page_size]
+
+    def __setitem__(self, index: int, value: Any) -> None:
+        i = self._normalize(index)
+        page = self._pages.get(i // self._page_size)
+        if page is None:
+            page = self._copy_page(i // self._page_size)
+        page[i % self._page_size] = value
+
+    def __iter__(self) -> Iterator:
+        for page in range(self.page_count):
+            copied = self._pages.get(page)
+            if copied is None:
+                lo = page * self._page_size
+                copied = self._backing.subview(slice(lo, lo + self._page_size))
+            yield from copied
+
+    def __len__(self) -> int:
+        return self._length
+
+    def to_list(self) -> list:
+        """Return the snapshot as a list.
+
+        Elements of pages that were never copied are shared with the source.
+        """
+        return list(self)
+
+    # **************************************************
+    #               REPRESENTATIONS
+    # **************************************************
+
+    def __repr__(self) -> str:
+        return f"Snapshot(length={self._length}, page_size={self._page_size}, copied_pages={self.copied_pages})"
@@ -0,0 +1,152 @@
+"""
+test_buffer_view.py
+18 October 2026 01:43:25
+
+Unit test file for buffer_view.py
+"""
+
+import ctypes
+import unittest
+from array import array
+from unittest import mock
+
+import buffer_view
+from buffer_view import BufferView
+from list_view import ListView
+
+
+class TestBufferView(unittest.TestCase):
+    """Unit tester class."""
+
+    def setUp(self) -> None:
+        self.src = array("d", range(10))
+        self.view = BufferView(self.src, 1, 8, 2)
+
+    def test_construction(self) -> None:
+        self.assertIs(self.view.source, self.src)
+        self.assertEqual(self.view.format, "d")
+        self.assertEqual(self.view.itemsize, 8)
+        self.assertEqual(len(BufferView(self.src)), 10)
+        with self.assertRaises(TypeError):
+            BufferView([1, 2, 3])
+
+    def test_multidimensional_source(self) -> None:
+        grid = memoryview(bytearray(range(12))).cast("B", (3, 4))
+        view = BufferView(grid, 2, 12, 4)
+        self.assertEqual(list(view), [2, 6, 10])
+        view[0] = 99
+        self.assertEqual(grid[0, 2], 99)
+
+    def test_getitem(self) -> None:
+        self.assertEqual(self.view[0], 1.0)
+        self.assertEqual(self.view[-1], 7.0)
+        sub = self.view[1:]
+        self.assertIsInstance(sub, memoryview)
+        self.assertEqual(sub.tolist(), [3.0, 5.0, 7.0])
+        sub[0] = -3.0  # zero-copy: writes through to the source
+        self.assertEqual(self.src[3], -3.0)
+
+    def test_setitem(self) -> None:
+        self.view[0] = 42
+        self.assertEqual(self.src[1], 42.0)
+        self.view[::2] = [10, 20]
+        self.assertEqual((self.src[1], self.src[5]), (10.0, 20.0))
+        self.view[1:3] = array("d", [30, 50])
+        self.assertEqual((self.src[3], self.src[5]), (30.0, 50.0))
+        self.view[:] = BufferView(array("d", range(4)))
+        self.assertEqual(self.src[1:8:2], array("d", range(4)))
+        with self.assertRaises(ValueError):
+            self.view[:] = [1, 2]
+
+    def test_delitem(self) -> None:
+        with self.assertRaises(TypeError):
+            del self.view[0]
+
+    def test_iteration(self) -> None:
+        self.assertEqual(list(self.view), [1.0, 3.0, 5.0, 7.0])
+        self.assertEqual(self.view.tolist(), [1.0, 3.0, 5.0, 7.0])
+        self.assertEqual(self.view.map(int).to_list(), [1, 3, 5, 7])
+
+    def test_algorithms(self) -> None:
+        self.view.reverse()
+        self.assertEqual(self.src.tolist(), [0, 7, 2, 5, 4, 3, 6, 1, 8, 9])
+        self.view.sort()
+        self.assertEqual(self.view.tolist(), [1, 3, 5, 7])
+        self.view.rotate(1)
+        self.assertEqual(self.view.tolist(), [7, 1, 3, 5])
+        self.view.apply(list.sort)
+        self.assertEqual(self.view.tolist(), [1, 3, 5, 7])
+
+    def test_subview(self) -> None:
+        sub = self.view.subview(slice(None, None, -1))
+        self.assertIsInstance(sub, BufferView)
+        self.assertIs(sub.source, self.src)
+        self.assertEqual(sub.tolist(), [7.0, 5.0, 3.0, 1.0])
+
+    def check_bulk_operations(self) -> None:
+        src = array("d", range(10))
+        view = BufferView(src, 1, 8, 2)
+        view += 10
+        self.assertEqual(src[1:8:2].tolist(), [11, 13, 15, 17])
+        view -= BufferView(src, 0, 8, 2)
+        self.assertEqual(src[1:8:2].tolist(), [11, 11, 11, 11])
+        view *= ListView([1, 2, 3, 4])
+        view /= [11, 11, 11, 11]
+        self.assertEqual(src[1:8:2].tolist(), [1, 2, 3, 4])
+        view.clip(2, 3)
+        self.assertEqual(src[1:8:2].tolist(), [2, 2, 3, 3])
+        view.clip(upper=2.5)
+        self.assertEqual(src[1:8:2].tolist(), [2, 2, 2.5, 2.5])
+        view.where([True, False, True, False], -1)
+        self.assertEqual(src[1:8:2].tolist(), [2, -1, 2.5, -1])
+        view.where(array("b", [0, 1, 1, 1]), [7, 8, 9, 10])
+        self.assertEqual(src[1:8:2].tolist(), [7, -1, 2.5, -1])
+        view.subview(slice(None, None, -1)).fill(0.5)
+        self.assertEqual(src.tolist(), [0, .5, 2, .5, 4, .5, 6, .5, 8, 9])
+        with self.assertRaises(ValueError):
+            view += [1, 2]
+        with self.assertRaises(ValueError):
+            view.where([True], 0)
+
+    @unittest.skipIf(buffer_view.np is None, "NumPy is not installed")
+    def test_bulk_operations_numpy(self) -> None:
+        self.check_bulk_operations()
+        arr = self.view.to_numpy()
+        arr[0] = 100
+        self.assertEqual(self.src[1], 100)
+
+    def test_bulk_operations_fallback(self) -> None:
+        with mock.patch.object(buffer_view, "np", None):
+            self.check_bulk_operations()
+            with self.assertRaises(ImportError):
+                self.view.to_numpy()
+
+    def test_other_formats(self) -> None:
+        data = bytearray(b"abcdef")
+        view = BufferView(data, step=2)
+        view[:] = b"XYZ"
+        self.assertEqual(data, bytearray(b"XbYdZf"))
+        flags = memoryview(bytearray(3)).cast("?")
+        view = BufferView(flags)
+        view[:] = [True, False, True]
+        self.assertEqual(flags.tolist(), [True, False, True])
+
+    def test_unsupported_formats(self) -> None:
+        big_endian = (ctypes.c_int32.__ctype_be__ * 3)()
+        prefixed = (ctypes.c_int32 * 3)()  # ctypes reports "<i"
+        for source in (big_endian, prefixed):
+            with self.assertRaises(TypeError):
+                BufferView(source)
+        if buffer_view.np is not None:
+            with self.assertRaises(TypeError):
+                BufferView(buffer_view.np.zeros(3, ">i4"))
+            self.assertEqual(list(BufferView(buffer_view.np.arange(3, dtype="=i4"))), [0, 1, 2])
+
+    def test_representations(self) -> None:
+        self.assertEqual(str(self.view), "BufferView([1.0, 3.0, 5.0, 7.0])")
+        self.assertEqual(repr(self.view),
+                         f"BufferView(<array object at {hex(id(self.src))}>, start=1, stop=8, step=2)")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+test_chain_view.py
+18 October 2026 01:55:09
+
+Unit test file for chain_view.py
+"""
+
+import random
+import unittest
+
+from chain_view import ChainView
+from list_view import ListView
+
+
+class TestChainView(unittest.TestCase):
+    """Unit tester class."""
+
+    def setUp(self) -> None:
+        self.a = list(range(10))
+        self.b = list("abcdefg")
+        self.c = [None, 1.5]
+        self.chain = ChainView(ListView(self.a, 1, 8, 3),     # 1, 4, 7
+                               ListView(self.b, 0, 0),        # empty
+                               ListView(self.b, 6, -1, -2),   # g, e, c, a
+                               ListView(self.c))              # None, 1.5
+        self.expected = [1, 4, 7, "g", "e", "c", "a", None, 1.5]
+
+    def test_length_and_iteration(self) -> None:
+        self.assertEqual(len(self.chain), 9)
+        self.assertEqual(list(self.chain), self.expected)
+        self.assertEqual(len(ChainView()), 0)
+        self.assertFalse(ChainView(ListView(self.a, 0, 0)))
+
+    def test_indexing(self) -> None:
+        for i in range(-9, 9):
+            self.assertEqual(self.chain[i], self.expected[i])
+        self.assertEqual(self.chain.locate(3), (self.chain.segments[2], 0))
+        with self.assertRaises(IndexError):
+            self.chain[9]
+        with self.assertRaises(TypeError):
+            self.chain["0"]
+
+    def test_slicing(self) -> None:
+        rng = random.Random(13)
+        for _ in range(300):
+            start, stop = rng.randint(-12, 12), rng.randint(-12, 12)
+            step = rng.choice([1, 2, 3, -1, -2, -4])
+            s = slice(start, stop, step)
+            sliced = self.chain[s]
+            self.assertIsInstance(sliced, ChainView)
+            self.assertEqual(list(sliced), self.expected[s], s)
+
+    def test_slices_are_views(self) -> None:
+        sliced = self.chain[2:5]
+        self.assertEqual(len(sliced.segments), 2)
+        self.assertEqual(sliced.segments[1], ListView(self.b, 6, 3, -2))
+        sliced[0] = "x"
+        self.assertEqual(self.a[7], "x")
+
+    def test_assignment(self) -> None:
+        self.chain[3] = "G"
+        self.assertEqual(self.b[6], "G")
+        self.chain[::-2] = range(5)
+        self.expected[3] = "G"
+        self.expected[::-2] = range(5)
+        self.assertEqual(list(self.chain), self.expected)
+        self.assertEqual(self.a[1], 4)
+        self.assertEqual(self.c, [None, 0])
+        with self.assertRaises(ValueError):
+            self.chain[0:3] = [1]
+        with self.assertRaises(TypeError):
+            del self.chain[0]
+
+    def test_append_and_reindex(self) -> None:
+        self.chain.append(ChainView(ListView(self.a, 0, 2)))
+        self.assertEqual(len(self.chain.segments), 5)
+        self.assertEqual(self.chain[-2:], ChainView(ListView(self.a, 0, 2)))
+        with self.assertRaises(TypeError):
+            self.chain.append(self.a)
+        self.chain.segments[0].stop = 2
+        self.chain.reindex()
+        self.assertEqual(len(self.chain), 9)
+        self.assertEqual(self.chain[1], "g")
+
+    def test_higher_order(self) -> None:
+        numbers = ChainView(ListView(self.a, 0, 3), ListView(self.a, 9, 6, -1))
+        self.assertEqual(numbers.map(lambda x: x * 2).to_list(), [0, 2, 4, 18, 16, 14])
+        self.assertEqual(numbers.filter(lambda x: x % 2).to_list(), [1, 9, 7])
+        self.assertEqual(numbers.reduce(lambda acc, x: acc + x), 27)
+
+
+if __name__ == "__main__":
+    unittest.main()
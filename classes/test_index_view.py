@@ -0,0 +1,96 @@
+"""
+test_index_view.py
+18 October 2026 01:56:18
+
+Unit test file for index_view.py
+"""
+
+import unittest
+from array import array
+
+from buffer_view import BufferView
+from index_view import IndexView
+from list_view import ListView
+
+
+class TestIndexView(unittest.TestCase):
+    """Unit tester class."""
+
+    def setUp(self) -> None:
+        self.src = list(range(10, 20))
+        self.view = IndexView(self.src, [3, 0, -1, 3])
+
+    def test_positions(self) -> None:
+        self.assertEqual(self.view.positions, array("q", [3, 0, 9, 3]))
+        self.assertIs(self.view.source, self.src)
+        self.assertEqual(len(self.view), 4)
+        with self.assertRaises(IndexError):
+            IndexView(self.src, [10])
+        with self.assertRaises(TypeError):
+            IndexView(tuple(self.src), [0])
+
+    def test_gather(self) -> None:
+        self.assertEqual(self.view.gather(), [13, 10, 19, 13])
+        self.assertEqual(self.view.gather("l"), array("l", [13, 10, 19, 13]))
+        self.assertEqual(list(self.view), [13, 10, 19, 13])
+        self.assertEqual(self.view[2], 19)
+        self.assertEqual(self.view[-1], 13)
+        self.assertEqual(self.view[1:3], [10, 19])
+        with self.assertRaises(IndexError):
+            self.view[4]
+
+    def test_scatter(self) -> None:
+        self.view.scatter(["a", "b", "c", "d"])
+        self.assertEqual(self.src[:4], ["b", 11, 12, "d"])
+        self.assertEqual(self.src[9], "c")
+        self.view[1] = "x"
+        self.view[::2] = (i for i in "yz")
+        self.assertEqual(self.src[0], "x")
+        self.assertEqual(self.src[3], "y")
+        self.assertEqual(self.src[9], "z")
+        with self.assertRaises(ValueError):
+            self.view.scatter([1, 2])
+        with self.assertRaises(TypeError):
+            del self.view[0]
+
+    def test_from_mask(self) -> None:
+        view = IndexView.from_mask(self.src, [x % 3 == 0 for x in self.src])
+        self.assertEqual(view.gather(), [12, 15, 18])
+        self.assertEqual(view.positions, array("q", [2, 5, 8]))
+
+    def test_composes_with_strided_views(self) -> None:
+        evens = ListView(self.src, 8, -1, -2)  # [18, 16, 14, 12, 10]
+        big = IndexView.from_mask(evens, [x > 13 for x in evens])
+        self.assertEqual(big.positions, array("q", [8, 6, 4]))
+        self.assertEqual(big.gather(), [18, 16, 14])
+        reordered = big.subview([2, 0])
+        self.assertEqual(reordered.positions, array("q", [4, 8]))
+        self.assertEqual(big.subview(slice(None, None, -1)).gather(), [14, 16, 18])
+        reordered.scatter([0, 0])
+        self.assertEqual(self.src[4], 0)
+        self.assertEqual(self.src[8], 0)
+        with self.assertRaises(IndexError):
+            IndexView(evens, [5])
+
+    def test_buffer_source(self) -> None:
+        buf = array("d", range(8))
+        view = IndexView(BufferView(buf, 1, 8, 3), [2, 0])
+        self.assertEqual(view.gather("d"), array("d", [7.0, 1.0]))
+        view.scatter([-1.0, -2.0])
+        self.assertEqual(buf[7], -1.0)
+        self.assertEqual(buf[1], -2.0)
+
+    def test_snapshot_sees_scatter(self) -> None:
+        snap = ListView(self.src).snapshot(page_size=2)
+        self.view.scatter([0, 0, 0, 0])
+        self.assertEqual(snap[3], 13)
+        self.assertEqual(snap[9], 19)
+
+    def test_higher_order(self) -> None:
+        self.assertEqual(self.view.map(lambda x: x - 10).to_list(), [3, 0, 9, 3])
+        self.assertEqual(self.view.filter(lambda x: x > 12).to_list(), [13, 19, 13])
+        self.assertEqual(self.view.reduce(max), 19)
+
+
+if __name__ == "__main__":
+    unittest.main()
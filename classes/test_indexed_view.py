@@ -0,0 +1,139 @@
+"""
+test_indexed_view.py
+18 October 2026 02:14:06
+
+Unit test file for indexed_view.py
+"""
+
+import random
+import unittest
+
+from indexed_view import IndexedView
+from view_registry import TrackedList
+
+
+class TestIndexedView(unittest.TestCase):
+    """Unit tester class."""
+
+    def setUp(self) -> None:
+        rng = random.Random(5)
+        self.src = TrackedList(rng.randrange(10) for _ in range(300))
+        self.view = IndexedView(self.src, 299, 0, -2)
+        self.model = self.src[299:0:-2]
+
+    def assertMatchesModel(self) -> None:
+        self.model = self.src[self.view.slice]
+        for value in range(-1, 11):
+            self.assertEqual(value in self.view, value in self.model)
+            self.assertEqual(self.view.count(value), self.model.count(value))
+            for start, stop in ((0, None), (40, 100), (-30, None), (120, 10)):
+                try:
+                    expected = self.model.index(value, start, len(self.model) if stop is None else stop)
+                except ValueError:
+                    with self.assertRaises(ValueError):
+                        self.view.index(value, start, stop)
+                else:
+                    self.assertEqual(self.view.index(value, start, stop), expected)
+
+    def test_queries_build_index(self) -> None:
+        self.assertFalse(self.view.indexed)
+        self.assertMatchesModel()
+        self.assertTrue(self.view.indexed)
+
+    def test_setitem_updates_in_place(self) -> None:
+        self.assertIn(3, self.view)
+        index = self.view._index
+        self.view[10] = 42
+        self.view[-1] = 3
+        self.view[0] = self.view[0]
+        self.assertTrue(self.view.indexed)
+        self.assertIs(self.view._index, index)
+        self.assertEqual(self.view.index(42), 10)
+        self.assertMatchesModel()
+        with self.assertRaises(IndexError):
+            self.view[150] = 0
+
+    def test_setitem_same_value(self) -> None:
+        view = IndexedView([1, 2, 3])
+        self.assertIn(2, view)
+        view[1] = 2
+        self.assertTrue(view.indexed)
+        self.assertIn(2, view)
+        self.assertEqual(view.count(2), 1)
+        view[1] = 2.0
+        self.assertEqual(view.index(2), 1)
+        view[1] = 5
+        self.assertNotIn(2, view)
+        self.assertEqual(view.index(5), 1)
+
+    def test_writes_through_view_invalidate(self) -> None:
+        self.assertIn(3, self.view)
+        self.view.sort()
+        self.assertFalse(self.view.indexed)
+        self.assertMatchesModel()
+        self.view[::3] = [11] * len(self.view[::3])
+        self.assertMatchesModel()
+        self.view += 1
+        self.assertMatchesModel()
+
+    def test_delete_through_tracked_view(self) -> None:
+        view = IndexedView(self.src, 10, 60)
+        self.src.track(view)
+        value = self.src[15]
+        count = view.count(value)
+        del view[5]
+        self.assertEqual(len(view), 49)
+        self.assertEqual(view.count(value), count - 1)
+        self.assertEqual(view.count(value), self.src[10:59].count(value))
+
+    def test_bypassing_writes_detected(self) -> None:
+        self.assertIn(3, self.view)
+        version = self.src.version
+        self.src[299] = 99
+        self.assertEqual(self.src.version, version + 1)
+        self.assertFalse(self.view.indexed)
+        self.assertEqual(self.view.index(99), 0)
+        self.src.reverse()
+        self.assertMatchesModel()
+        self.src.append(7)
+        self.src.extend([1, 2])
+        self.src.sort()
+        self.assertMatchesModel()
+
+    def test_other_view_writes_detected(self) -> None:
+        other = IndexedView(self.src, 0, 300, 1)
+        self.assertIn(3, self.view)
+        self.assertIn(3, other)
+        other[299] = -5
+        self.assertTrue(other.indexed)
+        self.assertFalse(self.view.indexed)
+        self.assertEqual(self.view.index(-5), 0)
+
+    def test_plain_list_source(self) -> None:
+        src = [1, 2, 3, 2]
+        view = IndexedView(src)
+        self.assertEqual(view.count(2), 2)
+        src.append(2)  # length change is detected
+        view.stop = 5
+        self.assertEqual(view.count(2), 3)
+        src[0] = 2  # invisible without a version counter
+        view.invalidate()
+        self.assertEqual(view.count(2), 4)
+
+    def test_unhashable_values(self) -> None:
+        view = IndexedView([[1], [2], [1]])
+        self.assertEqual(view.count([1]), 2)
+        self.assertEqual(view.index([2]), 1)
+        hashable = IndexedView([1, 2, 3])
+        self.assertNotIn([1], hashable)
+        hashable[0] = [4]
+        self.assertEqual(hashable.index([4]), 0)
+
+    def test_subview_is_indexed(self) -> None:
+        sub = self.view.subview(slice(10, 20))
+        self.assertIsInstance(sub, IndexedView)
+        self.assertEqual(sub.count(self.model[10]), self.model[10:20].count(self.model[10]))
+
+
+if __name__ == "__main__":
+    unittest.main()
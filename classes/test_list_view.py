@@ -5,11 +5,27 @@ test_list_view.py
 Unit test file for list_view.py
 """
 
+import bisect
 import unittest
 
 from list_view import ListView
 
 
+class ProbeList(list):
+    """List recording the slices read from it and refusing to be iterated."""
+
+    def __init__(self, *args) -> None:
+        super().__init__(*args)
+        self.reads = []
+
+    def __getitem__(self, index):
+        self.reads.append(index)
+        return super().__getitem__(index)
+
+    def __iter__(self):
+        raise AssertionError("the whole source list was iterated")
+
+
 class TestListView(unittest.TestCase):
     """Unit tester class."""
 
@@ -61,10 +77,77 @@ class TestListView(unittest.TestCase):
         for item, index in zip(self.view, self.view.range):
             self.assertIs(item, self.src[index])
 
+    def test_blocks(self) -> None:
+        src = list(range(50))
+        view = ListView(src, 47, 2, -3)  # 15 elements
+        self.assertEqual([len(b) for b in view.blocks(4)], [4, 4, 4, 3])
+        self.assertEqual(sum(view.blocks(4), []), src[47:2:-3])
+        self.assertEqual(list(ListView(src, 5, 5).blocks()), [])
+        with self.assertRaises(ValueError):
+            list(view.blocks(0))
+        # iteration crosses block boundaries
+        self.assertEqual(list(ListView(src, 0, 50, 7)), src[::7])
+        self.assertEqual(len(list(ListView(list(range(3000))))), 3000)
+
     def test_getitem(self) -> None:
         for view_i, src_i in enumerate(self.view.range):
             self.assertIs(self.view[view_i], self.src[src_i])
 
+    def test_getitem_normalization(self) -> None:
+        self.assertIs(self.view[-1], self.src[7])
+        self.assertIs(self.view[-4], self.src[1])
+        with self.assertRaises(IndexError):
+            self.view[4]
+        with self.assertRaises(IndexError):
+            self.view[-5]
+        self.assertEqual(self.view[::-1], self.src[7:0:-2])
+        self.assertEqual(self.view[-2:], self.src[5:8:2])
+        self.assertEqual(self.view[1:100], self.src[3:8:2])
+        self.assertEqual(self.view[-100:1], self.src[1:2])
+
+    def test_subview(self) -> None:
+        sub = self.view.subview(slice(1, None))
+        self.assertIsInstance(sub, ListView)
+        self.assertIs(sub.source, self.src)
+        self.assertEqual(sub.range, range(3, 8, 2))
+        reverse = self.view.subview(slice(None, None, -1))
+        self.assertEqual(list(reverse), self.src[7::-2])
+        self.assertEqual(reverse.deepcopy(), self.src[7::-2])
+        self.assertEqual(str(reverse), f"ListView({self.src[7::-2]})")
+        nested = reverse.subview(slice(-1, -3, -1))
+        self.assertEqual(list(nested), [self.src[1], self.src[3]])
+        self.assertFalse(self.view.subview(slice(10, 20)))
+        new_value = ["used to be [5]"]
+        reverse[1] = new_value
+        self.assertIs(self.src[5], new_value)
+        with self.assertRaises(TypeError):
+            self.view.subview(0)
+
+    def test_windows(self) -> None:
+        src = list(range(10))
+        view = ListView(src, 9, -1, -1)
+        windows = list(view.windows(4, 3))
+        self.assertEqual([list(w) for w in windows],
+                         [[9, 8, 7, 6], [6, 5, 4, 3], [3, 2, 1, 0]])
+        self.assertTrue(all(w.source is src for w in windows))
+        self.assertEqual(len(list(view.windows(10))), 1)
+        self.assertEqual(list(view.windows(11)), [])
+        reused = [list(w) for w in view.windows(8, reuse=True)]
+        self.assertEqual(reused, [src[9:1:-1], src[8:0:-1], src[7::-1]])
+        window = next(view.windows(2))
+        window[0] = "nine"
+        self.assertEqual(src[9], "nine")
+        with self.assertRaises(ValueError):
+            view.windows(0)
+
+    def test_chunks(self) -> None:
+        chunks = [list(c) for c in self.view.chunks(3)]
+        self.assertEqual(chunks, [self.src[1:7:2], [self.src[7]]])
+        views = list(self.view.chunks(1, reuse=True))
+        self.assertTrue(all(v is views[0] for v in views))
+        with self.assertRaises(ValueError):
+            self.view.chunks(0)
+
     def test_setitem(self) -> None:
         new_value = ["used to be [5]"]
         self.view[2] = new_value
@@ -74,6 +157,24 @@ class TestListView(unittest.TestCase):
         self.assertIs(self.src[3], new_sequence[0])
         self.assertIs(self.src[7], new_sequence[1])
 
+    def test_setitem_insertion(self) -> None:
+        src = list(range(10))
+        ListView(src, 3, 8)[2:2] = ["X"]
+        self.assertEqual(src, [0, 1, 2, 3, 4, "X", 5, 6, 7, 8, 9])
+        src = list(range(10))
+        ListView(src, 3, 8)[5:] = ["Y"]
+        self.assertEqual(src, [0, 1, 2, 3, 4, 5, 6, 7, "Y", 8, 9])
+        src = list(range(10))
+        ListView(src, 5, 5)[:] = ["A", "B"]
+        self.assertEqual(src, [0, 1, 2, 3, 4, "A", "B", 5, 6, 7, 8, 9])
+        src = list(range(10))
+        ListView(src, 5, 5).apply(list.append, "Z")
+        self.assertEqual(src, [0, 1, 2, 3, 4, "Z", 5, 6, 7, 8, 9])
+        src = list(range(10))
+        empty = ListView(src).subview(slice(None, None, -1)).subview(slice(10, None))
+        self.assertEqual(empty.slice, slice(0, 0, -1))
+        self.assertEqual(list(empty), [])
+
     def test_delitem(self) -> None:
         deleted_items = self.view[2:]
         del self.view[2:]
@@ -91,6 +192,65 @@ class TestListView(unittest.TestCase):
         for test_i, src_i in enumerate(self.view.range):
             self.assertEqual(self.src[src_i], sorted_values[test_i])
 
+    def test_swap(self) -> None:
+        first, last = self.src[1], self.src[7]
+        self.view.swap(0, -1)
+        self.assertIs(self.src[1], last)
+        self.assertIs(self.src[7], first)
+        with self.assertRaises(IndexError):
+            self.view.swap(0, 4)
+
+    def test_reverse(self) -> None:
+        expected = self.src[7::-2]
+        self.view.reverse()
+        self.assertEqual(list(self.view), expected)
+        self.assertEqual(self.src[::2], [[i] for i in range(0, 10, 2)])
+
+    def test_sort(self) -> None:
+        self.view.sort(key=lambda x: x[0], reverse=True)
+        self.assertEqual(list(self.view), [[7], [5], [3], [1]])
+        reverse = self.view.subview(slice(None, None, -1))
+        reverse.sort(key=lambda x: x[0])
+        self.assertEqual(list(self.view), [[7], [5], [3], [1]])
+        self.assertEqual(self.src[::2], [[i] for i in range(0, 10, 2)])
+
+    def test_rotate(self) -> None:
+        items = list(self.view)
+        self.view.rotate(1)
+        self.assertEqual(list(self.view), items[-1:] + items[:-1])
+        self.view.rotate(-3)
+        self.assertEqual(list(self.view), items[2:] + items[:2])
+        self.view.rotate(4 * 5)
+        self.assertEqual(list(self.view), items[2:] + items[:2])
+        self.assertEqual(self.src[::2], [[i] for i in range(0, 10, 2)])
+        ListView([]).rotate(3)
+
+    def test_bulk_arithmetic(self) -> None:
+        src = list(range(10))
+        view = ListView(src, 1, 8, 2)
+        view += 10
+        self.assertEqual(src, [0, 11, 2, 13, 4, 15, 6, 17, 8, 9])
+        view -= ListView(src, 0, 8, 2)
+        self.assertEqual(src, [0, 11, 2, 11, 4, 11, 6, 11, 8, 9])
+        view *= [1, 2, 3, 4]
+        self.assertEqual(src[1::2], [11, 22, 33, 44, 9])
+        view /= 11
+        self.assertEqual(src[1:8:2], [1.0, 2.0, 3.0, 4.0])
+        with self.assertRaises(ValueError):
+            view += [1, 2]
+
+    def test_fill_clip_where(self) -> None:
+        src = list(range(10))
+        view = ListView(src, 8, -1, -2)
+        view.clip(2, 6)
+        self.assertEqual(src, [2, 1, 2, 3, 4, 5, 6, 7, 6, 9])
+        view.where([x % 4 == 2 for x in view], -1)
+        self.assertEqual(src, [2, 1, 2, 3, -1, 5, 6, 7, 6, 9])
+        view.fill(None)
+        self.assertEqual(src[::2], [None] * 5)
+        with self.assertRaises(ValueError):
+            view.where([True], 0)
+
     def test_for_each(self) -> None:
         self.view.for_each(lambda x: x.append(None))
         for item in self.view:
@@ -109,6 +269,74 @@ class TestListView(unittest.TestCase):
             else:
                 self.assertNotIn(item, result)
 
+    def test_searching(self) -> None:
+        src = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5]
+        for view in (ListView(src), ListView(src, 2, 11), ListView(src, 1, 11, 3),
+                     ListView(src, 10, -1, -2), ListView(src, 9, 0, -1)):
+            items = list(view)
+            for value in range(11):
+                self.assertEqual(value in view, value in items)
+                self.assertEqual(view.count(value), items.count(value))
+                for start, stop in ((0, None), (1, -1), (-3, None), (2, 1)):
+                    try:
+                        expected = items.index(value, start, *(() if stop is None else (stop,)))
+                    except ValueError:
+                        with self.assertRaises(ValueError):
+                            view.index(value, start, stop)
+                    else:
+                        self.assertEqual(view.index(value, start, stop), expected)
+
+    def test_searching_reads_only_viewed_range(self) -> None:
+        src = ProbeList(range(10_000))
+        for view in (ListView(src, 9990, 10000), ListView(src, 9991, 10000, 2),
+                     ListView(src, 9999, 9989, -3)):
+            items = [src[i] for i in view.range]
+            src.reads.clear()
+            self.assertIn(items[-1], view)
+            self.assertNotIn(-1, view)
+            self.assertEqual(view.count(items[0]), 1)
+            self.assertEqual(view.index(items[-1]), len(items) - 1)
+            self.assertEqual(view.index(items[1], 1), 1)
+            for index in src.reads:
+                self.assertIsInstance(index, slice)
+                self.assertGreaterEqual(min(range(len(src))[index]), min(view.range))
+
+    def test_bisect(self) -> None:
+        src = [9, 0, 8, 2, 7, 2, 6, 4, 5, 8]
+        ascending = ListView(src, 1, 10, 2)  # [0, 2, 2, 4, 8]
+        descending = ListView(src, 8, -1, -2)  # [5, 6, 7, 8, 9]
+        contiguous = ListView(sorted(src), 2, 7)  # [2, 4, 5, 6, 7]
+        for view in (ascending, descending, contiguous):
+            items = list(view)
+            for x in range(-1, 11):
+                self.assertEqual(view.bisect_left(x), bisect.bisect_left(items, x))
+                self.assertEqual(view.bisect_right(x), bisect.bisect_right(items, x))
+        self.assertEqual(ascending.bisect_left(-4, key=lambda x: -x), 0)
+        contiguous.insort(5)
+        contiguous.insort(100)
+        contiguous.insort(-1)
+        self.assertEqual(list(contiguous), [-1, 2, 4, 5, 5, 6, 7, 100])
+        records = ListView([(0, "a"), (2, "b")])
+        records.insort((1, "c"), key=lambda r: r[0])
+        self.assertEqual(records.source, [(0, "a"), (1, "c"), (2, "b")])
+        with self.assertRaises(ValueError):
+            ascending.insort(1)
+
+    def test_reduce(self) -> None:
+        total = self.view.reduce(lambda acc, x: acc + x[0], 0)
+        self.assertEqual(total, sum(item[0] for item in self.view))
+
+    def test_chaining(self) -> None:
+        calls = []
+        pipeline = self.view.map(lambda x: calls.append(x) or x[0]) \
+                            .filter(lambda x: x > 2)
+        self.assertEqual(calls, [])  # lazy until consumed
+        self.assertEqual(pipeline.to_list(), [3, 5, 7])
+        self.assertEqual(list(pipeline), [3, 5, 7])  # re-iterable
+        calls.clear()
+        self.assertEqual(pipeline.first(), 3)
+        self.assertEqual(len(calls), 2)  # stopped early
+
     def test_shallow_copy(self) -> None:
         shallow_copy = list(self.view)
         print(all(shallow_copy[i] is self.src[j]
@@ -0,0 +1,175 @@
+"""
+test_list_view_fuzz.py
+18 October 2026 02:11:53
+
+Randomized differential tests for list_view.py
+
+Every case builds a ListView as `ListView(src).subview(slice(a, b, c))`
+for random, possibly negative or out-of-range bounds, and checks each
+operation against the same operation on the plain list `src[a:b:c]`,
+writing results back through the slice for mutating operations.
+Seeds are fixed so failures are reproducible.
+"""
+
+import copy
+import functools
+import operator
+import random
+import unittest
+from typing import Iterator
+
+from list_view import ListView
+
+CASES = 300
+STEPS = (1, -1, 2, -2, 7, -7)
+
+
+def _bound(rng: random.Random, n: int) -> int:
+    """Return a random slice bound, possibly negative, out of range or None."""
+    return rng.choice([None, rng.randint(-n - 3, n + 3)])
+
+
+def _slice(rng: random.Random, n: int, steps: tuple = STEPS) -> slice:
+    """Return a random slice of a sequence of length n."""
+    return slice(_bound(rng, n), _bound(rng, n), rng.choice(steps))
+
+
+class TestListViewFuzz(unittest.TestCase):
+    """Unit tester class."""
+
+    def cases(self, seed: int) -> Iterator[tuple]:
+        """Yield (rng, src, view, s) where view is src[s] as a ListView."""
+        rng = random.Random(seed)
+        for _ in range(CASES):
+            n = rng.randint(0, 40)
+            src = [rng.randint(-20, 20) for _ in range(n)]
+            s = _slice(rng, n)
+            yield rng, src, ListView(src).subview(s), s
+
+    def assertWrittenThrough(self, src: list, expected: list, s: slice, model: list) -> None:
+        """Assert src equals `expected` with `model` written back through slice s."""
+        expected[s] = model
+        self.assertEqual(src, expected)
+
+    def test_read(self) -> None:
+        for rng, src, view, s in self.cases(1):
+            model = src[s]
+            msg = f"src={src} s={s}"
+            self.assertEqual(len(view), len(model), msg)
+            self.assertEqual(list(view), model, msg)
+            self.assertEqual(sum(view.blocks(rng.randint(1, 5)), []), model, msg)
+            for i in range(-len(model) - 2, len(model) + 2):
+                if -len(model) <= i < len(model):
+                    self.assertEqual(view[i], model[i], msg)
+                else:
+                    with self.assertRaises(IndexError):
+                        view[i]
+            for _ in range(5):
+                s2 = _slice(rng, len(model))
+                self.assertEqual(view[s2], model[s2], f"{msg} s2={s2}")
+                self.assertEqual(list(view.subview(s2)), model[s2], f"{msg} s2={s2}")
+
+    def test_search(self) -> None:
+        for rng, src, view, s in self.cases(2):
+            model = src[s]
+            for value in (rng.randint(-20, 20), 99):
+                self.assertEqual(value in view, value in model)
+                self.assertEqual(view.count(value), model.count(value))
+                start, stop = rng.randint(-5, 45), rng.choice([None, rng.randint(-5, 45)])
+                try:
+                    expected = model.index(value, start, len(model) if stop is None else stop)
+                except ValueError:
+                    with self.assertRaises(ValueError):
+                        view.index(value, start, stop)
+                else:
+                    self.assertEqual(view.index(value, start, stop), expected)
+
+    def test_setitem(self) -> None:
+        for rng, src, view, s in self.cases(3):
+            expected = list(src)
+            model = src[s]
+            if model:
+                i = rng.randrange(-len(model), len(model))
+                view[i] = model[i] = "x"
+            s2 = _slice(rng, len(model))
+            values = [rng.random() for _ in model[s2]]
+            view[s2] = values
+            model[s2] = values
+            self.assertWrittenThrough(src, expected, s, model)
+
+    def test_resizing_slice_assignment(self) -> None:
+        for rng, src, view, s in self.cases(4):
+            if view.step != 1:
+                continue
+            start = range(len(src))[s].start
+            # k == k2 inserts, including into empty views
+            k = rng.randint(0, len(view))
+            k2 = rng.randint(k, len(view))
+            expected = list(src)
+            values = ["y"] * rng.randint(0, 5)
+            view[k:k2] = values
+            expected[start + k:start + k2] = values
+            self.assertEqual(src, expected)
+
+    def test_delitem(self) -> None:
+        for rng, src, view, s in self.cases(5):
+            if not view:
+                continue
+            expected = list(src)
+            positions = range(len(src))[s]
+            i = rng.randrange(-len(view), len(view))
+            del view[i]
+            del expected[positions[i]]
+            self.assertEqual(src, expected)
+
+    def test_in_place_algorithms(self) -> None:
+        for rng, src, view, s in self.cases(6):
+            expected = list(src)
+            model = src[s]
+            choice = rng.randrange(5)
+            if choice == 0:
+                view.reverse()
+                model.reverse()
+            elif choice == 1:
+                reverse = rng.random() < 0.5
+                view.sort(reverse=reverse)
+                model.sort(reverse=reverse)
+            elif choice == 2 and model:
+                k = rng.randint(-50, 50)
+                view.rotate(k)
+                k %= len(model)
+                model[:] = model[-k:] + model[:-k]
+            elif choice == 3 and model:
+                i, j = rng.randrange(len(model)), rng.randrange(len(model))
+                view.swap(i, j)
+                model[i], model[j] = model[j], model[i]
+            else:
+                view.apply(list.reverse)
+                model.reverse()
+            self.assertWrittenThrough(src, expected, s, model)
+
+    def test_bulk_operations(self) -> None:
+        for rng, src, view, s in self.cases(7):
+            expected = list(src)
+            model = src[s]
+            k = rng.randint(-3, 3)
+            view += k
+            view *= list(range(len(model)))
+            view.clip(-50, 50)
+            model = [min(max((x + k) * i, -50), 50) for i, x in enumerate(model)]
+            self.assertWrittenThrough(src, expected, s, model)
+
+    def test_higher_order(self) -> None:
+        for rng, src, view, s in self.cases(8):
+            model = src[s]
+            self.assertEqual(view.map(abs).to_list(), list(map(abs, model)))
+            self.assertEqual(view.filter(lambda x: x > 0).to_list(), [x for x in model if x > 0])
+            self.assertEqual(view.reduce(operator.add, 0), functools.reduce(operator.add, model, 0))
+            self.assertEqual(view.deepcopy(), copy.deepcopy(model))
+            seen = []
+            view.for_each(seen.append)
+            self.assertEqual(seen, model)
+
+
+if __name__ == "__main__":
+    unittest.main()
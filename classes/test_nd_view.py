@@ -0,0 +1,107 @@
+"""
+test_nd_view.py
+18 October 2026 01:54:14
+
+Unit test file for nd_view.py
+"""
+
+import unittest
+
+from list_view import ListView
+from nd_view import NDView
+
+
+class TestNDView(unittest.TestCase):
+    """Unit tester class."""
+
+    def setUp(self) -> None:
+        self.src = list(range(12))
+        self.m = NDView(self.src, (3, 4))
+
+    def test_layout(self) -> None:
+        self.assertEqual(self.m.strides, (4, 1))
+        self.assertEqual(self.m.ndim, 2)
+        self.assertEqual(self.m.size, 12)
+        self.assertEqual(len(self.m), 3)
+        self.assertEqual(self.m.tolist(), [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9, 10, 11]])
+        with self.assertRaises(ValueError):
+            NDView(self.src, (4, 4))
+        with self.assertRaises(ValueError):
+            NDView(self.src, (3, 4), (4, 1), 1)
+        with self.assertRaises(ValueError):
+            NDView(self.src, (3, 4), (4,))
+        with self.assertRaises(TypeError):
+            NDView(tuple(self.src), (3, 4))
+
+    def test_indexing(self) -> None:
+        self.assertEqual(self.m[1, 2], 6)
+        self.assertEqual(self.m[-1, -1], 11)
+        self.assertEqual(self.m[1:, 2:].tolist(), [[6, 7], [10, 11]])
+        self.assertEqual(self.m[::-1, ::-2].tolist(), [[11, 9], [7, 5], [3, 1]])
+        self.assertEqual(self.m[0:0].shape, (0, 4))
+        with self.assertRaises(IndexError):
+            self.m[3, 0]
+        with self.assertRaises(IndexError):
+            self.m[0, 0, 0]
+        with self.assertRaises(TypeError):
+            self.m["a"]
+
+    def test_one_axis_is_list_view(self) -> None:
+        row = self.m[1]
+        self.assertIsInstance(row, ListView)
+        self.assertEqual(row.tuple, (4, 8, 1))
+        col = self.m[:, 1]
+        self.assertEqual(col.tuple, (1, 13, 4))
+        self.assertEqual(list(self.m[::-1, 0]), [8, 4, 0])
+        col.sort(reverse=True)
+        self.assertEqual(self.src[1::4], [9, 5, 1])
+
+    def test_transpose(self) -> None:
+        t = self.m.T
+        self.assertEqual(t.shape, (4, 3))
+        self.assertEqual(t.strides, (1, 4))
+        self.assertEqual(t.tolist(), [list(col) for col in self.m.columns()])
+        self.assertEqual(t[2, 1], self.m[1, 2])
+        self.assertEqual(t.T, self.m)
+        cube = NDView(list(range(24)), (2, 3, 4))
+        moved = cube.transpose(1, 2, 0)
+        self.assertEqual(moved.shape, (3, 4, 2))
+        self.assertEqual(moved[2, 1], ListView(cube.source, 9, 33, 12))
+        with self.assertRaises(ValueError):
+            cube.transpose(0, 0, 1)
+
+    def test_diagonal(self) -> None:
+        self.assertEqual(list(self.m.diagonal()), [0, 5, 10])
+        self.assertEqual(list(self.m.diagonal(1)), [1, 6, 11])
+        self.assertEqual(list(self.m.diagonal(3)), [3])
+        self.assertEqual(list(self.m.diagonal(-2)), [8])
+        self.assertEqual(list(self.m.diagonal(4)), [])
+        self.assertEqual(list(self.m.T.diagonal(-1)), [1, 6, 11])
+        self.assertEqual(list(self.m[::-1].diagonal()), [8, 5, 2])
+        with self.assertRaises(ValueError):
+            NDView(self.src, (2, 3, 2)).diagonal()
+
+    def test_rows_and_columns(self) -> None:
+        self.assertEqual([list(row) for row in self.m.rows()], self.m.tolist())
+        self.assertEqual([list(col) for col in self.m.columns()],
+                         [[0, 4, 8], [1, 5, 9], [2, 6, 10], [3, 7, 11]])
+
+    def test_assignment(self) -> None:
+        self.m[0, 0] = -1
+        self.m[1:, 2:] = [[60, 70], [100, 110]]
+        self.m[:, 1] = ["a", "b", "c"]
+        self.m.T[0, 1:] = [40, 80]
+        self.assertEqual(self.src, [-1, "a", 2, 3, 40, "b", 60, 70, 80, "c", 100, 110])
+        with self.assertRaises(ValueError):
+            self.m[1:, 2:] = [[0, 0]]
+
+    def test_nested_views_share_source(self) -> None:
+        block = self.m[1:, 1:]
+        block[0, 0] = "x"
+        self.assertIs(block.source, self.src)
+        self.assertEqual(self.src[5], "x")
+        self.assertEqual(block.T[2, 1], 11)
+
+
+if __name__ == "__main__":
+    unittest.main()
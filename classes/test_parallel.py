@@ -0,0 +1,105 @@
+"""
+test_parallel.py
+18 October 2026 01:45:45
+
+Unit test file for parallel.py
+"""
+
+import operator
+import random
+import unittest
+from array import array
+
+from buffer_view import BufferView
+from list_view import ListView
+from parallel import parallel_filter, parallel_map, parallel_reduce, parallel_sort
+
+
+def square(x: int) -> int:
+    return x * x
+
+
+def is_odd(x: int) -> bool:
+    return x % 2 == 1
+
+
+def last_digit(x: int) -> int:
+    return x % 10
+
+
+class TestParallel(unittest.TestCase):
+    """Unit tester class."""
+
+    def setUp(self) -> None:
+        self.src = list(range(100))
+        self.view = ListView(self.src, 97, 2, -3)
+        self.buffer = BufferView(array("q", self.src), 97, 2, -3)
+
+    def test_partition(self) -> None:
+        chunks = self.view.partition(4)
+        self.assertEqual([len(chunk) for chunk in chunks], [8, 8, 8, 8])
+        self.assertEqual(sum((list(chunk) for chunk in chunks), []),
+                         list(self.view))
+        chunks = ListView([1, 2]).partition(3)
+        self.assertEqual([list(chunk) for chunk in chunks], [[1], [2], []])
+        with self.assertRaises(ValueError):
+            self.view.partition(0)
+
+    def test_parallel_map(self) -> None:
+        expected = [x * x for x in self.view]
+        for view in (self.view, self.buffer):
+            for threads in (False, True):
+                self.assertEqual(
+                    parallel_map(view, square, 3, threads), expected)
+
+    def test_parallel_filter(self) -> None:
+        expected = [x for x in self.view if x % 2]
+        for view in (self.view, self.buffer):
+            for threads in (False, True):
+                self.assertEqual(
+                    parallel_filter(view, is_odd, 5, threads), expected)
+
+    def test_parallel_reduce(self) -> None:
+        expected = sum(self.view)
+        for view in (self.view, self.buffer):
+            self.assertEqual(
+                parallel_reduce(view, operator.add, workers=4), expected)
+            self.assertEqual(
+                parallel_reduce(view, operator.add, 1, 64, True), expected + 1)
+        empty = ListView([])
+        self.assertEqual(parallel_map(empty, square, 2), [])
+        self.assertEqual(parallel_reduce(empty, operator.add, 0, 2), 0)
+        with self.assertRaises(TypeError):
+            parallel_reduce(empty, operator.add, workers=2)
+
+    def test_parallel_sort(self) -> None:
+        rng = random.Random(7)
+        values = [rng.randrange(1000) for _ in range(100)]
+        for key in (None, last_digit):
+            for reverse in (False, True):
+                expected = list(values)
+                expected[97:2:-3] = sorted(values[97:2:-3], key=key, reverse=reverse)
+                for threads in (False, True):
+                    src = list(values)
+                    parallel_sort(ListView(src, 97, 2, -3), key, reverse, 3, threads)
+                    self.assertEqual(src, expected)
+                    buffer = array("q", values)
+                    parallel_sort(BufferView(buffer, 97, 2, -3), key, reverse, 3, threads)
+                    self.assertEqual(buffer.tolist(), expected)
+
+    def test_parallel_sort_stable(self) -> None:
+        src = [(i % 3, i) for i in range(50)]
+        expected = sorted(src, key=operator.itemgetter(0))
+        parallel_sort(ListView(src), operator.itemgetter(0), workers=4)
+        self.assertEqual(src, expected)
+        buffer = array("d", [0.5, -1.0, 2.0, 0.0, -0.0])
+        parallel_sort(BufferView(buffer), workers=2)
+        self.assertEqual([str(x) for x in buffer], ["-1.0", "0.0", "-0.0", "0.5", "2.0"])
+        empty = BufferView(array("q"))
+        parallel_sort(empty, workers=2)
+        parallel_sort(ListView([]), workers=2)
+        self.assertEqual(len(empty), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+"""
+test_pipeline.py
+18 October 2026 01:40:30
+
+Unit test file for pipeline.py
+"""
+
+import itertools
+import unittest
+
+from pipeline import Pipeline
+
+
+class TestPipeline(unittest.TestCase):
+    """Unit tester class."""
+
+    def setUp(self) -> None:
+        self.src = list(range(10))
+        self.pipeline = Pipeline(self.src)
+
+    def test_identity(self) -> None:
+        self.assertEqual(self.pipeline.to_list(), self.src)
+        self.assertIs(self.pipeline.source, self.src)
+
+    def test_map_filter(self) -> None:
+        result = self.pipeline.filter(lambda x: x % 2).map(lambda x: x * x)
+        self.assertEqual(list(result), [1, 9, 25, 49, 81])
+
+    def test_branching(self) -> None:
+        evens = self.pipeline.filter(lambda x: x % 2 == 0)
+        doubled = evens.map(lambda x: 2 * x)
+        self.assertEqual(evens.to_list(), [0, 2, 4, 6, 8])
+        self.assertEqual(doubled.to_list(), [0, 4, 8, 12, 16])
+
+    def test_take(self) -> None:
+        infinite = Pipeline(itertools.count())
+        self.assertEqual(infinite.map(lambda x: -x).take(3).to_list(),
+                         [0, -1, -2])
+        self.assertEqual(self.pipeline.take(0).to_list(), [])
+        with self.assertRaises(ValueError):
+            self.pipeline.take(-1)
+
+    def test_first(self) -> None:
+        self.assertEqual(self.pipeline.filter(lambda x: x > 6).first(), 7)
+        self.assertIsNone(self.pipeline.filter(lambda x: x > 9).first())
+        self.assertEqual(Pipeline([]).first("empty"), "empty")
+
+    def test_reduce(self) -> None:
+        self.assertEqual(self.pipeline.reduce(lambda a, b: a + b), 45)
+        self.assertEqual(self.pipeline.reduce(lambda a, b: a + b, 5), 50)
+        self.assertEqual(Pipeline([]).reduce(lambda a, b: a + b, None), None)
+        with self.assertRaises(TypeError):
+            Pipeline([]).reduce(lambda a, b: a + b)
+
+    def test_for_each(self) -> None:
+        seen = []
+        self.pipeline.take(3).for_each(seen.append)
+        self.assertEqual(seen, [0, 1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+"""
+test_record_view.py
+18 October 2026 01:53:15
+
+Unit test file for record_view.py
+"""
+
+import os
+import struct
+import tempfile
+import unittest
+from unittest import mock
+
+from record_view import RecordFile, RecordView
+
+
+class TestRecordView(unittest.TestCase):
+    """Unit tester class."""
+
+    FMT = "<Ih"
+
+    def setUp(self) -> None:
+        fd, self.path = tempfile.mkstemp(suffix=".bin")
+        self.records = [(i, -i) for i in range(20)]
+        with os.fdopen(fd, "wb") as file:
+            for record in self.records:
+                file.write(struct.pack(self.FMT, *record))
+
+    def tearDown(self) -> None:
+        os.remove(self.path)
+
+    def read_back(self) -> list:
+        with open(self.path, "rb") as file:
+            return list(struct.iter_unpack(self.FMT, file.read()))
+
+    def test_read(self) -> None:
+        with RecordView(self.path, self.FMT) as view:
+            self.assertEqual(len(view), 20)
+            self.assertEqual(view[3], (3, -3))
+            self.assertEqual(view[-1], (19, -19))
+            self.assertEqual(list(view), self.records)
+            self.assertEqual(view[2:8], self.records[2:8])
+            self.assertEqual(view[17:2:-3], self.records[17:2:-3])
+            self.assertEqual(view[::-1], self.records[::-1])
+            self.assertEqual(view[5:5], [])
+            with self.assertRaises(IndexError):
+                view[20]
+
+    def test_strided_views(self) -> None:
+        with RecordView(self.path, self.FMT, 18, -1, -4) as view:
+            self.assertEqual(list(view), self.records[18::-4])
+            sub = view.subview(slice(1, None, 2))
+            self.assertIsInstance(sub, RecordView)
+            self.assertIs(sub.source, view.source)
+            self.assertEqual(list(sub), self.records[18::-4][1::2])
+            self.assertIn((10, -10), view)
+            self.assertEqual(view.index((6, -6)), 3)
+            self.assertEqual(view.map(lambda rec: rec[0]).to_list(), [18, 14, 10, 6, 2])
+
+    def test_search_tail_view(self) -> None:
+        getitem = RecordFile.__getitem__
+        with RecordView(self.path, self.FMT, 15, 20) as view, \
+                mock.patch.object(RecordFile, "__iter__", side_effect=AssertionError("file iterated")), \
+                mock.patch.object(RecordFile, "__getitem__", autospec=True, side_effect=getitem) as spy:
+            self.assertIn((17, -17), view)
+            self.assertNotIn((3, -3), view)
+            self.assertEqual(view.count((19, -19)), 1)
+            self.assertEqual(view.index((18, -18)), 3)
+            self.assertEqual(view.subview(slice(None, None, -2)).index((15, -15)), 2)
+            for (_, index), _ in spy.call_args_list:
+                self.assertGreaterEqual(min(range(20)[index]) if isinstance(index, slice) else index, 15)
+
+    def test_write(self) -> None:
+        with RecordView(self.path, self.FMT, writable=True) as view:
+            view[0] = (100, 1)
+            view[1:4] = [(7, 7)] * 3
+            view[19:9:-5] = [(50, 5), (60, 6)]
+            evens = view.subview(slice(4, 12, 2))
+            evens.reverse()
+            view.flush()
+        expected = list(self.records)
+        expected[0] = (100, 1)
+        expected[1:4] = [(7, 7)] * 3
+        expected[19:9:-5] = [(50, 5), (60, 6)]
+        expected[4:12:2] = expected[10:3:-2]
+        self.assertEqual(self.read_back(), expected)
+
+    def test_write_errors(self) -> None:
+        with RecordView(self.path, self.FMT) as view:
+            with self.assertRaises(TypeError):
+                view[0] = (1, 1)  # mapped read-only
+        with RecordView(self.path, self.FMT, writable=True) as view:
+            with self.assertRaises(ValueError):
+                view[0:3] = [(1, 1)]
+            with self.assertRaises(TypeError):
+                del view[0]
+            with self.assertRaises(TypeError):
+                view.insert(0, (1, 1))
+
+    def test_scalar_records(self) -> None:
+        with RecordView(self.path, "<i", writable=True) as view:
+            self.assertEqual(len(view), 30)
+            self.assertIsInstance(view[0], int)
+            view[::3] = range(10)
+            self.assertEqual(view[::3], list(range(10)))
+            view.sort()
+            self.assertEqual(list(view), sorted(view))
+
+    def test_shared_file(self) -> None:
+        records = RecordFile(self.path, self.FMT)
+        a = RecordView(records, start=5)
+        b = RecordView(records, self.FMT, 0, 5)
+        self.assertEqual(list(a) + list(b), self.records[5:] + self.records[:5])
+        with self.assertRaises(ValueError):
+            RecordView(records, "<q")
+        a.close()
+        self.assertTrue(records.closed)
+
+    def test_bad_files(self) -> None:
+        with self.assertRaises(ValueError):
+            RecordView(self.path, "<7s")  # 120 bytes are not whole 7-byte records
+        with self.assertRaises(TypeError):
+            RecordView(self.path)
+        open(self.path, "wb").close()
+        with self.assertRaises(ValueError):
+            RecordView(self.path, self.FMT)
+
+
+if __name__ == "__main__":
+    unittest.main()
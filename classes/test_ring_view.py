@@ -0,0 +1,105 @@
+"""
+test_ring_view.py
+18 October 2026 02:12:49
+
+Unit test file for ring_view.py
+"""
+
+import collections
+import random
+import unittest
+
+from chain_view import ChainView
+from ring_view import RingView
+
+
+class TestRingView(unittest.TestCase):
+    """Unit tester class."""
+
+    def setUp(self) -> None:
+        self.src = ["x"] + [None] * 5 + ["y"]
+        self.ring = RingView(self.src, 1, 6)
+
+    def test_append_wraps(self) -> None:
+        self.assertEqual(self.ring.capacity, 5)
+        self.assertEqual(len(self.ring), 0)
+        for i in range(7):
+            self.ring.append(i)
+        self.assertTrue(self.ring.full)
+        self.assertEqual(list(self.ring), [2, 3, 4, 5, 6])
+        self.assertEqual(self.src, ["x", 5, 6, 2, 3, 4, "y"])
+        self.assertEqual(self.ring.head, 2)
+        self.assertEqual(self.ring.to_list(), [2, 3, 4, 5, 6])
+
+    def test_segments(self) -> None:
+        for i in range(7):
+            self.ring.append(i)
+        older, newer = self.ring.segments()
+        self.assertEqual((older.tuple, newer.tuple), ((3, 6, 1), (1, 3, 1)))
+        self.ring.clear()
+        self.ring.append("a")
+        older, newer = self.ring.segments()
+        self.assertEqual((list(older), list(newer)), (["a"], []))
+
+    def test_indexing(self) -> None:
+        self.ring.extend(range(8))
+        expected = [3, 4, 5, 6, 7]
+        for i in range(-5, 5):
+            self.assertEqual(self.ring[i], expected[i])
+        with self.assertRaises(IndexError):
+            self.ring[5]
+        for s in (slice(None), slice(1, 4), slice(None, None, -1), slice(4, 0, -2), slice(1, None, 3)):
+            self.assertEqual(self.ring[s], expected[s], s)
+        self.ring[-1] = "new"
+        self.ring[::2] = ["a", "b", "c"]
+        self.assertEqual(list(self.ring), ["a", 4, "b", 6, "c"])
+
+    def test_subview(self) -> None:
+        self.ring.extend(range(8))
+        sub = self.ring.subview(slice(1, 4))
+        self.assertIsInstance(sub, ChainView)
+        self.assertEqual(list(sub), [4, 5, 6])
+        sub[2] = "z"
+        self.assertEqual(self.ring[3], "z")
+
+    def test_matches_deque(self) -> None:
+        rng = random.Random(3)
+        for step in (1, 2, -3):
+            src = list(range(30))
+            ring = RingView(src, 20, 2, -3) if step < 0 else RingView(src, 3, 20, step)
+            model = collections.deque(maxlen=ring.capacity)
+            for _ in range(200):
+                choice = rng.randrange(4)
+                if choice == 0:
+                    value = rng.random()
+                    ring.append(value)
+                    model.append(value)
+                elif choice == 1:
+                    values = [rng.random() for _ in range(rng.randint(0, 2 * ring.capacity))]
+                    ring.extend(iter(values))
+                    model.extend(values)
+                elif choice == 2 and model:
+                    self.assertEqual(ring.popleft(), model.popleft())
+                self.assertEqual(list(ring), list(model))
+                self.assertEqual(len(ring), len(model))
+
+    def test_full_and_errors(self) -> None:
+        ring = RingView(list(range(4)), full=True)
+        self.assertEqual(list(ring), [0, 1, 2, 3])
+        ring.append(4)
+        self.assertEqual(list(ring), [1, 2, 3, 4])
+        ring.clear()
+        with self.assertRaises(IndexError):
+            ring.popleft()
+        with self.assertRaises(ValueError):
+            RingView([])
+
+    def test_higher_order(self) -> None:
+        self.ring.extend(range(9))
+        self.assertEqual(self.ring.map(lambda x: x * 2).to_list(), [8, 10, 12, 14, 16])
+        self.assertEqual(self.ring.filter(lambda x: x % 2).to_list(), [5, 7])
+        self.assertEqual(self.ring.reduce(max), 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+"""
+test_rolling.py
+18 October 2026 01:49:00
+
+Unit test file for rolling.py
+"""
+
+import random
+import unittest
+
+from list_view import ListView
+from rolling import rolling_max, rolling_min, rolling_sum
+
+
+class TestRolling(unittest.TestCase):
+    """Unit tester class."""
+
+    def test_against_naive(self) -> None:
+        rng = random.Random(8)
+        src = [rng.randint(-50, 50) for _ in range(200)]
+        view = ListView(src, 190, 3, -3)
+        items = list(view)
+        for size in (1, 2, 5, len(items)):
+            windows = [items[i:i + size]
+                       for i in range(len(items) - size + 1)]
+            self.assertEqual(list(rolling_sum(view, size)),
+                             list(map(sum, windows)))
+            self.assertEqual(list(rolling_min(view, size)),
+                             list(map(min, windows)))
+            self.assertEqual(list(rolling_max(view, size)),
+                             list(map(max, windows)))
+
+    def test_short_input(self) -> None:
+        for func in (rolling_sum, rolling_min, rolling_max):
+            self.assertEqual(list(func([1, 2], 3)), [])
+            with self.assertRaises(ValueError):
+                list(func([1, 2], 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+test_snapshot.py
+18 October 2026 01:50:35
+
+Unit test file for snapshot.py
+"""
+
+import copy
+import unittest
+from array import array
+
+import snapshot
+from buffer_view import BufferView
+from list_view import ListView
+
+
+class TestSnapshot(unittest.TestCase):
+    """Unit tester class."""
+
+    def setUp(self) -> None:
+        self.src = [[i] for i in range(100)]
+        self.view = ListView(self.src, 95, 4, -3)  # 31 elements
+        self.expected = copy.deepcopy(list(self.view))
+        self.snap = self.view.snapshot(page_size=4)
+
+    def test_reads_share_until_written(self) -> None:
+        self.assertEqual(len(self.snap), 31)
+        self.assertEqual(self.snap.page_count, 8)
+        self.assertEqual(list(self.snap), self.expected)
+        self.assertIs(self.snap[0], self.src[95])
+        self.assertEqual(self.snap.copied_pages, 0)
+        self.assertEqual(self.snap[-2:], self.expected[-2:])
+        with self.assertRaises(IndexError):
+            self.snap[31]
+
+    def test_snapshot_write(self) -> None:
+        self.snap[5] = "changed"
+        self.assertEqual(self.snap.copied_pages, 1)
+        self.assertEqual(self.snap[5], "changed")
+        self.assertEqual(self.src[80], [80])
+        self.assertIsNot(self.snap[4], self.src[83])  # deep-copied page
+
+    def test_source_writes_through_views(self) -> None:
+        self.view[0] = "zero"
+        ListView(self.src)[::2] = ["even"] * 50  # touches every page
+        self.assertEqual(self.snap.to_list(), self.expected)
+        self.assertTrue(self.snap.detached)
+
+    def test_partial_source_writes(self) -> None:
+        other = ListView(self.src, 40, 60)
+        other.fill([None])  # source indices 40..59 are view indices 12..18
+        self.assertEqual(self.snap.copied_pages, 2)  # pages 3 and 4
+        other.sort(key=id)
+        other.reverse()
+        other.rotate(3)
+        other.swap(0, 1)
+        other += ListView([[0]] * 20)
+        self.assertEqual(self.snap.to_list(), self.expected)
+        self.assertEqual(self.snap.copied_pages, 2)
+
+    def test_deletion_copies_everything(self) -> None:
+        del ListView(self.src)[0]
+        self.assertTrue(self.snap.detached)
+        self.assertEqual(self.snap.to_list(), self.expected)
+
+    def test_buffer_view(self) -> None:
+        src = array("q", range(1000))
+        snap = BufferView(src).snapshot()
+        view = BufferView(src, 500)
+        view += 1
+        self.assertEqual(snap.copied_pages, 3)  # pages 1, 2 and 3 of 4
+        self.assertEqual(snap.to_list(), list(range(1000)))
+
+    def test_release(self) -> None:
+        source_id = id(self.src)
+        self.assertIn(source_id, snapshot._watchers)
+        del self.snap
+        self.view[0] = None
+        self.assertNotIn(source_id, snapshot._watchers)
+
+
+if __name__ == "__main__":
+    unittest.main()
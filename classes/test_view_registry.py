@@ -0,0 +1,139 @@
+"""
+test_view_registry.py
+18 October 2026 01:48:12
+
+Unit test file for view_registry.py
+"""
+
+import random
+import unittest
+
+from list_view import ListView
+from view_registry import TrackedList
+
+
+class TestViewRegistry(unittest.TestCase):
+    """Unit tester class."""
+
+    def setUp(self) -> None:
+        self.src = TrackedList([i] for i in range(20))
+        self.head = self.src.view(0, 5)
+        self.middle = self.src.view(5, 15)
+        self.reverse = self.src.view(14, 4, -1)
+        self.strided = self.src.view(10, 20, 3)
+        self.tail = self.src.view(18)
+
+    def snapshot(self) -> dict:
+        return {name: list(getattr(self, name)) for name in
+                ("head", "middle", "reverse", "strided", "tail")}
+
+    def test_registration(self) -> None:
+        self.assertEqual(len(self.src.registry), 5)
+        self.assertIn(self.middle, self.src.registry)
+        self.assertNotIn(ListView(self.src, 5, 15), self.src.registry)
+        self.src.untrack(self.middle)
+        self.assertNotIn(self.middle, self.src.registry)
+        with self.assertRaises(ValueError):
+            self.src.untrack(self.middle)
+        with self.assertRaises(ValueError):
+            self.src.track(ListView([]))
+
+    def test_delete_before_and_inside(self) -> None:
+        before = self.snapshot()
+        deleted = self.src[7]
+        del self.src[7]
+        after = self.snapshot()
+        self.assertEqual(after["head"], before["head"])
+        self.assertEqual(after["tail"], before["tail"])
+        self.assertEqual(after["strided"], before["strided"])
+        self.assertEqual(after["middle"],
+                         [x for x in before["middle"] if x is not deleted])
+        self.assertEqual(after["reverse"],
+                         [x for x in before["reverse"] if x is not deleted])
+
+    def test_delete_slice(self) -> None:
+        before = self.snapshot()
+        deleted = self.src[2:12]
+        del self.src[2:12]
+        for name, items in self.snapshot().items():
+            self.assertEqual(
+                items, [x for x in before[name] if x not in deleted], name)
+
+    def test_strided_views(self) -> None:
+        with self.assertRaises(ValueError):
+            del self.src[14]  # between strided members 13 and 16
+        self.assertEqual(len(self.src), 20)
+        del self.src[10]  # the first strided member is dropped
+        self.assertEqual(list(self.strided), [[13], [16], [19]])
+        self.src.pop()  # the last one too
+        self.assertEqual(list(self.strided), [[13], [16]])
+        with self.assertRaises(ValueError):
+            self.src.view(0, 10, 2).insert(0, None)
+        with self.assertRaises(ValueError):
+            self.src.insert(2, None)  # inside the new strided view
+
+    def test_insert(self) -> None:
+        before = self.snapshot()
+        new = ["new"]
+        self.src.insert(10, new)
+        after = self.snapshot()
+        self.assertEqual(after["head"], before["head"])
+        self.assertEqual(after["tail"], before["tail"])
+        self.assertEqual(after["middle"], before["middle"][:5] + [new]
+                         + before["middle"][5:])
+        self.assertEqual(after["reverse"], before["reverse"][:5] + [new]
+                         + before["reverse"][5:])
+
+    def test_view_insert(self) -> None:
+        self.src.untrack(self.strided)
+        before = self.snapshot()
+        self.middle.insert(0, "first")
+        self.middle.insert(len(self.middle), "last")
+        self.reverse.insert(0, "reverse first")
+        after = self.snapshot()
+        self.assertEqual(after["middle"],
+                         ["first"] + before["middle"] + ["reverse first", "last"])
+        self.assertEqual(after["reverse"], ["reverse first"] + before["reverse"])
+        self.assertEqual(after["head"], before["head"])
+        self.assertEqual(after["tail"], before["tail"])
+        self.assertEqual(self.src[5], "first")
+
+    def test_view_delitem(self) -> None:
+        before = self.snapshot()
+        del self.middle[2:5]
+        after = self.snapshot()
+        self.assertEqual(after["middle"], before["middle"][:2] + before["middle"][5:])
+        self.assertEqual(after["tail"], before["tail"])
+
+    def test_replace_and_clear(self) -> None:
+        before = self.snapshot()
+        self.src[0:2] = ["a", "b", "c"]
+        self.assertEqual(list(self.head), ["a", "b", "c"] + before["head"][2:])
+        self.assertEqual(list(self.tail), before["tail"])
+        self.src.remove("b")
+        self.assertEqual(list(self.head), ["a", "c"] + before["head"][2:])
+        self.src.clear()
+        self.assertEqual(self.snapshot(), dict.fromkeys(before, []))
+
+    def test_random_deletions(self) -> None:
+        rng = random.Random(2425)
+        for _ in range(50):
+            src = TrackedList(object() for _ in range(60))
+            views = [src.view(*slice(rng.randint(0, 60), rng.randint(0, 60),
+                                     rng.choice((1, -1))).indices(60))
+                     for _ in range(20)]
+            expected = [list(view) for view in views]
+            for _ in range(10):
+                if not src:
+                    break
+                index = slice(*sorted((rng.randrange(len(src)),
+                                       rng.randrange(len(src) + 1))))
+                deleted = set(map(id, src[index]))
+                del src[index]
+                expected = [[x for x in items if id(x) not in deleted]
+                            for items in expected]
+                self.assertEqual([list(view) for view in views], expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
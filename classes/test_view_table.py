@@ -0,0 +1,98 @@
+"""
+test_view_table.py
+18 October 2026 01:57:02
+
+Unit test file for view_table.py
+"""
+
+import os
+import struct
+import tempfile
+import unittest
+from array import array
+
+from buffer_view import BufferView
+from list_view import ListView
+from record_view import RecordView
+from view_table import ViewTable
+
+
+class TestViewTable(unittest.TestCase):
+    """Unit tester class."""
+
+    def setUp(self) -> None:
+        self.src = list(range(20))
+        self.table = ViewTable(self.src, [0, 5, 19, 4, 3], [3, 13, -1, 4, 4], [1, 2, -5, 1, 1])
+
+    def test_columns(self) -> None:
+        self.assertEqual(len(self.table), 5)
+        self.assertEqual(self.table.steps, array("q", [1, 2, -5, 1, 1]))
+        self.assertEqual(self.table.nbytes, 120)
+        self.assertEqual(ViewTable(self.src, [1, 2], [3, 4]).steps, array("q", [1, 1]))
+        with self.assertRaises(ValueError):
+            ViewTable(self.src, [1, 2], [3])
+        with self.assertRaises(ValueError):
+            ViewTable(self.src, [1], [3], [0])
+        with self.assertRaises(TypeError):
+            ViewTable(tuple(self.src))
+
+    def test_lengths(self) -> None:
+        self.assertEqual(self.table.lengths(), array("q", [3, 4, 4, 0, 1]))
+        self.assertEqual(self.table.lengths(), array("q", map(len, self.table)))
+
+    def test_firsts_and_lasts(self) -> None:
+        self.assertEqual(self.table.firsts(), [0, 5, 19, None, 3])
+        self.assertEqual(self.table.lasts(), [2, 11, 4, None, 3])
+        self.assertEqual(self.table.lasts(default=-1), [2, 11, 4, -1, 3])
+        full = self.table[:3]
+        self.assertEqual(full.firsts(), [view[0] for view in full])
+        self.assertEqual(full.lasts(), [view[-1] for view in full])
+
+    def test_materialize(self) -> None:
+        view = self.table[1]
+        self.assertIsInstance(view, ListView)
+        self.assertEqual(view.tuple, (5, 13, 2))
+        self.assertEqual(self.table[-1].tuple, (3, 4, 1))
+        self.assertEqual([v.tuple for v in self.table[::2]], [(0, 3, 1), (19, -1, -5), (3, 4, 1)])
+        with self.assertRaises(IndexError):
+            self.table[5]
+
+    def test_append_and_assign(self) -> None:
+        self.table.append(ListView(self.src, 7, 9))
+        self.table.append((1, 2, 1))
+        self.assertEqual(self.table.lengths()[-2:], array("q", [2, 1]))
+        self.table[0] = ListView(self.src, 10, 0, -3)
+        self.assertEqual(self.table[0].tuple, (10, 0, -3))
+        with self.assertRaises(ValueError):
+            self.table.append(ListView(list(self.src)))
+        with self.assertRaises(ValueError):
+            self.table[1] = (0, 1, 0)
+
+    def test_from_views(self) -> None:
+        buf = array("i", range(12))
+        views = BufferView(buf).partition(4)
+        table = ViewTable.from_views(views)
+        self.assertIs(table.source, buf)
+        self.assertEqual(list(table), views)
+        self.assertIsInstance(table[2], BufferView)
+        self.assertEqual(table.firsts(), [0, 3, 6, 9])
+        with self.assertRaises(ValueError):
+            ViewTable.from_views([])
+
+    def test_record_views(self) -> None:
+        fd, path = tempfile.mkstemp(suffix=".bin")
+        with os.fdopen(fd, "wb") as file:
+            file.write(b"".join(struct.pack("<Ih", i, -i) for i in range(10)))
+        try:
+            with RecordView(path, "<Ih") as view:
+                table = ViewTable.from_views([view.subview(slice(0, 3)), view.subview(slice(9, 4, -2))])
+                self.assertIsInstance(table[0], RecordView)
+                self.assertEqual(list(table[0]), [(0, 0), (1, -1), (2, -2)])
+                self.assertEqual([list(v) for v in table][1], [(9, -9), (7, -7), (5, -5)])
+                self.assertEqual(table.firsts(), [(0, 0), (9, -9)])
+        finally:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
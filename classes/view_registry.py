@@ -0,0 +1,370 @@
+"""
+view_registry.py
+18 October 2026 01:48:12
+
+Implements the TrackedList class, a list that keeps the bounds of the
+ListViews registered on it consistent when elements are inserted or
+deleted, and the ViewRegistry class that indexes those views.
+
+A plain list cannot tell its views that it shrank or grew, so every
+view after the edit point silently ends up pointing at shifted data.
+Views registered on a TrackedList instead follow their elements:
+
+    src = TrackedList(range(10))
+    head = src.view(0, 3)   # [0, 1, 2]
+    tail = src.view(7)      # [7, 8, 9]
+    del src[1]
+    print(list(head), list(tail))  # [0, 2] [7, 8, 9]
+    head.insert(0, -1)
+    print(list(head), list(tail))  # [-1, 0, 2] [7, 8, 9]
+
+Views with a step of 1 or -1 can absorb any edit. A view with a larger
+stride cannot represent an edit that lands strictly inside the run of
+elements it keeps, so such edits raise ValueError before the list is
+modified.
+
+Every mutation of a TrackedList also increments its `version`, so
+caches derived from its elements (see indexed_view.py) can cheaply
+detect writes that did not go through them.
+
+The registry keeps the views sorted by the highest source index they
+cover, so an edit at index i finds the affected views (those reaching
+i or beyond) with one bisection and only touches those: O(log n + k)
+for n registered views of which k are affected.
+"""
+
+import bisect
+import itertools
+from typing import Any, Iterable, Iterator, Optional
+
+from list_view import ListView
+
+
+def _bounds(view: ListView) -> tuple[int, int]:
+    """Return the lowest source index covered by a view and its length.
+
+    Empty views are positioned at their start index.
+    """
+    r = view.range
+    if not r:
+        return view.start, 0
+    return min(r[0], r[-1]), len(r)
+
+
+def _key(lo: int, n: int, step: int) -> int:
+    """Return the sort key of a view: the highest source index it covers.
+
+    Empty views sort just before their position.
+    """
+    if n == 0:
+        return lo - 1
+    return lo + (n - 1) * abs(step)
+
+
+def _edited(lo: int, n: int, step: int, deleted: range, at: int, count: int) -> tuple[int, int]:
+    """Compute the bounds of a view after deleting then inserting elements of its source.
+
+    Args:
+        lo (int): Lowest source index covered by the view.
+        n (int): Length of the view.
+        step (int): Step of the view.
+        deleted (range): Ascending source indices deleted first. May be empty.
+        at (int): Source index at which elements are then inserted.
+        count (int): Number of elements inserted. May be zero.
+
+    Raises:
+        ValueError: The view has a stride above 1 and the edit falls inside its run of elements.
+
+    Returns:
+        tuple[int, int]: New lowest source index and new length.
+    """
+    s = abs(step)
+    replaced = False
+    if deleted:
+        below = bisect.bisect_left(deleted, lo)
+        if n == 0:
+            lo -= below
+        elif s == 1:
+            removed = bisect.bisect_right(deleted, lo + n - 1) - below
+            replaced = removed > 0
+            n -= removed
+            lo -= below
+        else:
+            first = lo
+            last = lo + (n - 1) * s
+            while first <= last and first in deleted:
+                first += s
+            if first > last:
+                lo, n = lo - below, 0
+            else:
+                while last in deleted:
+                    last -= s
+                if bisect.bisect_left(deleted, last) > bisect.bisect_right(deleted, first):
+                    raise ValueError(
+                        "cannot delete inside a registered view with a step other than 1 or -1")
+                lo = first - bisect.bisect_left(deleted, first)
+                n = (last - first) // s + 1
+    if count:
+        if replaced and lo <= at <= lo + n:
+            # elements replacing some of a contiguous view's own elements join it
+            n += count
+        elif lo >= at:
+            lo += count
+        elif n and at <= lo + (n - 1) * s:
+            if s != 1:
+                raise ValueError(
+                    "cannot insert inside a registered view with a step other than 1 or -1")
+            n += count
+    return lo, n
+
+
+def _set_bounds(view: ListView, lo: int, n: int) -> None:
+    """Point a view at n elements starting from source index lo, keeping its step."""
+    step = view.step
+    if n == 0:
+        view.start = view.stop = lo
+    elif step > 0:
+        view.start = lo
+        view.stop = lo + n * step
+    else:
+        view.start = lo + (n - 1) * -step
+        view.stop = view.start + n * step
+
+
+class ViewRegistry:
+    """Index of the views registered on a TrackedList, sorted by highest covered source index."""
+
+    __slots__ = ("_keys", "_views")
+
+    def __init__(self) -> None:
+        self._keys = []
+        self._views = []
+
+    def __len__(self) -> int:
+        return len(self._views)
+
+    def __iter__(self) -> Iterator[ListView]:
+        return iter(self._views)
+
+    def __contains__(self, view: Any) -> bool:
+        return self._find(view) is not None
+
+    def _find(self, view: Any) -> Optional[int]:
+        """Return the position of a registered view in the index, or None."""
+        if not isinstance(view, ListView):
+            return None
+        key = _key(*_bounds(view), view.step)
+        lo = bisect.bisect_left(self._keys, key)
+        hi = bisect.bisect_right(self._keys, key)
+        for i in range(lo, hi):
+            if self._views[i] is view:
+                return i
+        return None
+
+    def register(self, view: ListView) -> None:
+        """Add a view to the index."""
+        key = _key(*_bounds(view), view.step)
+        i = bisect.bisect_right(self._keys, key)
+        self._keys.insert(i, key)
+        self._views.insert(i, view)
+
+    def unregister(self, view: ListView) -> None:
+        """Remove a view from the index.
+
+        Raises:
+            ValueError: The view is not registered.
+        """
+        i = self._find(view)
+        if i is None:
+            raise ValueError("view is not registered")
+        del self._keys[i]
+        del self._views[i]
+
+    def reindex(self) -> None:
+        """Rebuild the index after the bounds of registered views were changed by hand."""
+        views = self._views
+        self._keys.clear()
+        self._views = []
+        for view in views:
+            self.register(view)
+
+    def plan(self, deleted: range, at: int, count: int) -> tuple[int, list]:
+        """Compute the new bounds of every view affected by an edit, without applying them.
+
+        Args:
+            deleted (range): Ascending source indices deleted first. May be empty.
+            at (int): Source index at which elements are then inserted.
+            count (int): Number of elements inserted. May be zero.
+
+        Raises:
+            ValueError: A registered view cannot absorb the edit.
+
+        Returns:
+            tuple[int, list]: Index of the first affected view and the new (lo, n) of each affected view.
+        """
+        first = deleted[0] if deleted else at
+        if count:
+            first = min(first, at)
+        i = bisect.bisect_left(self._keys, first - 1)
+        bounds = [_edited(*_bounds(view), view.step, deleted, at, count)
+                  for view in itertools.islice(self._views, i, None)]
+        return i, bounds
+
+    def commit(self, plan: tuple[int, list]) -> None:
+        """Apply the new bounds computed by `plan` and restore the index order."""
+        i, bounds = plan
+        views = self._views[i:]
+        del self._keys[i:]
+        del self._views[i:]
+        entries = []
+        for view, (lo, n) in zip(views, bounds):
+            _set_bounds(view, lo, n)
+            entries.append((_key(lo, n, view.step), view))
+        entries.sort(key=lambda entry: entry[0])
+        for key, view in entries:
+            if self._keys and key < self._keys[-1]:
+                # only strided views losing their tail can move backwards
+                j = bisect.bisect_right(self._keys, key)
+                self._keys.insert(j, key)
+                self._views.insert(j, view)
+            else:
+                self._keys.append(key)
+                self._views.append(view)
+
+
+class TrackedList(list):
+    """List that updates the bounds of its registered views on insertion and deletion."""
+
+    __slots__ = ("_registry", "_version")
+
+    def __init__(self, iterable: Iterable = ()) -> None:
+        super().__init__(iterable)
+        self._registry = ViewRegistry()
+        self._version = 0
+
+    @property
+    def registry(self) -> ViewRegistry:
+        """The index of views registered on this list."""
+        return self._registry
+
+    @property
+    def version(self) -> int:
+        """Counter incremented by every mutation of the list."""
+        return self._version
+
+    # **************************************************
+    #                   VIEWS
+    # **************************************************
+
+    def view(self, start: int = 0, stop: int = ..., step: int = 1) -> ListView:
+        """Construct and register a view of this list. See `ListView.__init__`."""
+        view = ListView(self, start, stop, step)
+        self._registry.register(view)
+        return view
+
+    def track(self, view: ListView) -> None:
+        """Register an existing view of this list.
+
+        Raises:
+            ValueError: The view does not track this list.
+        """
+        if view.source is not self:
+            raise ValueError("view does not track this list")
+        self._registry.register(view)
+
+    def untrack(self, view: ListView) -> None:
+        """Unregister a view so it is no longer updated."""
+        self._registry.unregister(view)
+
+    # **************************************************
+    #           LENGTH-CHANGING MUTATIONS
+    # **************************************************
+
+    def _positions(self, index: Any) -> range:
+        """Helper function for converting an index or slice to ascending source indices."""
+        if isinstance(index, slice):
+            r = range(len(self))[index]
+            return r if r.step > 0 else r[::-1]
+        try:
+            i = range(len(self))[index]
+        except IndexError:
+            raise IndexError("list assignment index out of range") from None
+        return range(i, i + 1)
+
+    def __delitem__(self, index: Any) -> None:
+        plan = self._registry.plan(self._positions(index), 0, 0)
+        super().__delitem__(index)
+        self._version += 1
+        self._registry.commit(plan)
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        if not isinstance(index, slice) or index.step not in (None, 1):
+            super().__setitem__(index, value)
+            self._version += 1
+            return
+        value = list(value)
+        deleted = self._positions(index)
+        if len(value) == len(deleted):
+            super().__setitem__(index, value)
+            self._version += 1
+            return
+        at = slice(index.start, index.stop).indices(len(self))[0]
+        plan = self._registry.plan(deleted, at, len(value))
+        super().__setitem__(index, value)
+        self._version += 1
+        self._registry.commit(plan)
+
+    def insert(self, index: int, value: Any) -> None:
+        at = min(max(index + len(self) if index < 0 else index, 0), len(self))
+        plan = self._registry.plan(range(0), at, 1)
+        super().insert(at, value)
+        self._version += 1
+        self._registry.commit(plan)
+
+    def pop(self, index: int = -1) -> Any:
+        if not self:
+            raise IndexError("pop from empty list")
+        deleted = self._positions(index)
+        plan = self._registry.plan(deleted, 0, 0)
+        value = super().pop(index)
+        self._version += 1
+        self._registry.commit(plan)
+        return value
+
+    def remove(self, value: Any) -> None:
+        del self[self.index(value)]
+
+    def clear(self) -> None:
+        del self[:]
+
+    # **************************************************
+    #           OTHER MUTATIONS
+    # **************************************************
+
+    def append(self, value: Any) -> None:
+        super().append(value)
+        self._version += 1
+
+    def extend(self, iterable: Iterable) -> None:
+        super().extend(iterable)
+        self._version += 1
+
+    def __iadd__(self, iterable: Iterable) -> "TrackedList":
+        self.extend(iterable)
+        return self
+
+    def __imul__(self, n: int) -> "TrackedList":
+        if n <= 0:
+            self.clear()
+        else:
+            super().__imul__(n)
+            self._version += 1
+        return self
+
+    def sort(self, *, key: Any = None, reverse: bool = False) -> None:
+        super().sort(key=key, reverse=reverse)
+        self._version += 1
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._version += 1
@@ -0,0 +1,261 @@
+"""
+view_table.py
+18 October 2026 01:57:02
+
+Implements the ViewTable class, a struct-of-arrays store for the
+start:stop:step positioning of many views of one source.
+
+A ListView costs a Python object per view. A ViewTable instead keeps
+three parallel `array('q')` columns, 24 bytes per view, and creates
+ListView objects only when one is asked for:
+
+    src = list(range(100))
+    table = ViewTable(src, range(0, 100, 10), range(5, 105, 10))
+    table.lengths()    # array('q', [5, 5, ..., 5])
+    table.firsts()     # [0, 10, 20, ..., 90]
+    table.lasts()      # [4, 14, 24, ..., 94]
+    table[3]           # ListView(src, 30, 35, 1)
+
+Column-wide queries (lengths, first/last elements) run as builtin map
+over the columns, without a Python-level loop or per-view objects.
+"""
+
+import collections
+import itertools
+import operator
+from array import array
+from typing import Any, Iterable, Iterator, Union
+
+from list_view import ListView
+
+
+class ViewTable:
+    """Compact table of the start, stop and step of many views of one source."""
+
+    __slots__ = ("_object", "_storage", "_type", "_starts", "_stops", "_steps")
+
+    def __init__(self, source: Any, starts: Iterable[int] = (), stops: Iterable[int] = (), steps: Iterable[int] = None, view_type: type = ListView) -> None:
+        """Construct a table of views of the source.
+
+        Args:
+            source (Any): The object the views track, e.g. a list.
+            starts (Iterable[int], optional): Start index of each view. Defaults to no views.
+            stops (Iterable[int], optional): Stop index of each view. Must have as many entries as `starts`.
+            steps (Iterable[int], optional): Step of each view. Defaults to 1 for every view.
+            view_type (type, optional): ListView subclass to materialize views as, e.g. BufferView. Defaults to ListView.
+
+        Raises:
+            ValueError: The columns have different lengths, or a step is zero.
+        """
+        self._object = source
+        self._storage = view_type._storage(source)
+        self._type = view_type
+        self._starts = array("q", starts)
+        self._stops = array("q", stops)
+        if steps is None:
+            self._steps = array("q", [1]) * len(self._starts)
+        else:
+            self._steps = array("q", steps)
+        if not len(self._starts) == len(self._stops) == len(self._steps):
+            raise ValueError("starts, stops and steps must have the same length")
+        if 0 in self._steps:
+            raise ValueError("step cannot be zero")
+
+    @classmethod
+    def from_views(cls, views: Iterable[ListView]) -> "ViewTable":
+        """Construct a table from existing views of one source.
+
+        Args:
+            views (Iterable[ListView]): Views to store. At least one is required to determine the source.
+
+        Raises:
+            ValueError: There are no views, or they track different sources.
+
+        Returns:
+            ViewTable: Table of the positioning of every view, in order.
+        """
+        views = iter(views)
+        first = next(views, None)
+        if first is None:
+            raise ValueError("from_views() requires at least one view")
+        table = cls(first.source, view_type=type(first))
+        table.append(first)
+        table.extend(views)
+        return table
+
+    # **************************************************
+    #                   PROPERTIES
+    # **************************************************
+
+    @property
+    def source(self) -> Any:
+        """The object that the views track."""
+        return self._object
+
+    @property
+    def starts(self) -> array:
+        """The start index of each view."""
+        return self._starts
+
+    @property
+    def stops(self) -> array:
+        """The stop index of each view."""
+        return self._stops
+
+    @property
+    def steps(self) -> array:
+        """The step of each view."""
+        return self._steps
+
+    @property
+    def nbytes(self) -> int:
+        """The memory used by the three columns in bytes."""
+        return 3 * len(self) * self._starts.itemsize
+
+    # **************************************************
+    #               ADDING VIEWS
+    # **************************************************
+
+    def append(self, view: Union[ListView, tuple]) -> None:
+        """Add a view to the table.
+
+        Args:
+            view (Union[ListView, tuple]): A view of the same source, or a (start, stop, step) tuple.
+
+        Raises:
+            ValueError: The view tracks a different source, or its step is zero.
+        """
+        if isinstance(view, ListView):
+            if view.source is not self._object:
+                raise ValueError("view does not track the source of this table")
+            view = view.tuple
+        start, stop, step = view
+        if step == 0:
+            raise ValueError("step cannot be zero")
+        self._starts.append(start)
+        self._stops.append(stop)
+        self._steps.append(step)
+
+    def extend(self, views: Iterable[Union[ListView, tuple]]) -> None:
+        """Add several views to the table. See `append`."""
+        for view in views:
+            self.append(view)
+
+    # **************************************************
+    #               COLUMN-WIDE QUERIES
+    # **************************************************
+
+    def _ranges(self) -> Iterator[range]:
+        """Helper function yielding the range of source indices of each view."""
+        return map(range, self._starts, self._stops, self._steps)
+
+    def lengths(self) -> array:
+        """Return the length of every view.
+
+        Returns:
+            array: array('q') of lengths, in table order.
+        """
+        return array("q", map(len, self._ranges()))
+
+    def _gather(self, positions: Iterable[int], lengths: array, default: Any) -> list:
+        """Helper function for reading one source element per view, or a default for empty views.
+
+        Args:
+            positions (Iterable[int]): Source index to read for each view. Ignored for empty views.
+            lengths (array): Length of each view.
+            default (Any): Value to use for empty views.
+
+        Returns:
+            list: One element per view, in table order.
+        """
+        get = self._storage.__getitem__
+        if all(lengths):
+            return list(map(get, positions))
+        result = [default] * len(lengths)
+        rows = itertools.compress(itertools.count(), lengths)
+        items = map(get, itertools.compress(positions, lengths))
+        collections.deque(map(operator.setitem, itertools.repeat(result), rows, items), maxlen=0)
+        return result
+
+    def firsts(self, default: Any = None) -> list:
+        """Return the first element of every view.
+
+        Args:
+            default (Any, optional): Value to use for empty views. Defaults to None.
+
+        Returns:
+            list: One element per view, in table order.
+        """
+        return self._gather(self._starts, self.lengths(), default)
+
+    def lasts(self, default: Any = None) -> list:
+        """Return the last element of every view.
+
+        Args:
+            default (Any, optional): Value to use for empty views. Defaults to None.
+
+        Returns:
+            list: One element per view, in table order.
+        """
+        lengths = self.lengths()
+        # start + (length - 1) * step
+        offsets = map(operator.mul, map(operator.sub, lengths, itertools.repeat(1)), self._steps)
+        return self._gather(map(operator.add, self._starts, offsets), lengths, default)
+
+    # **************************************************
+    #           ACCESSING AND MUTATING
+    # **************************************************
+
+    def view(self, index: int) -> ListView:
+        """Materialize one view of the table.
+
+        Changes to the returned view's bounds are not written back; assign it to `table[index]` to do so.
+
+        Args:
+            index (int): Index of the view in the table.
+
+        Returns:
+            ListView: A new view object of type `view_type`.
+        """
+        try:
+            start, stop, step = self._starts[index], self._stops[index], self._steps[index]
+        except IndexError:
+            raise IndexError("ViewTable index out of range") from None
+        return self._type._from_bounds(self._object, start, stop, step)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[ListView, "ViewTable"]:
+        """Return a materialized view, or a new table of the selected views for slices."""
+        if isinstance(index, slice):
+            table = ViewTable(self._object, view_type=self._type)
+            table._starts = self._starts[index]
+            table._stops = self._stops[index]
+            table._steps = self._steps[index]
+            return table
+        return self.view(index)
+
+    def __setitem__(self, index: int, view: Union[ListView, tuple]) -> None:
+        if isinstance(view, ListView):
+            if view.source is not self._object:
+                raise ValueError("view does not track the source of this table")
+            view = view.tuple
+        start, stop, step = view
+        if step == 0:
+            raise ValueError("step cannot be zero")
+        try:
+            self._starts[index], self._stops[index], self._steps[index] = start, stop, step
+        except IndexError:
+            raise IndexError("ViewTable index out of range") from None
+
+    def __iter__(self) -> Iterator[ListView]:
+        """Materialize the views one at a time."""
+        return map(self._type._from_bounds, itertools.repeat(self._object), self._starts, self._stops, self._steps)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    # **************************************************
+    #               REPRESENTATIONS
+    # **************************************************
+
+    def __repr__(self) -> str:
+        return f"ViewTable(<{type(self._object).__name__} object at {hex(id(self._object))}>, views={len(self)}, view_type={self._type.__name__})"
@@ -5,42 +5,666 @@ endian.py
 01 July 2022 01:56:34
 
 Simple visualizer for integer storage on different endian
-architectures.
+architectures, and a bulk conversion engine for whole buffers.
+
+Usage:
+    python endian.py <type> <value>
+    python endian.py show int32 309
+    python endian.py batch [file] [--format {boxes,csv,json}]
+    python endian.py hexdump <file> [--type TYPE] [--offset N] [--length N]
+    python endian.py detect <file>
+
+Unlike endianness.c, which handles one value per process launch, the
+engine functions convert entire sequences or buffers in one call:
+
+    data = encode(range(1_000_000), type_map["int32"], "big")
+    values = decode(data, type_map["int32"], "big")
+    little = swap(data, type_map["int32"])
+
+Conversions use `array.byteswap`, or NumPy when it is installed, and
+`decode` returns zero-copy views of the buffer where possible.
 """
 
+import argparse
+import contextlib
+import csv
+import functools
+import io
+import math
+import mmap
+import operator
+import os
+import struct
 import sys
+from array import array
 from collections import namedtuple
+from typing import Callable, Iterable, Iterator, TextIO, Union
 
-NumType = namedtuple("NumType", ("size", "signed"))
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+NumType = namedtuple("NumType", ("size", "signed", "code"))
 
 type_map = {
-    "int8": NumType(1, True),
-    "int16": NumType(2, True),
-    "int32": NumType(3, True),
-    "int64": NumType(4, True),
-    "uint8": NumType(1, False),
-    "uint16": NumType(2, False),
-    "uint32": NumType(3, False),
-    "uint64": NumType(4, False),
+    "int8": NumType(1, True, "b"),
+    "int16": NumType(2, True, "h"),
+    "int32": NumType(4, True, "i"),
+    "int64": NumType(8, True, "q"),
+    "uint8": NumType(1, False, "B"),
+    "uint16": NumType(2, False, "H"),
+    "uint32": NumType(4, False, "I"),
+    "uint64": NumType(8, False, "Q"),
+    "float32": NumType(4, True, "f"),
+    "float64": NumType(8, True, "d"),
 }
 
+BYTE_ORDERS = {"little": "<", "big": ">"}
+
+# number of batch results buffered per write
+BATCH_LINES = 65536
+
+Hypothesis = namedtuple("Hypothesis", ("width", "byteorder", "score", "extension", "magnitude", "monotonic"))
+
+# detect samples this many blocks of this many bytes, spread evenly over the input
+SAMPLE_BLOCKS = 64
+SAMPLE_SIZE = 1 << 16
+
+# detect reports no layout when the best score is below this (random bytes score about 0.02)
+MIN_SCORE = 0.1
+
+# hexdump ASCII column: printable characters kept, everything else shown as "."
+_PRINTABLE = bytes(b if 0x20 <= b < 0x7F else ord(".") for b in range(256))
+
+Number = Union[int, float]
+
+
+# ****************************************************************
+#                       HELPER FUNCTIONS
+# ****************************************************************
+
+def _array_code(numtype: NumType) -> str:
+    """Helper function returning the array typecode with the same kind and size as a NumType."""
+    for code in (numtype.code, "l" if numtype.signed else "L"):
+        if array(code).itemsize == numtype.size:
+            return code
+    raise ValueError(f"no array typecode holds {numtype.size}-byte {numtype.code!r} values")
+
+
+def _byte_order(byteorder: str) -> str:
+    """Helper function validating a byte order name."""
+    if byteorder not in BYTE_ORDERS:
+        raise ValueError(f"byteorder must be 'little' or 'big', not {byteorder!r}")
+    return byteorder
+
+
+def _as_bytes(data) -> memoryview:
+    """Helper function returning a flat unsigned byte view of any buffer."""
+    return memoryview(data).cast("B")
+
+
+def get_numtype(name: str) -> NumType:
+    """Return the NumType for a type name such as "int32" or "float64".
+
+    Raises:
+        ValueError: The name is not in `type_map`.
+    """
+    try:
+        return type_map[name]
+    except KeyError:
+        raise ValueError(
+            f"unknown type {name!r}; available types: {', '.join(type_map)}") from None
+
+
+# ****************************************************************
+#                       SINGLE VALUES
+# ****************************************************************
+
+def process_overflow(num: Number, numtype: NumType) -> Number:
+    """Wrap a number into the range of a type, like a C cast.
+
+    Integers keep their low `8 * size` bits and are reinterpreted as
+    signed or unsigned. Floats are rounded to the precision of the type,
+    and float32 overflow becomes infinity.
+
+    Args:
+        num (Number): The value to wrap.
+        numtype (NumType): The target type.
+
+    Returns:
+        Number: The value as stored in the target type.
+    """
+    size, signed, code = numtype
+    if code in "fd":
+        try:
+            return struct.unpack(code, struct.pack(code, num))[0]
+        except OverflowError:
+            return math.copysign(math.inf, num)
+    bits = 8 * size
+    num = int(num) & ((1 << bits) - 1)
+    if signed and num >> (bits - 1):
+        num -= 1 << bits
+    return num
+
+
+def get_byte_array(num: Number, numtype: NumType, byteorder: str = "little") -> list[int]:
+    """Return the bytes that store a number, in memory order.
+
+    Args:
+        num (Number): The value to store. Integers out of range are wrapped with `process_overflow`.
+        numtype (NumType): The type to store it as.
+        byteorder (str, optional): "little" or "big". Defaults to "little".
+
+    Returns:
+        list[int]: The `numtype.size` byte values.
+    """
+    fmt = BYTE_ORDERS[_byte_order(byteorder)] + numtype.code
+    return list(struct.pack(fmt, process_overflow(num, numtype)))
+
+
+# ****************************************************************
+#                       BULK CONVERSION
+# ****************************************************************
+
+def encode(values: Iterable[Number], numtype: NumType, byteorder: str = "little") -> bytes:
+    """Store a whole sequence of numbers in one byte order in one call.
+
+    Args:
+        values (Iterable[Number]): The values to store. An array of the matching typecode is used as is.
+        numtype (NumType): The type to store them as.
+        byteorder (str, optional): "little" or "big". Defaults to "little".
+
+    Raises:
+        OverflowError: A value is out of range for the type.
+
+    Returns:
+        bytes: The packed values, `numtype.size` bytes each.
+    """
+    code = _array_code(numtype)
+    arr = values if isinstance(values, array) and values.typecode == code else array(code, values)
+    if _byte_order(byteorder) != sys.byteorder and numtype.size > 1:
+        if arr is values:
+            arr = array(code, arr)
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def decode(data, numtype: NumType, byteorder: str = "little"):
+    """Read a buffer of packed numbers in one byte order.
+
+    Native byte order gives a zero-copy memoryview of the buffer. The
+    other byte order gives a zero-copy NumPy array if NumPy is
+    installed, and a byte-swapped array copy otherwise.
+
+    Args:
+        data (Buffer): The packed values, e.g. bytes, bytearray, mmap or array.
+        numtype (NumType): The type of the values.
+        byteorder (str, optional): "little" or "big". Defaults to "little".
+
+    Raises:
+        ValueError: The buffer length is not a multiple of the type size.
+
+    Returns:
+        Sequence[Number]: The values, indexable and iterable.
+    """
+    raw = _as_bytes(data)
+    if len(raw) % numtype.size:
+        raise ValueError(
+            f"buffer length {len(raw)} is not a multiple of {numtype.size}")
+    code = _array_code(numtype)
+    if _byte_order(byteorder) == sys.byteorder or numtype.size == 1:
+        return raw.cast(code)
+    if np is not None:
+        return np.frombuffer(raw, np.dtype(code).newbyteorder("S"))
+    arr = array(code)
+    arr.frombytes(raw)
+    arr.byteswap()
+    return arr
+
+
+def swap(data, numtype: NumType, inplace: bool = False):
+    """Reverse the bytes of every packed value in a buffer, converting between little and big endian.
+
+    Args:
+        data (Buffer): The packed values.
+        numtype (NumType): The type of the values. Only its size matters.
+        inplace (bool, optional): Swap a writable buffer (bytearray, mmap, array, ...) in place and return it. Defaults to False.
+
+    Raises:
+        ValueError: The buffer length is not a multiple of the type size.
+
+    Returns:
+        Buffer: `data` itself if swapped in place, else a new buffer with the swapped bytes.
+    """
+    raw = _as_bytes(data)
+    size = numtype.size
+    if len(raw) % size:
+        raise ValueError(
+            f"buffer length {len(raw)} is not a multiple of {size}")
+    if size == 1:
+        return data if inplace else bytes(raw)
+    if np is not None:
+        values = np.frombuffer(raw, f"u{size}")
+        if inplace:
+            values.byteswap(inplace=True)
+            return data
+        return values.byteswap().data
+    arr = array(_array_code(numtype))
+    arr.frombytes(raw)
+    arr.byteswap()
+    if inplace:
+        raw[:] = _as_bytes(arr)
+        return data
+    return arr
+
+
+# ****************************************************************
+#                       VISUALIZATION
+# ****************************************************************
+
+Formatter = namedtuple("Formatter", ("name", "numtype", "packer", "header", "boundary"))
+
+
+@functools.lru_cache(maxsize=None)
+def get_formatter(name: str) -> Formatter:
+    """Return the cached packing and box-drawing tables for a type name.
+
+    Raises:
+        ValueError: The name is not in `type_map`.
+    """
+    numtype = get_numtype(name)
+    return Formatter(name, numtype, struct.Struct("<" + numtype.code),
+                     f"Type: {name} ({numtype.size} bytes)\n",
+                     "+" + "------+" * numtype.size)
+
+
+def _box_row(data: bytes) -> str:
+    """Helper function returning the row of boxed hexadecimal bytes, formatted in C by `bytes.hex`."""
+    return "| 0x" + data.hex(" ").upper().replace(" ", " | 0x") + " |"
+
+
+def render_boxes(byte_array: list[int]) -> str:
+    """Return a row of boxed hexadecimal bytes, like printBoxes in endianness.c."""
+    boundary = "+" + "------+" * len(byte_array)
+    return f"{boundary}\n{_box_row(bytes(byte_array))}\n{boundary}"
+
+
+def _stored(formatter: Formatter, num: Number) -> tuple[Number, bytes, int]:
+    """Helper function returning a value as stored in a type, its little endian bytes, and its bit pattern."""
+    value = process_overflow(num, formatter.numtype)
+    little = formatter.packer.pack(value)
+    return value, little, int.from_bytes(little, "little")
+
+
+def render(name: str, num: Number) -> str:
+    """Return the full visualization of a value: type, decimal and hexadecimal values, and both byte orders."""
+    formatter = get_formatter(name)
+    value, little, bits = _stored(formatter, num)
+    boundary = formatter.boundary
+    return (f"{formatter.header}"
+            f"Decimal: {value}\n"
+            f"Hexadecimal: 0x{bits:X}\n"
+            f"Little Endian:\n{boundary}\n{_box_row(little)}\n{boundary}\n"
+            f"Big Endian:\n{boundary}\n{_box_row(little[::-1])}\n{boundary}")
+
+
+def record(name: str, num: Number) -> tuple[str, Number, str, str, str]:
+    """Return the compact form of a visualization: type, stored value, and the hexadecimal bits and byte strings."""
+    value, little, bits = _stored(get_formatter(name), num)
+    return name, value, f"0x{bits:X}", little.hex(), little[::-1].hex()
+
+
+def _value_format(numtype: NumType) -> str:
+    """Helper function returning a format spec wide enough for every value of a type."""
+    if numtype.code == "f":
+        return ">15.9g"
+    if numtype.code == "d":
+        return ">24.17g"
+    bits = 8 * numtype.size
+    widest = -(1 << (bits - 1)) if numtype.signed else (1 << bits) - 1
+    return f">{len(str(widest))}"
+
+
+def hexdump_lines(data, name: str, offset: int = 0, length: int = 256, columns: int = 16) -> Iterator[str]:
+    """Yield a hexdump of part of a buffer, with each row also decoded in both byte orders.
+
+    Only the bytes offset:offset+length are read, so `data` can be a
+    memory map of a huge file. The page is decoded with one `decode`
+    call per byte order.
+
+    Args:
+        data (Buffer): The bytes to dump, e.g. an mmap.
+        name (str): The type to decode the rows as.
+        offset (int, optional): Index of the first byte to dump. Negative values count from the end. Defaults to 0.
+        length (int, optional): Number of bytes to dump. Defaults to 256.
+        columns (int, optional): Number of bytes per row. Must be a multiple of the type size. Defaults to 16.
+
+    Raises:
+        ValueError: The type is unknown, the columns do not fit whole values, or the offset is out of range.
+
+    Yields:
+        str: The lines of the dump: per row, the offset, bytes and ASCII, then the little and big endian values.
+    """
+    numtype = get_numtype(name)
+    if columns <= 0 or columns % numtype.size:
+        raise ValueError(f"columns must be a positive multiple of {numtype.size}")
+    total = len(data)
+    if offset < 0:
+        offset += total
+    if not 0 <= offset <= total:
+        raise ValueError(f"offset {offset} is outside the {total}-byte input")
+    page = bytes(data[offset:offset + max(length, 0)])
+    whole = len(page) - len(page) % numtype.size
+    little = decode(page[:whole], numtype, "little").tolist()
+    big = decode(page[:whole], numtype, "big").tolist()
+
+    digits = max(8, len(f"{total:X}"))
+    indent = " " * digits
+    spec = _value_format(numtype)
+    per_row = columns // numtype.size
+    for start in range(0, len(page), columns):
+        chunk = page[start:start + columns]
+        yield (f"{offset + start:0{digits}X}  {chunk.hex(' '):<{3 * columns - 1}}  "
+               f"|{chunk.translate(_PRINTABLE).decode('ascii')}|")
+        first = start // numtype.size
+        count = len(chunk) // numtype.size
+        if count:
+            values = little[first:first + count]
+            yield f"{indent}  le: " + " ".join(format(v, spec) for v in values)
+            values = big[first:first + count]
+            yield f"{indent}  be: " + " ".join(format(v, spec) for v in values)
+
+
+def sample_blocks(data, count: int = SAMPLE_BLOCKS, size: int = SAMPLE_SIZE) -> list[bytes]:
+    """Return blocks spread evenly over a buffer, each starting at a multiple of 8 bytes.
+
+    Only the sampled blocks are read, so `data` can be a memory map of a
+    huge file. A buffer smaller than the whole sample is returned as one
+    block.
+    """
+    total = len(data)
+    if total <= count * size:
+        return [bytes(data[:total - total % 8])]
+    stride = (total - size) // (count - 1) if count > 1 else 0
+    starts = (i * stride - i * stride % 8 for i in range(count))
+    return [bytes(data[start:start + size]) for start in starts]
+
+
+def _layout_stats(block: bytes, width: int, byteorder: str) -> tuple[int, int, int, int, int]:
+    """Helper function returning the statistics of one block read as unsigned integers of one width and byte order.
+
+    Returns:
+        tuple[int, int, int, int, int]: The number of values, the number of 0x00 or 0xFF most significant bytes minus least significant ones, the total bit length of the values, and the numbers of consecutive pairs strictly ascending and strictly descending.
+    """
+    high, low = (width - 1, 0) if byteorder == "little" else (0, width - 1)
+    high_bytes, low_bytes = block[high::width], block[low::width]
+    extension = (high_bytes.count(0) + high_bytes.count(0xFF)
+                 - low_bytes.count(0) - low_bytes.count(0xFF))
+    values = decode(block, type_map[f"uint{8 * width}"], byteorder)
+    n = len(values)
+    top = 8 * width - 1
+    # small negative numbers are small too: measure values with the top bit set by their complement
+    if np is not None:
+        values = np.asarray(values)
+        folded = np.where(values >> top, ~values, values)
+        # frexp gives the bit length of each value as the exponent
+        bits = int(np.minimum(np.frexp(folded.astype(np.float64))[1], top).sum())
+        ascending = int(np.count_nonzero(values[1:] > values[:-1]))
+        descending = int(np.count_nonzero(values[1:] < values[:-1]))
+    else:
+        values = values.tolist()
+        mask = (1 << top) - 1
+        bits = sum(int.bit_length(v if v >> top == 0 else ~v & mask) for v in values)
+        ascending = sum(map(operator.gt, values[1:], values))
+        descending = sum(map(operator.lt, values[1:], values))
+    return n, extension, bits, ascending, descending
+
+
+def score_layouts(blocks: list[bytes], widths: tuple[int, ...] = (2, 4, 8)) -> list[Hypothesis]:
+    """Score every integer width and byte order as the layout of sampled blocks.
+
+    Each hypothesis gets three statistics in [-1, 1] or [0, 1], and
+    their mean as its score. Integers in real data tend to be small
+    for their width and to change gradually, so the right layout has:
+
+    - extension: more sign-extension bytes (0x00 or 0xFF) in the most than in the least significant position
+    - magnitude: values, or negative values in two's complement, using few of their bits
+    - monotonic: consecutive values that differ mostly going up, or mostly going down; equal neighbours are ignored
+
+    Args:
+        blocks (list[bytes]): Samples from `sample_blocks`. Their lengths must be multiples of every width.
+        widths (tuple[int, ...], optional): The integer widths in bytes to try. Defaults to (2, 4, 8).
+
+    Returns:
+        list[Hypothesis]: Every hypothesis, the most likely first.
+    """
+    hypotheses = []
+    for width in widths:
+        for byteorder in BYTE_ORDERS:
+            n = extension = bits = ascending = descending = 0
+            for block in blocks:
+                stats = _layout_stats(block, width, byteorder)
+                n += stats[0]
+                extension += stats[1]
+                bits += stats[2]
+                ascending += stats[3]
+                descending += stats[4]
+            if not n:
+                continue
+            extension /= n
+            magnitude = 1 - bits / ((8 * width - 1) * n)
+            changes = ascending + descending
+            monotonic = abs(ascending - descending) / changes if changes else 0.0
+            score = (extension + magnitude + monotonic) / 3
+            hypotheses.append(Hypothesis(width, byteorder, score, extension, magnitude, monotonic))
+    hypotheses.sort(key=operator.attrgetter("score"), reverse=True)
+    return hypotheses
+
+
+def parse_number(text: str, numtype: NumType) -> Number:
+    """Parse a decimal, hexadecimal (0x), octal (0o) or binary (0b) value, or a float for float types."""
+    if numtype.code in "fd":
+        return float(text)
+    return int(text, 0)
+
+
+# ****************************************************************
+#                       COMMAND LINE
+# ****************************************************************
+
+def show(args: argparse.Namespace) -> int:
+    """Print the visualization of one value."""
+    numtype = get_numtype(args.type)
+    print(render(args.type, parse_number(args.value, numtype)))
+    return 0
+
+
+def run_batch(lines: Iterable[str], out: TextIO, fmt: str = "boxes", errors: TextIO = sys.stderr) -> int:
+    """Visualize every `type value` line of an input.
+
+    Blank lines and lines starting with "#" are skipped. Invalid lines
+    are reported to `errors` and skipped. Results are buffered and
+    written `BATCH_LINES` at a time.
+
+    Args:
+        lines (Iterable[str]): The input lines.
+        out (TextIO): Stream receiving the results.
+        fmt (str, optional): "boxes" for the `show` output separated by blank lines, "csv" for one row per value, or "json" for an array of objects, with null for NaN and infinite values. Defaults to "boxes".
+        errors (TextIO, optional): Stream receiving the error messages. Defaults to stderr.
+
+    Returns:
+        int: The number of invalid lines.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    fields = ("type", "value", "hex", "little", "big")
+    if fmt == "csv":
+        writer.writerow(fields)
+    elif fmt == "json":
+        buffer.write("[")
+    separator = ""
+    pending = 0
+    failures = 0
+    for number, line in enumerate(lines, 1):
+        parts = line.split()
+        if not parts or parts[0].startswith("#"):
+            continue
+        try:
+            if len(parts) != 2:
+                raise ValueError("expected '<type> <value>'")
+            name, text = parts
+            num = parse_number(text, get_formatter(name).numtype)
+            if fmt == "boxes":
+                buffer.write(separator)
+                buffer.write(render(name, num))
+                separator = "\n\n"
+            elif fmt == "csv":
+                writer.writerow(record(name, num))
+            else:
+                buffer.write(separator)
+                name, value, bits, little, big = record(name, num)
+                # JSON has no NaN or infinity; the hex field keeps the exact bits
+                if not isinstance(value, int) and not math.isfinite(value):
+                    value = "null"
+                buffer.write(f'{{"type": "{name}", "value": {value}, "hex": "{bits}", '
+                             f'"little": "{little}", "big": "{big}"}}')
+                separator = ",\n"
+        except ValueError as e:
+            print(f"line {number}: {e}", file=errors)
+            failures += 1
+            continue
+        pending += 1
+        if pending == BATCH_LINES:
+            out.write(buffer.getvalue())
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    if fmt == "json":
+        buffer.write("]\n")
+    elif fmt == "boxes" and separator:
+        buffer.write("\n")
+    out.write(buffer.getvalue())
+    return failures
+
+
+def batch(args: argparse.Namespace) -> int:
+    """Visualize every `type value` line of a file or stdin."""
+    if args.file == "-":
+        failures = run_batch(sys.stdin, sys.stdout, args.format)
+    else:
+        with open(args.file) as file:
+            failures = run_batch(file, sys.stdout, args.format)
+    return 1 if failures else 0
+
+
+def hexdump(args: argparse.Namespace) -> int:
+    """Print one page of a file as a hexdump, memory-mapping the file so only that page is read."""
+    with open(args.file, "rb") as file:
+        # empty files cannot be memory-mapped
+        mapping = (mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                   if os.fstat(file.fileno()).st_size else contextlib.nullcontext(b""))
+        with mapping as data:
+            lines = hexdump_lines(data, args.type, args.offset, args.length, args.columns)
+            sys.stdout.write("".join(line + "\n" for line in lines))
+    return 0
+
+
+def detect(args: argparse.Namespace) -> int:
+    """Guess the integer width and byte order of a file from evenly spaced samples."""
+    with open(args.file, "rb") as file:
+        mapping = (mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                   if os.fstat(file.fileno()).st_size else contextlib.nullcontext(b""))
+        with mapping as data:
+            blocks = sample_blocks(data, args.blocks, args.block_size - args.block_size % 8)
+    hypotheses = score_layouts(blocks)
+    if not hypotheses:
+        raise ValueError(f"{args.file} has fewer than 8 bytes to sample")
+    lines = [f"{'width':>5}  {'order':<6}  {'score':>6}  {'extension':>9}  {'magnitude':>9}  {'monotonic':>9}"]
+    lines.extend(f"{h.width:>5}  {h.byteorder:<6}  {h.score:>6.3f}  {h.extension:>9.3f}  {h.magnitude:>9.3f}  {h.monotonic:>9.3f}"
+                 for h in hypotheses)
+    best, runner_up = hypotheses[0], hypotheses[1]
+    bits = 8 * best.width
+    if best.score < MIN_SCORE:
+        verdict = "Inconclusive: no layout looks like integer data"
+    else:
+        verdict = f"Most likely: {best.width}-byte {best.byteorder} endian integers (int{bits}/uint{bits})"
+        if best.score - runner_up.score < 0.05:
+            verdict += f", but {runner_up.width}-byte {runner_up.byteorder} endian scores almost as high"
+    lines.append(verdict)
+    print("\n".join(lines))
+    return 0
+
+
+def _at_least(minimum: int) -> Callable[[str], int]:
+    """Helper function returning an argparse type converting an integer of at least `minimum`."""
+    def convert(text: str) -> int:
+        value = int(text)
+        if value < minimum:
+            raise argparse.ArgumentTypeError(f"must be at least {minimum}, not {value}")
+        return value
+    convert.__name__ = "int"  # named in argparse's "invalid int value" message
+    return convert
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Return the argument parser with one subcommand per mode."""
+    parser = argparse.ArgumentParser(
+        description="Visualize and convert little and big endian storage.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    show_parser = subparsers.add_parser(
+        "show", help="visualize the storage of a single value")
+    show_parser.add_argument("type", choices=type_map, help="data type")
+    show_parser.add_argument("value", help="value to visualize")
+    show_parser.set_defaults(func=show)
+
+    batch_parser = subparsers.add_parser(
+        "batch", help="visualize `type value` lines from a file or stdin")
+    batch_parser.add_argument("file", nargs="?", default="-",
+                              help="input file (default: stdin)")
+    batch_parser.add_argument("-f", "--format", choices=("boxes", "csv", "json"), default="boxes",
+                              help="output format (default: %(default)s)")
+    batch_parser.set_defaults(func=batch)
 
-def process_overflow(num: int, numtype: NumType) -> int:
-    size, signed = numtype
-    if not signed and num < 0:
-        tmin = -2**(size-1)
-        num %= tmin
-        umax = 2**size
-        num = umax + 1 + num
+    dump_parser = subparsers.add_parser(
+        "hexdump", help="dump a page of a file with rows decoded in both byte orders")
+    dump_parser.add_argument("file", help="file to dump")
+    dump_parser.add_argument("-t", "--type", choices=type_map, default="uint32",
+                             help="type to decode the rows as (default: %(default)s)")
+    dump_parser.add_argument("-o", "--offset", type=functools.partial(int, base=0), default=0,
+                             help="first byte to dump, negative from the end, e.g. 0x1000 (default: 0)")
+    dump_parser.add_argument("-n", "--length", type=functools.partial(int, base=0), default=256,
+                             help="number of bytes to dump (default: %(default)s)")
+    dump_parser.add_argument("-c", "--columns", type=int, default=16,
+                             help="bytes per row (default: %(default)s)")
+    dump_parser.set_defaults(func=hexdump)
 
+    detect_parser = subparsers.add_parser(
+        "detect", help="guess the integer width and byte order of a file")
+    detect_parser.add_argument("file", help="file to analyze")
+    detect_parser.add_argument("--blocks", type=_at_least(1), default=SAMPLE_BLOCKS,
+                               help="number of sampled blocks (default: %(default)s)")
+    detect_parser.add_argument("--block-size", type=_at_least(8), default=SAMPLE_SIZE,
+                               help="bytes per sampled block (default: %(default)s)")
+    detect_parser.set_defaults(func=detect)
 
-def get_byte_array(num: int, numtype: NumType) -> list[int]:
-    size, signed = numtype
+    return parser
 
 
-def main() -> None:
+def main(argv: list[str] = None) -> None:
     """Main driver function."""
-    pass
+    argv = sys.argv[1:] if argv is None else list(argv)
+    parser = build_parser()
+    # keep the original `<type> <value>` usage as a shorthand for show
+    if argv and argv[0] in type_map:
+        argv.insert(0, "show")
+    args = parser.parse_args(argv)
+    try:
+        status = args.func(args)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    sys.exit(status)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+swap_records.py
+18 October 2026 02:18:13
+
+Streaming byte-order converter for large binary files of fixed-size
+records described by a `struct` format string.
+
+Usage:
+    python swap_records.py ">iHq8sd" dump.bin dump_le.bin
+    python swap_records.py ">iHq8sd" dump.bin dump_le.bin --workers 4
+
+Every numeric field wider than one byte has its bytes reversed, so a
+big-endian dump becomes little endian and vice versa. Byte strings,
+padding and single-byte fields are copied unchanged. The input is read
+and the output written sequentially in large blocks of whole records.
+Each block is converted with one NumPy structured-array assignment if
+NumPy is installed, or with one strided slice assignment per byte of
+each field otherwise. With several workers, the file is split on
+record boundaries and each process converts its own range.
+"""
+
+import argparse
+import os
+import re
+import struct
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+Layout = namedtuple("Layout", ("size", "fields"))
+
+# read and write in blocks of about this many bytes
+BLOCK_SIZE = 1 << 22
+
+_TOKEN = re.compile(r"\s*(\d*)([a-zA-Z?])")
+
+
+# ****************************************************************
+#                       SCHEMA
+# ****************************************************************
+
+def parse_schema(schema: str) -> Layout:
+    """Return the record size and the fields to swap for a struct format string.
+
+    The format uses standard sizes and no alignment, as with the "<",
+    ">", "!" and "=" prefixes of the struct module. Which of these the
+    schema starts with does not matter, since swapping is symmetric.
+
+    Args:
+        schema (str): Struct format of one record, e.g. ">iHq8sd".
+
+    Raises:
+        ValueError: The schema is invalid, uses native alignment ("@"), or describes empty records.
+
+    Returns:
+        Layout: The record size in bytes, and the (offset, width) of each field wider than one byte.
+    """
+    body = schema.strip()
+    if body[:1] == "@":
+        raise ValueError("native alignment ('@') is not supported; use '<' or '>'")
+    body = body.lstrip("<>!=")
+    try:
+        size = struct.calcsize("<" + body)
+    except struct.error as e:
+        raise ValueError(f"invalid schema {schema!r}: {e}") from None
+    if not size:
+        raise ValueError(f"schema {schema!r} describes empty records")
+
+    fields = []
+    offset = 0
+    for count, char in _TOKEN.findall(body):
+        count = int(count) if count else 1
+        if char in "sp":
+            offset += count
+            continue
+        width = struct.calcsize("<" + char)
+        if width > 1:
+            fields.extend((offset + i * width, width) for i in range(count))
+        offset += count * width
+    return Layout(size, tuple(fields))
+
+
+def _numpy_dtypes(layout: Layout) -> tuple:
+    """Helper function returning big and little endian structured dtypes over the swapped fields of a record."""
+    names = [f"f{i}" for i in range(len(layout.fields))]
+    offsets = [offset for offset, _ in layout.fields]
+    return tuple(np.dtype({"names": names,
+                           "formats": [f"{order}u{width}" for _, width in layout.fields],
+                           "offsets": offsets,
+                           "itemsize": layout.size})
+                 for order in "><")
+
+
+# ****************************************************************
+#                       CONVERSION
+# ****************************************************************
+
+def swap_records(src, dst, layout: Layout, dtypes: tuple = None) -> None:
+    """Copy whole records from one buffer to another, reversing the bytes of every field.
+
+    Args:
+        src (Buffer): The records to convert. Its length must be a multiple of the record size.
+        dst (Buffer): Writable buffer of the same length receiving the converted records.
+        layout (Layout): The record layout from `parse_schema`.
+        dtypes (tuple, optional): Structured dtypes from `_numpy_dtypes`, to use NumPy. Defaults to None, strided slices.
+    """
+    src = memoryview(src).cast("B")
+    dst = memoryview(dst).cast("B")
+    dst[:] = src
+    if not layout.fields:
+        return
+    if dtypes is not None:
+        big, little = dtypes
+        np.frombuffer(dst, little)[...] = np.frombuffer(src, big)
+        return
+    step = layout.size
+    for offset, width in layout.fields:
+        for j in range(width):
+            dst[offset + j::step] = src[offset + width - 1 - j::step]
+
+
+def _swap_range(layout: Layout, src_path: str, dst_path: str, lo: int, hi: int, block_size: int) -> int:
+    """Worker entry point converting the bytes lo:hi of the input file into the same range of the output file.
+
+    Returns:
+        int: The number of records converted.
+    """
+    dtypes = _numpy_dtypes(layout) if np is not None and layout.fields else None
+    block_size = max(block_size // layout.size, 1) * layout.size
+    src_buffer = bytearray(block_size)
+    dst_buffer = bytearray(block_size)
+    with open(src_path, "rb") as src, open(dst_path, "r+b") as dst:
+        src.seek(lo)
+        dst.seek(lo)
+        position = lo
+        while position < hi:
+            n = src.readinto(memoryview(src_buffer)[:min(block_size, hi - position)])
+            if not n:
+                raise EOFError(f"{src_path} ended at byte {position}, expected {hi}")
+            swap_records(memoryview(src_buffer)[:n], memoryview(dst_buffer)[:n], layout, dtypes)
+            dst.write(memoryview(dst_buffer)[:n])
+            position += n
+    return (hi - lo) // layout.size
+
+
+def swap_file(src_path: str, dst_path: str, schema: str, workers: int = 1, block_size: int = BLOCK_SIZE) -> int:
+    """Convert a whole file of records to the other byte order.
+
+    The output may be the input file itself, converting it in place.
+
+    Args:
+        src_path (str): Path of the input file.
+        dst_path (str): Path of the output file. Created or overwritten.
+        schema (str): Struct format of one record. See `parse_schema`.
+        workers (int, optional): Number of processes, each converting a contiguous range of records. Defaults to 1, no pool.
+        block_size (int, optional): Approximate number of bytes read and written at a time. Defaults to `BLOCK_SIZE`.
+
+    Raises:
+        ValueError: The schema is invalid, or the file size is not a multiple of the record size.
+
+    Returns:
+        int: The number of records converted.
+    """
+    layout = parse_schema(schema)
+    total = os.path.getsize(src_path)
+    if total % layout.size:
+        raise ValueError(
+            f"{src_path} has {total} bytes, not a multiple of the {layout.size}-byte record size")
+    # size the output up front so workers can write their ranges independently
+    with open(dst_path, "ab") as dst:
+        dst.truncate(total)
+
+    records = total // layout.size
+    workers = max(min(workers, records), 1)
+    bounds = [records * i // workers * layout.size for i in range(workers + 1)]
+    if workers == 1:
+        return _swap_range(layout, src_path, dst_path, 0, total, block_size)
+    with ProcessPoolExecutor(workers) as executor:
+        futures = [executor.submit(_swap_range, layout, src_path, dst_path, lo, hi, block_size)
+                   for lo, hi in zip(bounds, bounds[1:])]
+        return sum(future.result() for future in futures)
+
+
+# ****************************************************************
+#                       COMMAND LINE
+# ****************************************************************
+
+def main(argv: list[str] = None) -> None:
+    """Main driver function."""
+    parser = argparse.ArgumentParser(
+        description="Convert a binary file of fixed-size records between big and little endian.")
+    parser.add_argument("schema", help="struct format of one record, e.g. '>iHq8sd'")
+    parser.add_argument("input", help="input file")
+    parser.add_argument("output", help="output file (may be the input file)")
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                        help="number of processes (default: 1)")
+    parser.add_argument("-b", "--block-size", type=int, default=BLOCK_SIZE,
+                        help=f"bytes per read and write (default: {BLOCK_SIZE})")
+    args = parser.parse_args(argv)
+    if args.workers < 1 or args.block_size < 1:
+        parser.error("--workers and --block-size must be positive")
+    try:
+        records = swap_file(args.input, args.output, args.schema, args.workers, args.block_size)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    print(f"Converted {records} records of {parse_schema(args.schema).size} bytes")
+
+
+if __name__ == "__main__":
+    main()
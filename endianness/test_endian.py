@@ -0,0 +1,294 @@
+"""
+test_endian.py
+18 October 2026 02:34:50
+
+Unit test file for endian.py
+"""
+
+import contextlib
+import csv
+import io
+import json
+import math
+import os
+import random
+import struct
+import sys
+import tempfile
+import unittest
+from array import array
+from unittest import mock
+
+import endian
+from endian import (BYTE_ORDERS, decode, encode, get_byte_array, get_numtype,
+                    hexdump_lines, process_overflow, render, run_batch, sample_blocks,
+                    score_layouts, swap, type_map)
+
+
+def run_main(*argv: str) -> tuple[int, str]:
+    """Run the command line with the given arguments and return its exit status and output."""
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(io.StringIO()):
+        try:
+            endian.main(list(argv))
+        except SystemExit as e:
+            return e.code, out.getvalue()
+    return 0, out.getvalue()
+
+
+class TestEndian(unittest.TestCase):
+    """Unit tester class."""
+
+    def setUp(self) -> None:
+        rng = random.Random(4)
+        self.values = {}
+        for name, numtype in type_map.items():
+            if numtype.code in "fd":
+                values = [process_overflow(rng.uniform(-1e6, 1e6), numtype) for _ in range(50)]
+            else:
+                values = [process_overflow(rng.getrandbits(64), numtype) for _ in range(50)]
+            self.values[name] = values
+
+    def test_type_map(self) -> None:
+        for numtype in type_map.values():
+            self.assertEqual(struct.calcsize("<" + numtype.code), numtype.size)
+        self.assertEqual(get_numtype("float32").size, 4)
+        with self.assertRaises(ValueError):
+            get_numtype("int9")
+
+    def test_process_overflow(self) -> None:
+        self.assertEqual(process_overflow(300, type_map["uint8"]), 44)
+        self.assertEqual(process_overflow(-1, type_map["int8"]), -1)
+        self.assertEqual(process_overflow(255, type_map["int8"]), -1)
+        self.assertEqual(process_overflow(-1, type_map["uint64"]), 2**64 - 1)
+        self.assertEqual(process_overflow(2**31, type_map["int32"]), -2**31)
+        self.assertEqual(process_overflow(1e40, type_map["float32"]), math.inf)
+        self.assertEqual(process_overflow(-1e40, type_map["float32"]), -math.inf)
+        self.assertEqual(process_overflow(0.1, type_map["float64"]), 0.1)
+        self.assertNotEqual(process_overflow(0.1, type_map["float32"]), 0.1)
+
+    def test_get_byte_array(self) -> None:
+        self.assertEqual(get_byte_array(309, type_map["int32"]), [0x35, 0x01, 0, 0])
+        self.assertEqual(get_byte_array(309, type_map["int32"], "big"), [0, 0, 0x01, 0x35])
+        self.assertEqual(get_byte_array(300, type_map["uint8"]), [44])
+        self.assertEqual(get_byte_array(-1, type_map["int16"], "big"), [0xFF, 0xFF])
+        self.assertEqual(get_byte_array(1.5, type_map["float32"], "big"), [0x3F, 0xC0, 0, 0])
+        with self.assertRaises(ValueError):
+            get_byte_array(1, type_map["int8"], "middle")
+
+    def check_round_trips(self) -> None:
+        for name, numtype in type_map.items():
+            values = self.values[name]
+            for byteorder, prefix in BYTE_ORDERS.items():
+                data = encode(values, numtype, byteorder)
+                self.assertEqual(data, struct.pack(f"{prefix}{len(values)}{numtype.code}", *values))
+                self.assertEqual(list(decode(data, numtype, byteorder)), values, (name, byteorder))
+                self.assertEqual(list(decode(bytearray(data), numtype, byteorder)), values)
+            little = encode(values, numtype, "little")
+            big = encode(values, numtype, "big")
+            self.assertEqual(bytes(swap(little, numtype)), big, name)
+            buffer = bytearray(big)
+            self.assertIs(swap(buffer, numtype, inplace=True), buffer)
+            self.assertEqual(buffer, little)
+
+    def test_round_trips_numpy(self) -> None:
+        if endian.np is None:
+            self.skipTest("NumPy is not installed")
+        self.check_round_trips()
+        other = "big" if sys.byteorder == "little" else "little"
+        self.assertIsInstance(decode(encode([1, 2], type_map["int32"], other), type_map["int32"], other),
+                              endian.np.ndarray)
+
+    def test_round_trips_fallback(self) -> None:
+        with mock.patch.object(endian, "np", None):
+            self.check_round_trips()
+            other = "big" if sys.byteorder == "little" else "little"
+            self.assertIsInstance(decode(encode([1, 2], type_map["int32"], other), type_map["int32"], other),
+                                  array)
+
+    def test_zero_copy(self) -> None:
+        numtype = type_map["uint16"]
+        buffer = bytearray(encode([1, 2, 3], numtype, sys.byteorder))
+        values = decode(buffer, numtype, sys.byteorder)
+        self.assertIsInstance(values, memoryview)
+        buffer[0:2] = encode([7], numtype, sys.byteorder)
+        self.assertEqual(values[0], 7)
+        source = array("q", [1, 2])
+        self.assertEqual(encode(source, type_map["int64"], "big"), struct.pack(">2q", 1, 2))
+        self.assertEqual(list(source), [1, 2])
+
+    def test_errors(self) -> None:
+        with self.assertRaises(ValueError):
+            decode(b"\0\0\0", type_map["int16"])
+        with self.assertRaises(ValueError):
+            swap(b"\0\0\0", type_map["int32"])
+        with self.assertRaises(OverflowError):
+            encode([300], type_map["uint8"])
+        with self.assertRaises(ValueError):
+            encode([1], type_map["uint8"], "native")
+
+    def test_show(self) -> None:
+        status, out = run_main("int32", "309")
+        self.assertEqual(status, 0)
+        self.assertEqual(out, (
+            "Type: int32 (4 bytes)\n"
+            "Decimal: 309\n"
+            "Hexadecimal: 0x135\n"
+            "Little Endian:\n"
+            "+------+------+------+------+\n"
+            "| 0x35 | 0x01 | 0x00 | 0x00 |\n"
+            "+------+------+------+------+\n"
+            "Big Endian:\n"
+            "+------+------+------+------+\n"
+            "| 0x00 | 0x00 | 0x01 | 0x35 |\n"
+            "+------+------+------+------+\n"))
+        self.assertEqual(run_main("show", "int8", "-1")[1], run_main("int8", "0xff")[1])
+        self.assertIn("Hexadecimal: 0x3FC00000", run_main("float32", "1.5")[1])
+        self.assertEqual(run_main("int16", "abc")[0], 2)
+        self.assertEqual(run_main("int9", "1")[0], 2)
+
+    BATCH = "int32 309\n\n# comment\nuint8 300\nbad 1\nfloat64 nan\nint8\nfloat32 -1e40\n"
+
+    def batch(self, fmt: str) -> tuple[str, str, int]:
+        """Run the batch input in a format and return the output, the errors, and the number of invalid lines."""
+        out, errors = io.StringIO(), io.StringIO()
+        failures = run_batch(io.StringIO(self.BATCH), out, fmt, errors)
+        return out.getvalue(), errors.getvalue(), failures
+
+    def test_batch_boxes(self) -> None:
+        out, errors, failures = self.batch("boxes")
+        self.assertEqual(failures, 2)
+        self.assertEqual(errors.splitlines(), [
+            "line 5: unknown type 'bad'; available types: " + ", ".join(type_map),
+            "line 7: expected '<type> <value>'"])
+        self.assertEqual(out, "\n\n".join((render("int32", 309), render("uint8", 300),
+                                            render("float64", math.nan), render("float32", -1e40))) + "\n")
+
+    def test_batch_csv(self) -> None:
+        out, _, failures = self.batch("csv")
+        self.assertEqual(failures, 2)
+        self.assertEqual(list(csv.reader(io.StringIO(out))), [
+            ["type", "value", "hex", "little", "big"],
+            ["int32", "309", "0x135", "35010000", "00000135"],
+            ["uint8", "44", "0x2C", "2c", "2c"],
+            ["float64", "nan", "0x7FF8000000000000", "000000000000f87f", "7ff8000000000000"],
+            ["float32", "-inf", "0xFF800000", "000080ff", "ff800000"]])
+
+    def test_batch_json(self) -> None:
+        out, _, failures = self.batch("json")
+        self.assertEqual(failures, 2)
+
+        def reject(constant: str) -> None:
+            raise ValueError(f"invalid JSON constant {constant}")
+
+        records = json.loads(out, parse_constant=reject)
+        self.assertEqual([record["value"] for record in records], [309, 44, None, None])
+        self.assertEqual(records[0], {"type": "int32", "value": 309, "hex": "0x135",
+                                      "little": "35010000", "big": "00000135"})
+        self.assertEqual(records[3]["hex"], "0xFF800000")
+        out = io.StringIO()
+        self.assertEqual(run_batch(io.StringIO("# nothing\n"), out, "json"), 0)
+        self.assertEqual(json.loads(out.getvalue()), [])
+
+    def test_batch_command(self) -> None:
+        with mock.patch.object(sys, "stdin", io.StringIO(self.BATCH)):
+            status, out = run_main("batch", "-f", "csv")
+        self.assertEqual(status, 1)
+        self.assertEqual(len(out.splitlines()), 5)
+        with mock.patch.object(sys, "stdin", io.StringIO("int16 -2\n")):
+            status, out = run_main("batch")
+        self.assertEqual((status, out), (0, render("int16", -2) + "\n"))
+        self.assertEqual(run_main("batch", "missing-file.txt")[0], 2)
+
+    DUMP = b"ABCD" + struct.pack(">ii", 309, -1) + b"xyz"
+
+    def test_hexdump(self) -> None:
+        lines = list(hexdump_lines(self.DUMP, "int32", columns=8))
+        self.assertEqual(lines, [
+            "00000000  41 42 43 44 00 00 01 35  |ABCD...5|",
+            "          le:  1145258561   889257984",
+            "          be:  1094861636         309",
+            "00000008  ff ff ff ff 78 79 7a     |....xyz|",
+            "          le:          -1",
+            "          be:          -1"])
+        self.assertEqual(list(hexdump_lines(self.DUMP, "uint16", -3)),
+                         ["0000000C  78 79 7a                                         |xyz|",
+                          "          le: 31096",
+                          "          be: 30841"])
+        self.assertEqual(list(hexdump_lines(self.DUMP, "int8", 4, 2)),
+                         ["00000004  00 00                                            |..|",
+                          "          le:    0    0",
+                          "          be:    0    0"])
+        self.assertEqual(list(hexdump_lines(self.DUMP, "int8", len(self.DUMP))), [])
+
+    def test_hexdump_errors(self) -> None:
+        with self.assertRaises(ValueError):
+            list(hexdump_lines(self.DUMP, "int32", columns=6))
+        with self.assertRaises(ValueError):
+            list(hexdump_lines(self.DUMP, "int32", columns=0))
+        with self.assertRaises(ValueError):
+            list(hexdump_lines(self.DUMP, "int32", len(self.DUMP) + 1))
+        with self.assertRaises(ValueError):
+            list(hexdump_lines(self.DUMP, "int32", -len(self.DUMP) - 1))
+
+    def test_hexdump_command(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "dump.bin")
+            with open(path, "wb") as file:
+                file.write(self.DUMP)
+            status, out = run_main("hexdump", path, "-t", "int32", "-c", "8", "-o", "0x8")
+            self.assertEqual(status, 0)
+            self.assertEqual(out.splitlines()[0], "00000008  ff ff ff ff 78 79 7a     |....xyz|")
+            empty = os.path.join(directory, "empty.bin")
+            open(empty, "wb").close()
+            self.assertEqual(run_main("hexdump", empty), (0, ""))
+            self.assertEqual(run_main("hexdump", empty, "-o", "1")[0], 2)
+
+    def check_detect(self) -> None:
+        rng = random.Random(2)
+        cases = {
+            (8, "little"): struct.pack("<4000q", *(rng.randrange(-2500, 2501) for _ in range(4000))),
+            (4, "big"): struct.pack(">8000I", *sorted(rng.randrange(10**6) for _ in range(8000))),
+            (2, "big"): struct.pack(">16000h", *(rng.randrange(-3000, 3000) for _ in range(16000))),
+        }
+        for (width, byteorder), data in cases.items():
+            best = score_layouts(sample_blocks(data, 4, 4096))[0]
+            self.assertEqual((best.width, best.byteorder), (width, byteorder))
+        self.assertLess(score_layouts(sample_blocks(rng.randbytes(1 << 16)))[0].score, endian.MIN_SCORE)
+
+    def test_detect_numpy(self) -> None:
+        if endian.np is None:
+            self.skipTest("NumPy is not installed")
+        self.check_detect()
+
+    def test_detect_fallback(self) -> None:
+        with mock.patch.object(endian, "np", None):
+            self.check_detect()
+
+    def test_sample_blocks(self) -> None:
+        data = bytes(range(256)) * 64
+        self.assertEqual(sample_blocks(data[:21]), [data[:16]])
+        blocks = sample_blocks(data, 3, 1024)
+        self.assertEqual(blocks, [data[:1024], data[7680:8704], data[15360:]])
+
+    def test_detect_command(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "blob.bin")
+            with open(path, "wb") as file:
+                file.write(struct.pack(">4000i", *range(0, 40000, 10)))
+            status, out = run_main("detect", path)
+            self.assertEqual(status, 0)
+            self.assertEqual(out.splitlines()[-1], "Most likely: 4-byte big endian integers (int32/uint32)")
+            with open(path, "wb") as file:
+                file.write(random.Random(1).randbytes(1 << 16))
+            self.assertTrue(run_main("detect", path)[1].startswith("width"))
+            self.assertIn("Inconclusive", run_main("detect", path)[1])
+            for args in (("--blocks", "0"), ("--block-size", "7")):
+                self.assertEqual(run_main("detect", path, *args)[0], 2)
+            with open(path, "wb") as file:
+                file.write(b"1234567")
+            self.assertEqual(run_main("detect", path)[0], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
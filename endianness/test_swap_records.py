@@ -0,0 +1,90 @@
+"""
+test_swap_records.py
+18 October 2026 02:35:09
+
+Unit test file for swap_records.py
+"""
+
+import os
+import random
+import struct
+import tempfile
+import unittest
+from unittest import mock
+
+import swap_records
+from swap_records import Layout, parse_schema, swap_file
+
+
+class TestSwapRecords(unittest.TestCase):
+    """Unit tester class."""
+
+    SCHEMA = ">iHq8sdx3e?"
+
+    def setUp(self) -> None:
+        rng = random.Random(9)
+        self.dir = tempfile.TemporaryDirectory()
+        self.src = os.path.join(self.dir.name, "in.bin")
+        self.dst = os.path.join(self.dir.name, "out.bin")
+        self.records = [(rng.randrange(-2**31, 2**31), rng.randrange(2**16), rng.randrange(-2**63, 2**63),
+                         rng.randbytes(8), rng.uniform(-1e9, 1e9),
+                         rng.uniform(-100, 100), rng.uniform(-100, 100), rng.uniform(-100, 100),
+                         rng.random() < 0.5)
+                        for _ in range(1001)]
+        self.big = b"".join(struct.pack(self.SCHEMA, *record) for record in self.records)
+        # repacking through struct gives the exact expected output
+        body = self.SCHEMA[1:]
+        self.little = b"".join(struct.pack("<" + body, *values)
+                               for values in struct.iter_unpack(self.SCHEMA, self.big))
+        with open(self.src, "wb") as file:
+            file.write(self.big)
+
+    def tearDown(self) -> None:
+        self.dir.cleanup()
+
+    def read(self, path: str) -> bytes:
+        with open(path, "rb") as file:
+            return file.read()
+
+    def test_parse_schema(self) -> None:
+        self.assertEqual(parse_schema(self.SCHEMA),
+                         Layout(38, ((0, 4), (4, 2), (6, 8), (22, 8), (31, 2), (33, 2), (35, 2))))
+        self.assertEqual(parse_schema("<2h c"), Layout(5, ((0, 2), (2, 2))))
+        self.assertEqual(parse_schema("16s"), Layout(16, ()))
+        for schema in ("@i", "", ">", "3z", "0q"):
+            with self.assertRaises(ValueError, msg=schema):
+                parse_schema(schema)
+
+    def check_conversions(self) -> None:
+        for workers in (1, 3):
+            for block_size in (1, 100, 1 << 20):
+                self.assertEqual(swap_file(self.src, self.dst, self.SCHEMA, workers, block_size), 1001)
+                self.assertEqual(self.read(self.dst), self.little, (workers, block_size))
+        # swapping back in place restores the input
+        self.assertEqual(swap_file(self.dst, self.dst, "<" + self.SCHEMA[1:], 2, 1000), 1001)
+        self.assertEqual(self.read(self.dst), self.big)
+
+    def test_numpy(self) -> None:
+        if swap_records.np is None:
+            self.skipTest("NumPy is not installed")
+        self.check_conversions()
+
+    def test_fallback(self) -> None:
+        with mock.patch.object(swap_records, "np", None):
+            self.check_conversions()
+
+    def test_file_errors(self) -> None:
+        with open(self.src, "ab") as file:
+            file.write(b"\0")
+        with self.assertRaises(ValueError):
+            swap_file(self.src, self.dst, self.SCHEMA)
+        with self.assertRaises(ValueError):
+            swap_file(self.src, self.dst, "@i")
+        empty = os.path.join(self.dir.name, "empty.bin")
+        open(empty, "wb").close()
+        self.assertEqual(swap_file(empty, self.dst, ">i", 4), 0)
+        self.assertEqual(self.read(self.dst), b"")
+
+
+if __name__ == "__main__":
+    unittest.main()